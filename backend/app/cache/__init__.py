@@ -0,0 +1 @@
+# Process-local caches
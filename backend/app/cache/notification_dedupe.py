@@ -0,0 +1,41 @@
+"""
+Dedupe gate for notifications, keyed by a hash of the full payload.
+
+A retried webhook or a double-tapped status change fires the same event twice;
+the second identical notification within the window is dropped before the
+insert and the push. Process-local: each worker keeps its own window.
+"""
+import hashlib
+import json
+import threading
+from typing import Any, Dict, Optional
+
+from cachetools import TTLCache
+
+_DEDUPE_TTL_SECONDS = 2 * 60 * 60
+
+_seen: TTLCache = TTLCache(maxsize=50_000, ttl=_DEDUPE_TTL_SECONDS)
+_lock = threading.Lock()
+
+
+def notification_key(
+    user_id: str, notification_type: str, title: str, body: str, data: Optional[Dict[str, Any]]
+) -> str:
+    payload = json.dumps(data or {}, sort_keys=True, default=str)
+    digest = hashlib.md5(f"{user_id}|{notification_type}|{title}|{body}|{payload}".encode()).hexdigest()
+    return f"notif:{digest}"
+
+
+def claim_notification(key: str) -> bool:
+    """Set-if-absent: True the first time a key is seen within the TTL, False for repeats."""
+    with _lock:
+        if key in _seen:
+            return False
+        _seen[key] = True
+        return True
+
+
+def release_notification(key: str) -> None:
+    """Forget a claimed key, e.g. when the insert it guarded failed, so a retry can go through."""
+    with _lock:
+        _seen.pop(key, None)
@@ -0,0 +1,31 @@
+"""
+Short-lived cache of users rows, keyed by user id.
+
+GET /api/auth/me and /login read the caller's profile on every hit; within the
+TTL repeated reads skip the Supabase round trip. Every write to a users row
+calls invalidate_user_profile() so edits show up on the next read.
+"""
+import threading
+from typing import Any, Dict, Optional
+
+from cachetools import TTLCache
+
+_PROFILE_CACHE_TTL_SECONDS = 30
+
+profile_cache: TTLCache = TTLCache(maxsize=10_000, ttl=_PROFILE_CACHE_TTL_SECONDS)
+_lock = threading.Lock()
+
+
+def get_cached_profile(user_id: str) -> Optional[Dict[str, Any]]:
+    with _lock:
+        return profile_cache.get(str(user_id))
+
+
+def set_cached_profile(user_id: str, profile: Dict[str, Any]) -> None:
+    with _lock:
+        profile_cache[str(user_id)] = profile
+
+
+def invalidate_user_profile(user_id: str) -> None:
+    with _lock:
+        profile_cache.pop(str(user_id), None)
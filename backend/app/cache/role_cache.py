@@ -0,0 +1,39 @@
+"""
+Process-local LRU + TTL cache of users.role, keyed by user id.
+
+Roles practically never change, so dashboard endpoints read them through this
+cache instead of querying users on every request. Call invalidate_user_role()
+wherever a user's role is written.
+"""
+import threading
+from typing import Optional
+
+from cachetools import TTLCache
+
+from app.loaders.role_loader import role_loader
+
+_ROLE_CACHE_TTL_SECONDS = 300
+
+role_cache: TTLCache = TTLCache(maxsize=10_000, ttl=_ROLE_CACHE_TTL_SECONDS)
+_lock = threading.Lock()
+
+
+async def get_user_role(user_id: str) -> Optional[str]:
+    """users.role for user_id, from cache when fresh. Missing users are not cached; errors propagate."""
+    uid = str(user_id)
+    with _lock:
+        role = role_cache.get(uid)
+    if role is not None:
+        return role
+
+    # Misses from concurrent requests are coalesced into one users query
+    role = await role_loader.load(uid)
+    if role:
+        with _lock:
+            role_cache[uid] = role
+    return role
+
+
+def invalidate_user_role(user_id: str) -> None:
+    with _lock:
+        role_cache.pop(str(user_id), None)
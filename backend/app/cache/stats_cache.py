@@ -0,0 +1,40 @@
+"""
+Short-lived cache of serialised GET /api/dashboard/stats bodies, keyed by user id.
+
+Dashboards poll stats every few seconds; within the TTL repeated polls are served
+without any Supabase I/O. Every write that moves a counted row (bookings,
+payments, video_call_requests status, chat_sessions enablement) calls
+invalidate_dashboard_stats() for both participants so a change shows up on the
+next poll rather than after the TTL.
+"""
+import threading
+from typing import Optional
+
+from cachetools import TTLCache
+
+_STATS_CACHE_TTL_SECONDS = 20
+
+stats_cache: TTLCache = TTLCache(maxsize=5000, ttl=_STATS_CACHE_TTL_SECONDS)
+_lock = threading.Lock()
+
+
+def _key(user_id) -> str:
+    return f"stats:{user_id}"
+
+
+def get_cached_stats(user_id: str) -> Optional[bytes]:
+    with _lock:
+        return stats_cache.get(_key(user_id))
+
+
+def set_cached_stats(user_id: str, body: bytes) -> None:
+    with _lock:
+        stats_cache[_key(user_id)] = body
+
+
+def invalidate_dashboard_stats(*user_ids) -> None:
+    """Drop cached stats for each given user; None/empty ids are ignored."""
+    with _lock:
+        for uid in user_ids:
+            if uid:
+                stats_cache.pop(_key(uid), None)
@@ -1,5 +1,6 @@
 from pydantic_settings import BaseSettings
-from pydantic import field_validator
+from pydantic import computed_field, field_validator
+from functools import cached_property, lru_cache
 from typing import List, Optional
 import os
 
@@ -63,16 +64,45 @@ class Settings(BaseSettings):
     # Security Configuration
     SECRET_KEY: str = "default-secret-key-please-change"
 
+    # Rate limiting storage (slowapi/limits URI): memory:// or redis://host:6379/0
+    RATE_LIMIT_STORAGE_URI: str = "memory://"
+
     # Backend Feature Kill Switches
     ENABLE_TWILIO: bool = True
     ENABLE_RAZORPAY: bool = True
     ENABLE_PUSH_NOTIFICATIONS: bool = True
     
+    # Derived from SUPABASE_URL once per Settings instance, not on every connection
+    @computed_field
+    @cached_property
+    def project_ref(self) -> str:
+        return self.SUPABASE_URL.replace("https://", "").replace("http://", "").split(".")[0]
+
+    @computed_field
+    @cached_property
+    def db_host(self) -> str:
+        return f"db.{self.project_ref}.supabase.co"
+
+    @computed_field
+    @cached_property
+    def cors_origins_list(self) -> List[str]:
+        """CORS_ORIGINS ("*" or comma-separated) as the list CORSMiddleware expects."""
+        if self.CORS_ORIGINS.strip() == "*":
+            return ["*"]
+        return [origin.strip() for origin in self.CORS_ORIGINS.split(",")]
+
     class Config:
         env_file = _ENV_FILE
         case_sensitive = True
         extra = "ignore"  # Allow extra fields in .env file
+        frozen = True  # Read-only after load; get_settings() hands the same instance to everyone
+
+
+@lru_cache
+def get_settings() -> Settings:
+    """The process-wide Settings; use as a FastAPI dependency or call directly."""
+    return Settings()
 
 
-settings = Settings()
+settings = get_settings()
 
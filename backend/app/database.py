@@ -1,12 +1,33 @@
-from supabase import create_client, Client
+import httpx
+from supabase import create_client, Client, ClientOptions
 from app.config import settings
 
+# One keep-alive connection pool shared by both clients (PostgREST, auth and storage
+# calls). Builders pass absolute URLs and per-client headers on every request, so the
+# pool itself carries no base URL or key. Bounded so concurrent dashboard fan-out
+# reuses warm connections instead of opening new ones, with short connect/read
+# timeouts instead of the 120 s client default; retries=1 only retries failed connects.
+# Idle connections are kept 30 s so bursts of login/refresh/register traffic skip the TLS handshake.
+http_client = httpx.Client(
+    transport=httpx.HTTPTransport(
+        retries=1,
+        http2=True,
+        limits=httpx.Limits(max_connections=100, max_keepalive_connections=50, keepalive_expiry=30.0),
+    ),
+    timeout=httpx.Timeout(10.0, connect=2.0, write=30.0),
+    follow_redirects=True,
+)
+
 # Supabase client for user requests (uses anon key - respects RLS policies)
-supabase: Client = create_client(settings.SUPABASE_URL, settings.SUPABASE_ANON_KEY)
+supabase: Client = create_client(
+    settings.SUPABASE_URL,
+    settings.SUPABASE_ANON_KEY,
+    options=ClientOptions(httpx_client=http_client),
+)
 
 # Supabase admin client for server-side operations (uses service role key - bypasses RLS)
 supabase_admin: Client = create_client(
     settings.SUPABASE_URL, 
-    settings.SUPABASE_SERVICE_ROLE_KEY
+    settings.SUPABASE_SERVICE_ROLE_KEY,
+    options=ClientOptions(httpx_client=http_client),
 )
-
@@ -1,4 +1,5 @@
 import sys
+import traceback
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from supabase import Client
@@ -7,6 +8,9 @@ from typing import Optional, Union, Any
 
 from jose import jwt, JWTError
 from app.config import settings
+from app.error_handler import AuthenticationError
+from app.cache.role_cache import invalidate_user_role
+from app.cache.profile_cache import invalidate_user_profile
 security = HTTPBearer()
 
 
@@ -44,7 +48,6 @@ async def get_current_user(
         except Exception as auth_error:
             error_str = str(auth_error)
             sys.stderr.write(f"[AUTH] supabase.auth.get_user failed: {type(auth_error).__name__}: {error_str}\n")
-            import traceback
             traceback.print_exc(file=sys.stderr)
             sys.stderr.flush()
             # Check if token is expired
@@ -76,13 +79,11 @@ async def get_current_user(
                      detail = "Authentication failed: Token is expired or invalid. Please log in again."
                  else:
                      detail = f"Authentication failed: {error_str}"
-                 from app.error_handler import AuthenticationError
                  raise AuthenticationError(detail)
 
         
         user = response.user if hasattr(response, 'user') else response
         if not user:
-            from app.error_handler import AuthenticationError
             raise AuthenticationError("Invalid authentication credentials: user not found")
         
         # Convert user object to dict if needed
@@ -118,7 +119,6 @@ async def get_current_user(
     except HTTPException:
         raise
     except Exception as e:
-        import traceback
         error_msg = str(e)
         sys.stderr.write(f"[ERROR] Error in get_current_user: {error_msg}\n")
         sys.stderr.write(f"[ERROR] Traceback: {traceback.format_exc()}\n")
@@ -171,7 +171,6 @@ async def verify_care_recipient(current_user: dict = Depends(get_current_user))
     directly in Supabase auth but not in our `users` table), we auto-provision
     a minimal profile so that the flow does not break with a 500 error.
     """
-    import sys
     sys.stderr.write(f"[VERIFY_CR] verify_care_recipient called\n")
     sys.stderr.flush()
     user_id = get_user_id(current_user)
@@ -244,6 +243,8 @@ async def verify_care_recipient(current_user: dict = Depends(get_current_user))
             sys.stderr.flush()
             try:
                 upd = supabase_admin.table("users").update({"role": "care_recipient"}).eq("id", user_id).execute()
+                invalidate_user_role(user_id)
+                invalidate_user_profile(user_id)
                 sys.stderr.write(f"[VERIFY_CR] Successfully updated user role to 'care_recipient'\n")
                 sys.stderr.flush()
                 data = {"role": "care_recipient"}
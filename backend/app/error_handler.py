@@ -5,6 +5,7 @@ Provides custom exceptions, error responses, and logging utilities
 from fastapi import HTTPException, Request, status
 from fastapi.responses import JSONResponse
 from fastapi.exceptions import RequestValidationError
+from app.responses import ORJSONResponse
 from typing import Optional, Dict, Any
 import traceback
 import sys
@@ -141,6 +142,11 @@ class ConfigurationError(AppError):
         )
 
 
+def _request_id(request: Request) -> str:
+    """The ID log_requests assigned to this request, so handler logs line up with access logs."""
+    return getattr(request.state, "request_id", None) or str(uuid.uuid4())
+
+
 def create_error_response(
     request_id: str,
     error: Exception,
@@ -228,11 +234,11 @@ def log_error(
 
 async def app_error_handler(request: Request, exc: AppError) -> JSONResponse:
     """Handler for custom AppError exceptions"""
-    request_id = str(uuid.uuid4())
+    request_id = _request_id(request)
     log_error(request_id, exc, request)
     
     response = create_error_response(request_id, exc)
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=exc.status_code,
         content=response
     )
@@ -240,11 +246,11 @@ async def app_error_handler(request: Request, exc: AppError) -> JSONResponse:
 
 async def http_exception_handler(request: Request, exc: HTTPException) -> JSONResponse:
     """Handler for FastAPI HTTPException"""
-    request_id = str(uuid.uuid4())
+    request_id = _request_id(request)
     log_error(request_id, exc, request)
     
     response = create_error_response(request_id, exc)
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=exc.status_code,
         content=response
     )
@@ -252,7 +258,7 @@ async def http_exception_handler(request: Request, exc: HTTPException) -> JSONRe
 
 async def validation_exception_handler(request: Request, exc: RequestValidationError) -> JSONResponse:
     """Handler for request validation errors"""
-    request_id = str(uuid.uuid4())
+    request_id = _request_id(request)
     
     # Extract validation errors
     errors = []
@@ -277,7 +283,7 @@ async def validation_exception_handler(request: Request, exc: RequestValidationE
     sys.stderr.write(f"[VALIDATION_ERROR] {request_id}: {errors}\n")
     sys.stderr.flush()
     
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
         content=response
     )
@@ -285,7 +291,7 @@ async def validation_exception_handler(request: Request, exc: RequestValidationE
 
 async def generic_exception_handler(request: Request, exc: Exception) -> JSONResponse:
     """Handler for unhandled exceptions"""
-    request_id = str(uuid.uuid4())
+    request_id = _request_id(request)
     log_error(request_id, exc, request)
     
     # Don't expose internal error details in production
@@ -299,7 +305,7 @@ async def generic_exception_handler(request: Request, exc: Exception) -> JSONRes
         }
     }
     
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
         content=response
     )
@@ -1,5 +1,14 @@
 from slowapi import Limiter
 from slowapi.util import get_remote_address
 
-# Initialize limiter with remote address as key
-limiter = Limiter(key_func=get_remote_address)
+from app.config import settings
+
+# Initialize limiter with remote address as key.
+# The default in-process store is per worker and resets on restart; point RATE_LIMIT_STORAGE_URI
+# at Redis (e.g. redis://host:6379/0, needs the redis package) to share counters across workers.
+# moving-window counts the trailing minute, so there's no burst at fixed-window boundaries.
+limiter = Limiter(
+    key_func=get_remote_address,
+    storage_uri=settings.RATE_LIMIT_STORAGE_URI,
+    strategy="moving-window",
+)
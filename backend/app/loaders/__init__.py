@@ -0,0 +1 @@
+# Request-coalescing batch loaders
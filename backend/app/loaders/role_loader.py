@@ -0,0 +1,61 @@
+"""
+DataLoader-style batching for users.role lookups.
+
+Role lookups issued by concurrent requests within a few milliseconds of each other
+are coalesced into one `users?id=in.(...)` query instead of one query per user.
+Sits behind app.cache.role_cache: only cache misses reach the loader.
+"""
+import asyncio
+from typing import Dict, List, Optional
+
+from app.database import supabase_admin
+
+_BATCH_WINDOW_SECONDS = 0.005
+
+
+class RoleLoader:
+    def __init__(self, batch_window: float = _BATCH_WINDOW_SECONDS):
+        self._batch_window = batch_window
+        self._pending: Dict[str, List[asyncio.Future]] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._dispatch_task: Optional[asyncio.Task] = None
+
+    async def load(self, user_id: str) -> Optional[str]:
+        """users.role for user_id (None if no such user). Query errors propagate to every waiter."""
+        uid = str(user_id)
+        loop = asyncio.get_running_loop()
+        if self._pending and self._loop is not loop:
+            # A batch is being collected on another event loop; don't mix futures across loops
+            roles = await asyncio.to_thread(self._fetch, [uid])
+            return roles.get(uid)
+
+        fut = loop.create_future()
+        if not self._pending:
+            self._loop = loop
+            self._dispatch_task = loop.create_task(self._dispatch())
+        self._pending.setdefault(uid, []).append(fut)
+        return await fut
+
+    async def _dispatch(self) -> None:
+        await asyncio.sleep(self._batch_window)
+        batch, self._pending = self._pending, {}
+        try:
+            roles = await asyncio.to_thread(self._fetch, list(batch))
+        except Exception as e:
+            for futures in batch.values():
+                for fut in futures:
+                    if not fut.done():
+                        fut.set_exception(e)
+            return
+        for uid, futures in batch.items():
+            for fut in futures:
+                if not fut.done():
+                    fut.set_result(roles.get(uid))
+
+    @staticmethod
+    def _fetch(user_ids: List[str]) -> Dict[str, Optional[str]]:
+        res = supabase_admin.table("users").select("id, role").in_("id", user_ids).execute()
+        return {str(r["id"]): r.get("role") for r in (res.data or [])}
+
+
+role_loader = RoleLoader()
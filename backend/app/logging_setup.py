@@ -0,0 +1,42 @@
+"""
+Non-blocking logging for the API process.
+
+Request handlers only enqueue log records (QueueHandler); a background
+QueueListener thread does the actual stderr write, so a slow or contended
+stderr never stalls a request.
+"""
+import logging
+import queue
+import sys
+from logging.handlers import QueueHandler, QueueListener
+from typing import Optional
+
+_listener: Optional[QueueListener] = None
+
+
+def setup_logging(level: int = logging.INFO) -> None:
+    """Route the root logger through a queue. Safe to call more than once."""
+    global _listener
+    if _listener is not None:
+        return
+
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    stream_handler = logging.StreamHandler(sys.stderr)
+    stream_handler.setFormatter(logging.Formatter("%(levelname)s [%(name)s] %(message)s"))
+
+    _listener = QueueListener(log_queue, stream_handler, respect_handler_level=True)
+    _listener.start()
+
+    root = logging.getLogger()
+    root.addHandler(QueueHandler(log_queue))
+    root.setLevel(level)
+    # supabase-py goes through httpx, which logs every HTTP call at INFO
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+
+
+def shutdown_logging() -> None:
+    """Flush queued records and stop the listener thread."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
@@ -2,8 +2,7 @@ from fastapi import FastAPI, HTTPException, status, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 from fastapi.exceptions import RequestValidationError, ResponseValidationError
-from app.routers import auth, users, caregivers, bookings, location, dashboard, chat, notifications, payments, google_auth, emergency, communications, reviews
-from app.config import settings
+from app.config import get_settings
 from app.error_handler import (
     AppError,
     app_error_handler,
@@ -15,81 +14,94 @@ from slowapi import _rate_limit_exceeded_handler
 from slowapi.errors import RateLimitExceeded
 from slowapi.middleware import SlowAPIMiddleware
 from app.limiter import limiter
-from src.config.db import DatabaseConnectionError
+from app.logging_setup import setup_logging, shutdown_logging
+from app.database import http_client
+from app.services.notifications import close_expo_client, init_firebase
+from app.responses import ORJSONResponse
+from src.config.db import DatabaseConnectionError, close_all_connections, ping_database
+import asyncio
+import importlib
+import itertools
+import logging
+import os
+import secrets
 import time
-import traceback
-import uuid
-import sys
+from typing import Optional
+from urllib.parse import urlsplit
+
+setup_logging()
+settings = get_settings()
 
 app = FastAPI(
     title="AssistLink Backend API",
     description="Backend API for AssistLink - Connecting care recipients with caregivers",
-    version="1.0.0"
+    version="1.0.0",
+    # orjson for every JSON body (lists of joined rows on bookings, chat, notifications...)
+    default_response_class=ORJSONResponse,
 )
 
-# Add request logging middleware with request ID tracking - MUST be before CORS middleware
-@app.middleware("http")
-async def log_requests(request: Request, call_next):
-    # Generate unique request ID for tracking
-    request_id = str(uuid.uuid4())
-    request.state.request_id = request_id
-    
-    start_time = time.time()
-    path_str = str(request.url.path)
-    url_str = str(request.url)
-    
-    # Log ALL requests with request ID
-    sys.stderr.write(f"[{request_id}] {request.method} {path_str}\n")
-    sys.stderr.flush()
-    
-    # Log all requests to payment endpoints with more detail
-    if "/api/payments" in path_str or "/api/payments" in url_str:
-        sys.stderr.write(f"[{request_id}] ===== PAYMENT REQUEST =====\n")
-        sys.stderr.write(f"[{request_id}] Method: {request.method}\n")
-        sys.stderr.write(f"[{request_id}] Full URL: {url_str}\n")
-        auth_header = request.headers.get("authorization") or request.headers.get("Authorization")
-        sys.stderr.write(f"[{request_id}] Auth: {'Present' if auth_header else 'Missing'}\n")
-        sys.stderr.flush()
-    
-    try:
+access_logger = logging.getLogger("assistlink.access")
+
+# Request IDs are only for log/response correlation: a random per-process prefix plus a
+# counter is unique enough and avoids a uuid4 (urandom read + formatting) per request
+_request_id_prefix = secrets.token_hex(4)
+_request_counter = itertools.count(1)
+
+
+def _reset_request_ids() -> None:
+    """Forked workers (e.g. gunicorn --preload) get their own prefix and counter."""
+    global _request_id_prefix, _request_counter
+    _request_id_prefix = secrets.token_hex(4)
+    _request_counter = itertools.count(1)
+
+
+os.register_at_fork(after_in_child=_reset_request_ids)
+
+# Liveness/readiness probes hit these many times a minute; they skip request logging
+_SILENT_PATHS = frozenset({"/", "/health", "/health/db", "/health/db/env"})
+
+def _make_log_requests(_log=access_logger.info, _now=time.perf_counter_ns, _silent=_SILENT_PATHS):
+    """Build the request-logging middleware with its per-request helpers bound as fast locals.
+    The request-ID prefix/counter stay module globals because they are reset after fork."""
+
+    async def log_requests(request: Request, call_next):
+        path_str = request.url.path
+        if path_str in _silent:
+            return await call_next(request)
+
+        # Generate unique request ID for tracking
+        request_id = f"{_request_id_prefix}-{next(_request_counter):x}"
+        request.state.request_id = request_id
+        
+        start_ns = _now()
+        
+        # Log ALL requests with request ID
+        _log("[%s] %s %s", request_id, request.method, path_str)
+        
+        # Exceptions are not caught here: HTTPException / validation errors are turned into responses
+        # by their registered handlers before reaching this point, and anything else propagates to
+        # generic_exception_handler, which logs it under this request ID.
         response = await call_next(request)
-        process_time = time.time() - start_time
+        elapsed_ms = (_now() - start_ns) // 1_000_000
         
         # Add request ID to response headers for client-side debugging
         response.headers["X-Request-ID"] = request_id
         
         # Log completion with time for ALL requests
-        sys.stderr.write(f"[{request_id}] DONE {response.status_code} in {process_time:.3f}s\n")
-        sys.stderr.flush()
+        _log("[%s] DONE %d in %dms", request_id, response.status_code, elapsed_ms)
         
         return response
-    except HTTPException as http_exc:
-        process_time = time.time() - start_time
-        sys.stderr.write(f"[{request_id}] HTTPException: {http_exc.status_code} - {http_exc.detail} after {process_time:.3f}s\n")
-        sys.stderr.flush()
-        raise
-    except ResponseValidationError as validation_exc:
-        process_time = time.time() - start_time
-        sys.stderr.write(f"[{request_id}] Response Validation Error after {process_time:.3f}s\n")
-        for error in validation_exc.errors():
-            sys.stderr.write(f"[{request_id}] Validation error: {error}\n")
-        sys.stderr.flush()
-        # Return 500 Internal Server Error but don't expose strict schema details to client
-        return JSONResponse(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            content={"detail": "Internal Server Error: Response validation failed"}
-        )
-    except Exception as e:
-        process_time = time.time() - start_time
-        sys.stderr.write(f"[{request_id}] ERROR: {type(e).__name__}: {str(e)} after {process_time:.3f}s\n")
-        traceback.print_exc(file=sys.stderr)
-        sys.stderr.flush()
-        raise
+
+    return log_requests
+
+
+# Add request logging middleware with request ID tracking - MUST be before CORS middleware
+app.middleware("http")(_make_log_requests())
 
 # Register custom error handlers
 async def database_connection_error_handler(_request: Request, exc: DatabaseConnectionError) -> JSONResponse:
     """Return 503 with a short message so the app does not show the raw DB error."""
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
         content={
             "error": {
@@ -100,49 +112,50 @@ async def database_connection_error_handler(_request: Request, exc: DatabaseConn
         },
     )
 
-app.add_exception_handler(DatabaseConnectionError, database_connection_error_handler)
-app.add_exception_handler(AppError, app_error_handler)
-app.add_exception_handler(HTTPException, http_exception_handler)
-app.add_exception_handler(RequestValidationError, validation_exception_handler)
-app.add_exception_handler(ResponseValidationError, validation_exception_handler)
-app.add_exception_handler(Exception, generic_exception_handler)
-app.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)
+EXCEPTION_HANDLERS = [
+    (DatabaseConnectionError, database_connection_error_handler),
+    (AppError, app_error_handler),
+    (HTTPException, http_exception_handler),
+    (RequestValidationError, validation_exception_handler),
+    (ResponseValidationError, validation_exception_handler),
+    (Exception, generic_exception_handler),
+    (RateLimitExceeded, _rate_limit_exceeded_handler),
+]
+for _exc_class, _handler in EXCEPTION_HANDLERS:
+    app.add_exception_handler(_exc_class, _handler)
 
 # Initialize limiter
 app.state.limiter = limiter
 
 # CORS middleware
-# Handle CORS_ORIGINS as string ("*" or comma-separated)
-cors_origins = settings.CORS_ORIGINS
-if isinstance(cors_origins, str):
-    if cors_origins == "*":
-        cors_origins = ["*"]
-    else:
-        cors_origins = [origin.strip() for origin in cors_origins.split(",")]
-
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=cors_origins,
+    allow_origins=settings.cors_origins_list,
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
 )
 app.add_middleware(SlowAPIMiddleware)
 
-# Include routers
-app.include_router(auth.router, prefix="/api/auth", tags=["Authentication"])
-app.include_router(google_auth.router, prefix="/api/auth", tags=["Authentication"])
-app.include_router(users.router, prefix="/api/users", tags=["Users"])
-app.include_router(caregivers.router, prefix="/api/caregivers", tags=["Caregivers"])
-app.include_router(bookings.router, prefix="/api/bookings", tags=["Bookings"])
-app.include_router(location.router, prefix="/api/location", tags=["Location"])
-app.include_router(dashboard.router, prefix="/api/dashboard", tags=["Dashboard"])
-app.include_router(chat.router, prefix="/api/chat", tags=["Chat"])
-app.include_router(notifications.router, prefix="/api/notifications", tags=["Notifications"])
-app.include_router(payments.router, prefix="/api/payments", tags=["Payments"])
-app.include_router(emergency.router, prefix="/api/emergency", tags=["Emergency"])
-app.include_router(communications.router, prefix="/api/communications", tags=["Communications"])
-app.include_router(reviews.router, prefix="/api/reviews", tags=["Reviews"])
+# Include routers: (module, prefix, tag). Included at import, not in a startup hook, so
+# app.routes / OpenAPI are complete without running lifespan (tests, scripts/debug_routes.py).
+ROUTERS = [
+    ("app.routers.auth", "/api/auth", "Authentication"),
+    ("app.routers.google_auth", "/api/auth", "Authentication"),
+    ("app.routers.users", "/api/users", "Users"),
+    ("app.routers.caregivers", "/api/caregivers", "Caregivers"),
+    ("app.routers.bookings", "/api/bookings", "Bookings"),
+    ("app.routers.location", "/api/location", "Location"),
+    ("app.routers.dashboard", "/api/dashboard", "Dashboard"),
+    ("app.routers.chat", "/api/chat", "Chat"),
+    ("app.routers.notifications", "/api/notifications", "Notifications"),
+    ("app.routers.payments", "/api/payments", "Payments"),
+    ("app.routers.emergency", "/api/emergency", "Emergency"),
+    ("app.routers.communications", "/api/communications", "Communications"),
+    ("app.routers.reviews", "/api/reviews", "Reviews"),
+]
+for _module, _prefix, _tag in ROUTERS:
+    app.include_router(importlib.import_module(_module).router, prefix=_prefix, tags=[_tag])
 
 
 @app.api_route("/", methods=["GET", "HEAD"])
@@ -163,37 +176,45 @@ async def health_check():
     }
 
 
-@app.get("/health/db/env")
-async def health_check_db_env():
-    """Debug: is DATABASE_URL set and does it look like pooler (6543) or direct (5432)? No DB connection."""
-    import os
-    raw = os.getenv("DATABASE_URL") or ""
-    url = raw.strip()
+def _describe_database_url(raw: Optional[str]) -> dict:
+    url = (raw or "").strip()
     if not url:
-        return {"DATABASE_URL_set": False, "hint": "Set DATABASE_URL in Render to the pooler URI (port 6543)."}
-    is_pooler = "6543" in url and "pooler" in url.lower()
-    is_direct = "5432" in url or "db." in url.split("@")[-1].split("/")[0] if "@" in url else False
+        return {
+            "DATABASE_URL_set": False,
+            "hint": "Set DATABASE_URL in Render to the pooler URI (port 6543), "
+                    "or set both SUPABASE_DB_PASSWORD and SUPABASE_DB_REGION.",
+        }
+    parts = urlsplit(url)
+    host = (parts.hostname or "").lower()
+    try:
+        port = parts.port
+    except ValueError:
+        port = None
+    is_pooler = port == 6543 and "pooler" in host
     return {
         "DATABASE_URL_set": True,
         "using_pooler": is_pooler,
-        "avoid_direct": not ("5432" in url or "db." in (url.split("@")[-1].split("/")[0] if "@" in url else "")),
-        "hint": "Use pooler (port 6543). Remove SUPABASE_DB_PASSWORD from Render." if not is_pooler else "OK",
+        "avoid_direct": not (port == 5432 or host.startswith("db.")),
+        "hint": "Set DATABASE_URL to the pooler URI (port 6543) from the Supabase dashboard." if not is_pooler else "OK",
     }
 
 
+# DATABASE_URL doesn't change while the process runs; describe it once
+_DB_ENV_INFO = _describe_database_url(os.getenv("DATABASE_URL"))
+
+
+@app.get("/health/db/env")
+async def health_check_db_env():
+    """Debug: is DATABASE_URL set and does it look like pooler (6543) or direct (5432)? No DB connection."""
+    return _DB_ENV_INFO
+
+
 @app.get("/health/db")
 async def health_check_db():
     """Test direct DB pool (Postgres). Returns error detail if pool fails (e.g. wrong DATABASE_URL)."""
     try:
-        from src.config.db import get_db_pool, DatabaseConnectionError
-        pool = get_db_pool()
-        conn = pool.getconn()
-        try:
-            cur = conn.cursor()
-            cur.execute("SELECT 1")
-            cur.close()
-        finally:
-            pool.putconn(conn)
+        # psycopg2 blocks; keep the probe off the event loop
+        await asyncio.to_thread(ping_database)
         return {"status": "ok", "database": "connected"}
     except Exception as e:
         return {
@@ -204,7 +225,16 @@ async def health_check_db():
         }
 
 
+@app.on_event("startup")
+async def startup_event():
+    """Initialise the Firebase Admin SDK up front instead of on the first native push."""
+    init_firebase()
+
+
 @app.on_event("shutdown")
 async def shutdown_event():
-    """Graceful shutdown — no DB pool to close (Supabase client only)."""
-    pass
+    """Graceful shutdown — close the shared Supabase/Expo HTTP pools and the Postgres pool; flush queued logs."""
+    http_client.close()
+    close_all_connections()
+    await close_expo_client()
+    shutdown_logging()
@@ -0,0 +1,17 @@
+"""
+Response classes shared by the routers.
+"""
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse
+
+
+class ORJSONResponse(JSONResponse):
+    """JSONResponse rendered with orjson (native datetime/UUID, faster escaping).
+
+    Kept in-tree because fastapi.responses.ORJSONResponse is deprecated upstream.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
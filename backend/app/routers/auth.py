@@ -12,11 +12,16 @@ from app.error_handler import (
 )
 from pydantic import BaseModel
 from typing import Optional
+import asyncio
+import hashlib
 import sys
+import threading
+import time
+from cachetools import TTLCache
 from app.limiter import limiter
-from jose import jwt, JWTError
-from datetime import datetime, timedelta, timezone
 from app.config import settings
+from app.services.tokens import InvalidTokenError, decode_custom_token, issue_custom_tokens, unverified_claims
+from app.cache.profile_cache import get_cached_profile, invalidate_user_profile, set_cached_profile
 
 router = APIRouter()
 
@@ -102,6 +107,15 @@ def _resolve_login_email(credentials: "LoginRequest") -> str:
     raise AuthenticationError("Please enter email or phone number.")
 
 
+def _fetch_profile_by_email(email: str) -> Optional[dict]:
+    """users row for email, or None (including on error): a speculative read that overlaps sign-in."""
+    try:
+        res = supabase_admin.table("users").select("*").eq("email", email).limit(1).execute()
+        return res.data[0] if res.data else None
+    except Exception:
+        return None
+
+
 @router.post("/login", response_model=dict)
 @limiter.limit("5/minute")
 async def login(request: Request, credentials: LoginRequest):
@@ -110,10 +124,15 @@ async def login(request: Request, credentials: LoginRequest):
         raise AuthenticationError("Please enter email or phone number.")
     try:
         login_email = _resolve_login_email(credentials)
-        response = supabase.auth.sign_in_with_password({
-            "email": login_email,
-            "password": credentials.password
-        })
+        # The profile read doesn't need the user id from sign-in, so both round trips run together.
+        # The profile is only returned after sign-in succeeds and its id matches.
+        response, profile_by_email = await asyncio.gather(
+            asyncio.to_thread(
+                supabase.auth.sign_in_with_password,
+                {"email": login_email, "password": credentials.password},
+            ),
+            asyncio.to_thread(_fetch_profile_by_email, login_email),
+        )
         sys.stderr.write(f"[{request.state.request_id}] Supabase login successful for {login_email}\n")
         sys.stderr.flush()
         
@@ -131,11 +150,19 @@ async def login(request: Request, credentials: LoginRequest):
         # Get user profile (use admin client so RLS does not block; anon client may not have user context here)
         user_id = response.user.id if hasattr(response.user, 'id') else response.user.get('id') if isinstance(response.user, dict) else str(response.user)
         
-        user_profile_response = supabase_admin.table("users").select("*").eq("id", user_id).execute()
-        
-        user_profile = None
-        if user_profile_response.data and len(user_profile_response.data) > 0:
-            user_profile = user_profile_response.data[0]
+        if profile_by_email and str(profile_by_email.get("id")) == str(user_id):
+            user_profile = profile_by_email
+            set_cached_profile(user_id, user_profile)
+        else:
+            # Email lookup missed (e.g. stored with different casing): fall back to the id
+            user_profile = get_cached_profile(user_id)
+            if user_profile is None:
+                user_profile_response = await asyncio.to_thread(
+                    supabase_admin.table("users").select("*").eq("id", user_id).execute
+                )
+                if user_profile_response.data and len(user_profile_response.data) > 0:
+                    user_profile = user_profile_response.data[0]
+                    set_cached_profile(user_id, user_profile)
         
         return {
             "access_token": access_token,
@@ -166,6 +193,28 @@ async def login(request: Request, credentials: LoginRequest):
 
 
 
+# Decoded custom refresh-token payloads, keyed by a digest of the token. Only successful
+# decodes are stored, and only for tokens that stay valid for the whole TTL.
+_JWT_CACHE_TTL_SECONDS = 10
+_jwt_cache: TTLCache = TTLCache(maxsize=10_000, ttl=_JWT_CACHE_TTL_SECONDS)
+_jwt_cache_lock = threading.Lock()
+
+
+def _decode_refresh_jwt(token: str) -> dict:
+    """decode_custom_token with a short-lived cache of verified payloads; raises InvalidTokenError."""
+    key = hashlib.sha256(token.encode()).digest()[:16]
+    with _jwt_cache_lock:
+        payload = _jwt_cache.get(key)
+    if payload is not None:
+        return payload
+    payload = decode_custom_token(token)
+    exp = payload.get("exp")
+    if isinstance(exp, (int, float)) and exp - time.time() > _JWT_CACHE_TTL_SECONDS:
+        with _jwt_cache_lock:
+            _jwt_cache[key] = payload
+    return payload
+
+
 class RefreshTokenRequest(BaseModel):
     refresh_token: str
 
@@ -199,7 +248,7 @@ async def refresh_token(body: RefreshTokenRequest = Body(..., embed=False)):
             sys.stderr.write(f"[AUTH] Attempting custom JWT refresh...\n")
             
             # Verify the refresh token
-            payload = jwt.decode(body.refresh_token, settings.SECRET_KEY, algorithms=["HS256"])
+            payload = _decode_refresh_jwt(body.refresh_token)
             
             if payload.get("type") != "refresh":
                 raise AuthenticationError("Invalid token type")
@@ -210,30 +259,8 @@ async def refresh_token(body: RefreshTokenRequest = Body(..., embed=False)):
             if not user_id or not email:
                 raise AuthenticationError("Invalid token payload")
                 
-            # Generate new access token
-            access_token_expires = timedelta(days=7)
-            new_access_token = jwt.encode(
-                {
-                    "sub": user_id,
-                    "email": email,
-                    "exp": datetime.now(timezone.utc) + access_token_expires,
-                },
-                settings.SECRET_KEY,
-                algorithm="HS256",
-            )
-            
-            # Generate new refresh token (rotate it)
-            refresh_token_expires = timedelta(days=30)
-            new_refresh_token = jwt.encode(
-                {
-                    "sub": user_id,
-                    "email": email,
-                    "exp": datetime.now(timezone.utc) + refresh_token_expires,
-                    "type": "refresh",
-                },
-                settings.SECRET_KEY,
-                algorithm="HS256",
-            )
+            # Generate new access token and rotate the refresh token
+            new_access_token, new_refresh_token = issue_custom_tokens(user_id, email)
             
             # Get user profile
             user_response = supabase.table("users").select("*").eq("id", user_id).limit(1).execute()
@@ -249,7 +276,7 @@ async def refresh_token(body: RefreshTokenRequest = Body(..., embed=False)):
                 "user": user_data
             }
             
-        except JWTError as jwt_err:
+        except InvalidTokenError as jwt_err:
             sys.stderr.write(f"[AUTH] Custom refresh failed: {jwt_err}\n")
             raise AuthenticationError("Invalid or expired refresh token")
         except Exception as e:
@@ -305,10 +332,13 @@ async def change_password(
         # OAuth users (Google sign-in) may not have a password set
         if request.current_password:
             try:
-                auth_response = supabase.auth.sign_in_with_password({
-                    "email": email,
-                    "password": request.current_password
-                })
+                # Kept before the update: the admin update below doesn't check the old password,
+                # so running the two concurrently would let a wrong password through. The sync
+                # SDK call runs off the event loop instead.
+                auth_response = await asyncio.to_thread(
+                    supabase.auth.sign_in_with_password,
+                    {"email": email, "password": request.current_password},
+                )
                 if not auth_response.user:
                     raise AuthenticationError("Invalid current password")
                 sys.stderr.write(f"[INFO] Current password verified for {email}\n")
@@ -337,16 +367,15 @@ async def change_password(
             sys.stderr.write(f"[INFO] Calling update_user_by_id with ID: {user_id_str}\n")
             sys.stderr.flush()
             
-            response = supabase_admin.auth.admin.update_user_by_id(
+            response = await asyncio.to_thread(
+                supabase_admin.auth.admin.update_user_by_id,
                 user_id_str,
-                {"password": request.new_password}
+                {"password": request.new_password},
             )
             
-            sys.stderr.write(f"[INFO] Update response received: {response}\n")
-            sys.stderr.flush()
-            
             if not response.user:
                 raise DatabaseError("No user returned from password update operation")
+            invalidate_user_profile(user_id_str)
                 
             sys.stderr.write(f"[SUCCESS] Password updated for {email}\n")
             sys.stderr.flush()
@@ -380,6 +409,10 @@ async def get_current_user_profile(current_user: dict = Depends(get_current_user
         if not user_id:
             raise AuthenticationError("Invalid user session: User ID not found")
         
+        cached = get_cached_profile(user_id)
+        if cached is not None:
+            return cached
+
         # Use supabase_admin to bypass RLS policies
         response = supabase_admin.table("users").select("*").eq("id", user_id).execute()
         
@@ -419,6 +452,7 @@ async def get_current_user_profile(current_user: dict = Depends(get_current_user
                 if insert_resp.data:
                     sys.stderr.write(f"[INFO] Auto-provisioned user profile for {user_id}\n")
                     sys.stderr.flush()
+                    set_cached_profile(user_id, insert_resp.data[0])
                     return insert_resp.data[0]
                 else:
                     raise DatabaseError("Failed to auto-provision user profile")
@@ -428,6 +462,7 @@ async def get_current_user_profile(current_user: dict = Depends(get_current_user
                 # Re-raise as DatabaseError but don't expose internal details too much
                 raise DatabaseError(f"User profile could not be created: {str(provision_error)}")
         
+        set_cached_profile(user_id, response.data[0])
         return response.data[0]
         
     except AuthenticationError:
@@ -552,9 +587,24 @@ async def verify_google_session(session_data: dict):
         if not access_token:
             raise ValidationError("Access token not provided", "access_token")
         
-        # Verify the token by getting the user
-        # Use the access token to get user info
-        user_response = supabase.auth.get_user(access_token)
+        # Verify the token by getting the user. The profile-existence check runs alongside it,
+        # keyed on the token's (not yet verified) sub; it is only trusted if sub matches the
+        # verified user id, otherwise it is redone for the verified id.
+        try:
+            claimed_id = unverified_claims(access_token).get("sub")
+        except InvalidTokenError:
+            claimed_id = None
+
+        def _profile_exists(uid) -> bool:
+            return bool(supabase_admin.table("users").select("id").eq("id", uid).limit(1).execute().data)
+
+        if claimed_id:
+            user_response, profile_exists = await asyncio.gather(
+                asyncio.to_thread(supabase.auth.get_user, access_token),
+                asyncio.to_thread(_profile_exists, claimed_id),
+            )
+        else:
+            user_response, profile_exists = await asyncio.to_thread(supabase.auth.get_user, access_token), None
         
         if not user_response.user:
             raise AuthenticationError("Invalid access token or expired session")
@@ -563,9 +613,10 @@ async def verify_google_session(session_data: dict):
         user_id = user.id if hasattr(user, 'id') else user.get('id') if isinstance(user, dict) else str(user)
         
         # Ensure user profile exists
-        profile_check = supabase_admin.table("users").select("*").eq("id", user_id).execute()
+        if profile_exists is None or str(claimed_id) != str(user_id):
+            profile_exists = await asyncio.to_thread(_profile_exists, user_id)
         
-        if not profile_check.data:
+        if not profile_exists:
             # Auto-provision user profile from Google OAuth data
             email = user.email if hasattr(user, 'email') else user.get('email') if isinstance(user, dict) else None
             metadata = user.user_metadata if hasattr(user, 'user_metadata') else user.get('user_metadata') if isinstance(user, dict) else {}
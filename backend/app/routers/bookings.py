@@ -28,6 +28,8 @@ from app.services.notifications import (
     notify_video_call_joined
 )
 from app.services.video import generate_video_call_url
+from app.timeutils import parse_iso_utc
+from app.cache.stats_cache import invalidate_dashboard_stats
 import uuid
 
 router = APIRouter()
@@ -77,12 +79,10 @@ async def create_video_call_request(
         day_end = st + timedelta(days=1)
         existing = supabase_admin.table("bookings").select("scheduled_date, duration_hours").eq("caregiver_id", str(video_call_data.caregiver_id)).in_("status", ["accepted", "confirmed", "in_progress"]).gte("scheduled_date", day_start.isoformat()).lte("scheduled_date", day_end.isoformat()).execute()
         for b in (existing.data or []):
-            b_start_str = (b.get("scheduled_date") or "").replace("Z", "+00:00")
+            b_start_str = b.get("scheduled_date")
             if not b_start_str:
                 continue
-            b_start = datetime.fromisoformat(b_start_str)
-            if b_start.tzinfo is None:
-                b_start = b_start.replace(tzinfo=timezone.utc)
+            b_start = parse_iso_utc(b_start_str)
             b_dur = float(b.get("duration_hours") or 0)
             b_end = b_start + timedelta(hours=b_dur)
             if st < b_end and call_end > b_start:
@@ -120,6 +120,7 @@ async def create_video_call_request(
             raise DatabaseError("Failed to create video call request. No data returned.")
         
         video_call = response.data[0]
+        invalidate_dashboard_stats(video_call.get("care_recipient_id"), video_call.get("caregiver_id"))
         print(f"[INFO] Video call request created with ID: {video_call['id']}", flush=True)
         
         # Get user names for notifications and send them
@@ -238,6 +239,7 @@ async def create_video_call_from_chat(
         if not response.data:
             raise DatabaseError("Failed to create video call from chat")
         video_call = response.data[0]
+        invalidate_dashboard_stats(care_recipient_id, caregiver_id)
         return video_call
     except HTTPException:
         raise
@@ -371,6 +373,7 @@ async def accept_video_call_request(
             )
         
         updated_call = update_response.data[0]
+        invalidate_dashboard_stats(video_call.get("care_recipient_id"), video_call.get("caregiver_id"))
         print(f"[INFO] Video call {video_call_id} updated. Status: {updated_call.get('status')}, CR accepted: {updated_call.get('care_recipient_accepted')}, CG accepted: {updated_call.get('caregiver_accepted')}", flush=True)
         
         # BEGIN TRANSACTION-LIKE SEQUENCE
@@ -438,6 +441,7 @@ async def accept_video_call_request(
                     booking_response = supabase_admin.table("bookings").insert(booking_dict).execute()
                     if booking_response.data:
                         booking_id = booking_response.data[0]["id"]
+                        invalidate_dashboard_stats(video_call["care_recipient_id"], video_call["caregiver_id"])
                         print(f"[INFO] Booking created with ID: {booking_id}", flush=True)
                         
                         # Mark caregiver as unavailable
@@ -536,6 +540,7 @@ async def accept_video_call_request(
                 }
                 print(f"[INFO] Reverting video call {video_call_id} to {revert_data}", flush=True)
                 supabase_admin.table("video_call_requests").update(revert_data).eq("id", video_call_id).execute()
+                invalidate_dashboard_stats(video_call.get("care_recipient_id"), video_call.get("caregiver_id"))
                 
             except Exception as rollback_ex:
                 print(f"[ERROR] Rollback failed! Data may be inconsistent. Error: {rollback_ex}", flush=True)
@@ -793,6 +798,7 @@ async def update_video_call_status(
              raise DatabaseError("Failed to update status")
              
         updated_call = update_res.data[0]
+        invalidate_dashboard_stats(video_call.get("care_recipient_id"), video_call.get("caregiver_id"))
         
         # Send notification
         try:
@@ -850,6 +856,8 @@ async def complete_video_call(
                         "completed_at": now_iso,
                         "updated_at": now_iso,
                     }).eq("id", bk["id"]).execute()
+            # The call left the pending bucket (and the booking may have completed)
+            invalidate_dashboard_stats(vc.get("care_recipient_id"), vc.get("caregiver_id"))
             return {"status": "completed", "video_call_id": id}
 
         # 2) Try as booking id
@@ -872,6 +880,7 @@ async def complete_video_call(
                     "completed_at": now_iso,
                     "updated_at": now_iso,
                 }).eq("id", vc_id).execute()
+            invalidate_dashboard_stats(bk.get("care_recipient_id"), bk.get("caregiver_id"))
             return {"status": "completed", "booking_id": id}
 
         raise NotFoundError("Video call or booking not found", details={"id": id})
@@ -939,6 +948,7 @@ async def enable_chat_session(
             )
         
         updated_session = update_response.data[0]
+        invalidate_dashboard_stats(chat_session["care_recipient_id"], chat_session["caregiver_id"])
         
         # If chat is now enabled, notify both parties
         if updated_session.get("is_enabled") and accept_data.accept:
@@ -1078,14 +1088,10 @@ async def check_slot_availability(
     Overlap rule: (startA < endB) AND (endA > startB).
     """
     try:
-        req_start = datetime.fromisoformat(start_time.replace("Z", "+00:00"))
-        req_end = datetime.fromisoformat(end_time.replace("Z", "+00:00"))
+        req_start = parse_iso_utc(start_time)
+        req_end = parse_iso_utc(end_time)
     except (ValueError, TypeError):
         raise ValidationError("Invalid start_time or end_time; use ISO 8601 format (UTC).")
-    if req_start.tzinfo is None:
-        req_start = req_start.replace(tzinfo=timezone.utc)
-    if req_end.tzinfo is None:
-        req_end = req_end.replace(tzinfo=timezone.utc)
     if req_start >= req_end:
         raise ValidationError("start_time must be before end_time.")
 
@@ -1114,12 +1120,10 @@ async def check_slot_availability(
             ).lte("scheduled_date", day_end.isoformat()).execute()
             available = True
             for b in (existing.data or []):
-                b_start_str = (b.get("scheduled_date") or "").replace("Z", "+00:00")
+                b_start_str = b.get("scheduled_date")
                 if not b_start_str:
                     continue
-                b_start = datetime.fromisoformat(b_start_str)
-                if b_start.tzinfo is None:
-                    b_start = b_start.replace(tzinfo=timezone.utc)
+                b_start = parse_iso_utc(b_start_str)
                 b_end = b_start + timedelta(hours=float(b.get("duration_hours") or 0))
                 if _slot_overlap(req_start, req_end, b_start, b_end):
                     available = False
@@ -1229,6 +1233,7 @@ async def create_slot_booking(
 
     booking_id = booking.get("id")
     if booking_id:
+        invalidate_dashboard_stats(user_id, caregiver_id)
         await _log_booking_history(booking_id, None, "requested", user_id, "Slot booking (atomic)")
         try:
             care_recipient_response = supabase_admin.table("users").select("full_name").eq("id", user_id).execute()
@@ -1295,6 +1300,7 @@ async def create_booking(
                 chat_session_id=chat_id,
             )
             booking_id = booking.get("id")
+            invalidate_dashboard_stats(user_id, caregiver_id_str)
             await _log_booking_history(booking_id, None, initial_status, user_id, "Initial booking creation (atomic)")
             if caregiver_id_str:
                 try:
@@ -1330,12 +1336,10 @@ async def create_booking(
             req_start = scheduled_time
             req_end = req_start + timedelta(hours=duration_hours)
             for b in (existing_bookings.data or []):
-                b_start_str = (b.get("scheduled_date") or "").replace("Z", "+00:00")
+                b_start_str = b.get("scheduled_date")
                 if not b_start_str:
                     continue
-                b_start = datetime.fromisoformat(b_start_str)
-                if b_start.tzinfo is None:
-                    b_start = b_start.replace(tzinfo=timezone.utc)
+                b_start = parse_iso_utc(b_start_str)
                 b_duration = float(b.get("duration_hours") or 0)
                 b_end = b_start + timedelta(hours=b_duration)
                 if req_start < b_end and req_end > b_start:
@@ -1358,6 +1362,7 @@ async def create_booking(
             raise DatabaseError("Failed to create booking")
         booking = response.data[0]
         booking_id = booking["id"]
+        invalidate_dashboard_stats(user_id, caregiver_id)
         await _log_booking_history(booking_id, None, initial_status, user_id, "Initial booking creation")
         if initial_status == "requested" and caregiver_id:
             try:
@@ -1425,6 +1430,7 @@ async def complete_booking(
             "updated_at": now_iso,
         }
         supabase_admin.table("bookings").update(update_data).eq("id", booking_id).execute()
+        invalidate_dashboard_stats(booking.get("care_recipient_id"), booking.get("caregiver_id"))
 
         vc_id = booking.get("video_call_request_id")
         if vc_id:
@@ -1500,6 +1506,7 @@ async def respond_to_booking(
             raise DatabaseError("Failed to update booking")
             
         updated_booking = updated_res.data[0]
+        invalidate_dashboard_stats(booking.get("care_recipient_id"), booking.get("caregiver_id"))
         
         await _log_booking_history(booking_id, booking["status"], new_status, user_id, response_data.reason)
         
@@ -1620,6 +1627,7 @@ async def update_booking_status(
             
         updated_res = supabase_admin.table("bookings").update(update_data).eq("id", booking_id).execute()
         updated_booking = updated_res.data[0]
+        invalidate_dashboard_stats(booking.get("care_recipient_id"), booking.get("caregiver_id"))
         
         await _log_booking_history(booking_id, current_status, new_status, user_id, status_update.reason)
         
@@ -1702,6 +1710,15 @@ async def add_booking_note(
     except Exception as e:
         raise DatabaseError(str(e))
 
+# Embedded users are serialized as UserBaseOut; fetch just those columns. The booking row
+# itself stays "*": several optional BookingResponse columns only exist after migrations.
+_BOOKING_DETAIL_USER_COLUMNS = "id, email, full_name, phone, date_of_birth, role, address, profile_photo_url, emergency_contact"
+_BOOKING_DETAIL_SELECT = (
+    f"*, care_recipient:users!care_recipient_id({_BOOKING_DETAIL_USER_COLUMNS}), "
+    f"caregiver:users!caregiver_id({_BOOKING_DETAIL_USER_COLUMNS})"
+)
+
+
 @router.get("/{booking_id}", response_model=BookingResponse, status_code=status.HTTP_200_OK)
 async def get_booking_details(
     booking_id: uuid.UUID,
@@ -1713,36 +1730,21 @@ async def get_booking_details(
     - The care recipient who created it
     - The caregiver assigned to it
     """
+    bid = str(booking_id)
+    uid = str(current_user.get("id", ""))
     try:
-        # Get user_id
-        user_id = current_user.get("id") if isinstance(current_user, dict) else str(current_user.get("id", ""))
-        
-        # Query booking with relations
-        # We need to join care_recipient and caregiver tables
-        # Supabase syntax for joins in python client:
-        # .select("*, care_recipient:users!care_recipient_id(*), caregiver:users!caregiver_id(*)")
-        
-        query = supabase_admin.table("bookings").select(
-            "*, care_recipient:users!care_recipient_id(*), caregiver:users!caregiver_id(*)"
-        ).eq("id", str(booking_id))
+        # id is the primary key: ask for a single object instead of a one-element array.
+        # Depending on the client version a missing row comes back as None or as empty data.
+        response = supabase_admin.table("bookings").select(_BOOKING_DETAIL_SELECT).eq("id", bid).maybe_single().execute()
         
-        response = query.execute()
-        
-        if not response.data:
+        if response is None or not response.data:
             raise NotFoundError("Booking not found")
             
-        booking = response.data[0]
+        booking = response.data
         
-        # Authorization Check
-        care_recipient_id = booking.get("care_recipient_id")
-        caregiver_id = booking.get("caregiver_id")
-        
-        # Check if user is either the recipient or the caregiver
-        # Also allow if user is an admin (future proofing, if we had admin role check)
-        is_authorized = (str(care_recipient_id) == str(user_id)) or \
-                        (str(caregiver_id) == str(user_id) if caregiver_id else False)
-                        
-        if not is_authorized:
+        # Authorization Check: user must be either the recipient or the caregiver
+        # (IDs come back from PostgREST as strings)
+        if booking.get("care_recipient_id") != uid and booking.get("caregiver_id") != uid:
             raise AuthorizationError("You are not authorized to view this booking")
             
         return booking
@@ -1750,5 +1752,5 @@ async def get_booking_details(
     except HTTPException:
         raise
     except Exception as e:
-        log_error(e, {"booking_id": str(booking_id), "user_id": user_id})
+        log_error(e, {"booking_id": bid, "user_id": uid})
         raise DatabaseError(f"Error retrieving booking details: {str(e)}")
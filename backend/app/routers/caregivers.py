@@ -4,6 +4,7 @@ from datetime import datetime, timedelta, timezone
 from app.schemas import CaregiverProfileCreate, CaregiverProfileUpdate, CaregiverProfileResponse, SlotListItem
 from app.database import supabase, supabase_admin
 from app.dependencies import get_current_user, get_optional_user, verify_caregiver
+from app.timeutils import parse_iso_utc
 
 router = APIRouter()
 
@@ -406,14 +407,10 @@ async def get_caregiver_slots(
     Overlap rule: (startA < endB) AND (endA > startB). Pending + confirmed bookings block slots.
     """
     try:
-        from_parsed = datetime.fromisoformat(from_date.replace("Z", "+00:00"))
-        to_parsed = datetime.fromisoformat(to_date.replace("Z", "+00:00"))
+        from_parsed = parse_iso_utc(from_date)
+        to_parsed = parse_iso_utc(to_date)
     except (ValueError, TypeError):
         raise HTTPException(status_code=400, detail="Invalid from_date or to_date; use ISO format (UTC).")
-    if from_parsed.tzinfo is None:
-        from_parsed = from_parsed.replace(tzinfo=timezone.utc)
-    if to_parsed.tzinfo is None:
-        to_parsed = to_parsed.replace(tzinfo=timezone.utc)
     if from_parsed >= to_parsed:
         raise HTTPException(status_code=400, detail="from_date must be before to_date.")
     if slot_duration_minutes <= 0:
@@ -441,12 +438,10 @@ async def get_caregiver_slots(
     ).lte("scheduled_date", range_end.isoformat()).execute()
     blocking: List[tuple] = []
     for b in (bookings_res.data or []):
-        start_str = (b.get("scheduled_date") or "").replace("Z", "+00:00")
+        start_str = b.get("scheduled_date")
         if not start_str:
             continue
-        b_start = datetime.fromisoformat(start_str)
-        if b_start.tzinfo is None:
-            b_start = b_start.replace(tzinfo=timezone.utc)
+        b_start = parse_iso_utc(start_str)
         dur = float(b.get("duration_hours") or 0)
         if dur <= 0:
             continue
@@ -481,26 +476,20 @@ async def get_caregiver_busy_slots(
 ):
     """Get time slots when the caregiver is already booked (accepted/confirmed/in_progress). Used to show free vs busy before booking."""
     try:
-        from_parsed = datetime.fromisoformat(from_date.replace("Z", "+00:00"))
-        to_parsed = datetime.fromisoformat(to_date.replace("Z", "+00:00"))
+        from_parsed = parse_iso_utc(from_date)
+        to_parsed = parse_iso_utc(to_date)
     except (ValueError, TypeError):
         raise HTTPException(status_code=400, detail="Invalid from_date or to_date; use ISO format.")
-    if from_parsed.tzinfo is None:
-        from_parsed = from_parsed.replace(tzinfo=timezone.utc)
-    if to_parsed.tzinfo is None:
-        to_parsed = to_parsed.replace(tzinfo=timezone.utc)
     if from_parsed >= to_parsed:
         raise HTTPException(status_code=400, detail="from_date must be before to_date.")
     res = supabase_admin.table("bookings").select("scheduled_date, duration_hours").eq("caregiver_id", caregiver_id).in_("status", ["accepted", "confirmed", "in_progress"]).gte("scheduled_date", from_parsed.isoformat()).lte("scheduled_date", to_parsed.isoformat()).execute()
     now_utc = datetime.now(timezone.utc)
     slots = []
     for b in res.data or []:
-        start_str = (b.get("scheduled_date") or "").replace("Z", "+00:00")
+        start_str = b.get("scheduled_date")
         if not start_str:
             continue
-        start = datetime.fromisoformat(start_str)
-        if start.tzinfo is None:
-            start = start.replace(tzinfo=timezone.utc)
+        start = parse_iso_utc(start_str)
         dur = float(b.get("duration_hours") or 0)
         if dur <= 0:
             continue
@@ -6,6 +6,7 @@ from app.schemas import MessageCreate, MessageResponse, ChatSessionResponse
 from app.database import supabase, supabase_admin
 from app.dependencies import get_current_user
 from app.services.notifications import notify_new_message
+from app.timeutils import parse_iso_utc
 from app.error_handler import (
     AppError,
     NotFoundError,
@@ -86,8 +87,7 @@ async def get_chat_sessions(current_user: dict = Depends(get_current_user)):
             lm_at = s.get("last_message_at")
             if lm_at:
                 try:
-                    from datetime import datetime
-                    dt = datetime.fromisoformat(lm_at.replace("Z", "+00:00")) if isinstance(lm_at, str) else lm_at
+                    dt = parse_iso_utc(lm_at) if isinstance(lm_at, str) else lm_at
                     return dt.timestamp()
                 except (ValueError, TypeError):
                     pass
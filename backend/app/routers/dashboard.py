@@ -1,15 +1,39 @@
 """
-dashboard.py — Supabase client only. No direct SQL.
+dashboard.py — reads go through the Supabase client (PostgREST); no direct Postgres connection.
+
+Part of the work lives in the database (supabase/migrations):
+- /stats: active/completed counts and earnings come from the trigger-maintained
+  dashboard_counters row (20260225); only "upcoming" is counted live. Without that row it
+  falls back to head-count queries and the caregiver_total_earnings RPC (20260304).
+- /bookings: reads the dashboard_bookings_v view (20260305), filtered through
+  booking_participants (20260228).
+- /upcoming, /recurring, /video-calls: plain table selects with embeds.
+
+Responses carry a weak ETag hashed from the serialised body (not a stored version), so a
+matching If-None-Match gets an empty 304. Stats bodies are also cached per user
+(app/cache/stats_cache.py) and dropped on booking/payment writes.
 """
-from fastapi import APIRouter, HTTPException, status, Depends, Query
+from fastapi import APIRouter, HTTPException, status, Depends, Query, Request, Response
 from datetime import datetime, timedelta, timezone
 from typing import List, Optional
-from app.schemas import DashboardStats, BookingResponse
+from uuid import UUID
+from app.schemas import DashboardStats, DashboardBooking, DashboardVideoCall, DashboardBootstrap
 from app.database import supabase_admin
 from app.dependencies import get_current_user
-import sys
+from app.cache.role_cache import get_user_role
+from app.cache.stats_cache import get_cached_stats, set_cached_stats
+import asyncio
+import hashlib
+import logging
+import orjson
 
 router = APIRouter()
+logger = logging.getLogger(__name__)
+
+# /stats and /upcoming may be reused by the browser briefly; the lists are polled and must
+# revalidate every time (the ETag still turns an unchanged poll into an empty 304).
+_SUMMARY_CACHE_CONTROL = "private, max-age=30"
+_REVALIDATE_CACHE_CONTROL = "private, no-cache"
 
 # DB booking_status enum: draft, requested, accepted, confirmed, in_progress, completed, cancelled (no "pending")
 def _normalize_booking_status_filter(status_list: List[str]) -> List[str]:
@@ -30,6 +54,26 @@ def _get_role_col(role: str):
             "care_recipient" if role == "caregiver" else "caregiver")
 
 
+# Explicit projections: only the fields the dashboard screens render. Wide
+# columns (razorpay_*, caregiver_notes, address/current_location JSON on users)
+# are left to the detail endpoints.
+_BOOKING_COLUMNS = (
+    "id, care_recipient_id, caregiver_id, video_call_request_id, chat_session_id, "
+    "service_type, scheduled_date, end_date, duration_hours, location, specific_needs, "
+    "recurring_pattern, is_recurring, status, urgency_level, amount, currency, "
+    "payment_status, accepted_at, completed_at, created_at, updated_at"
+)
+_USER_SUMMARY_COLUMNS = "id, full_name, phone, profile_photo_url"
+_VIDEO_CALL_COLUMNS = (
+    "id, care_recipient_id, caregiver_id, scheduled_time, duration_seconds, status, "
+    "care_recipient_accepted, caregiver_accepted, video_call_url, completed_at, created_at"
+)
+_CHAT_SESSION_COLUMNS = "id, is_enabled"
+# Linked call as embedded in a booking row: enough to label it; the join URL,
+# acceptance flags etc. come from GET /video-calls.
+_BOOKING_VIDEO_CALL_COLUMNS = "id, status, scheduled_time, duration_seconds"
+
+
 def _normalize_embed(rows: list, alias: str) -> None:
     """Ensure embedded FK relation is a single dict (Supabase can return list)."""
     for row in rows:
@@ -40,13 +84,122 @@ def _normalize_embed(rows: list, alias: str) -> None:
             row[alias] = None
 
 
+# Status buckets (booking_status / payment_status enum members), hoisted so filters and
+# membership checks share one constant. Sorted when sent so query URLs are stable.
+_UPCOMING_STATUSES = frozenset({"requested", "accepted"})
+_UPCOMING_LIST_STATUSES = _UPCOMING_STATUSES | {"in_progress"}
+_ACTIVE_STATUS = "in_progress"
+_COMPLETED_STATUS = "completed"
+_PAID_STATUSES = frozenset({"captured", "completed"})
+
+
+def _head_count(role_col: str, user_id: str):
+    """bookings count query for one user: Postgres returns only the count header, no rows."""
+    return supabase_admin.table("bookings").select("id", count="exact", head=True).eq(role_col, user_id)
+
+
+async def _booking_stats(role: str, role_col: str, user_id: str, now: datetime):
+    """(upcoming, active, completed, earnings) for one user.
+
+    Reads the trigger-maintained dashboard_counters row and counts only the
+    time-dependent "upcoming" bucket live. Falls back to one head-count query
+    per bucket when the counters row (or table) is not there yet. Earnings are
+    only reported for caregivers.
+    """
+    # DB enum has no "pending": upcoming means requested/accepted and still in the future
+    upcoming_q = _head_count(role_col, user_id) \
+        .in_("status", sorted(_UPCOMING_STATUSES)).gt("scheduled_date", now.isoformat())
+
+    async def counters_row():
+        try:
+            res = await asyncio.to_thread(
+                supabase_admin.table("dashboard_counters")
+                .select("active, completed, earnings").eq("user_id", user_id).limit(1).execute
+            )
+            return res.data[0] if res.data else None
+        except Exception:
+            return None
+
+    counters, upcoming = await asyncio.gather(counters_row(), _count_or_zero(upcoming_q))
+    if counters is not None:
+        earnings = float(counters.get("earnings") or 0) if role == "caregiver" else 0.0
+        return (upcoming, int(counters.get("active") or 0),
+                int(counters.get("completed") or 0), earnings)
+
+    async def paid_total() -> float:
+        if role != "caregiver":
+            return 0.0
+        try:
+            res = await asyncio.to_thread(
+                supabase_admin.rpc("caregiver_total_earnings", {"cg_id": user_id}).execute
+            )
+            return float(res.data or 0)
+        except Exception:
+            # Function not deployed yet: sum the paid rows here
+            res = await asyncio.to_thread(
+                supabase_admin.table("bookings").select("amount").eq(role_col, user_id)
+                .in_("payment_status", sorted(_PAID_STATUSES)).execute
+            )
+            return sum(float(b.get("amount") or 0) for b in res.data or [])
+
+    active, completed, earnings = await asyncio.gather(
+        _count_or_zero(_head_count(role_col, user_id).eq("status", _ACTIVE_STATUS)),
+        _count_or_zero(_head_count(role_col, user_id).eq("status", _COMPLETED_STATUS)),
+        paid_total(),
+    )
+    return upcoming, active, completed, earnings
+
+
+def _dump_rows(rows: list) -> bytes:
+    """Encode PostgREST rows as-is: they are already JSON-shaped, so they are not validated."""
+    return orjson.dumps(rows)
+
+
+def _documented_as(model) -> dict:
+    """responses= entry for an endpoint that returns unvalidated rows: the schema is OpenAPI-only.
+
+    Used instead of response_model, which FastAPI would skip on the raw-bytes path but
+    enforce on the fallbacks, advertising a contract the endpoint doesn't keep.
+    """
+    return {200: {"model": model, "description": "Rows as selected, passed through without validation."}}
+
+
+def _conditional_json(request: Request, body: bytes,
+                      cache_control: str = _REVALIDATE_CACHE_CONTROL) -> Response:
+    """Serve already-serialised JSON with a weak content ETag; 304 when the client has it."""
+    etag = f'W/"{hashlib.md5(body).hexdigest()}"'
+    headers = {"ETag": etag, "Cache-Control": cache_control}
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and etag in (t.strip() for t in if_none_match.split(",")):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+async def _count_or_zero(query) -> int:
+    """Run a count="exact" query off the event loop; 0 on any error."""
+    try:
+        res = await asyncio.to_thread(query.execute)
+        return res.count or 0
+    except Exception:
+        return 0
+
+
+async def _caregiver_rating(user_id: str) -> float:
+    try:
+        cp_res = await asyncio.to_thread(
+            supabase_admin.table("caregiver_profile").select("avg_rating").eq("user_id", user_id).execute
+        )
+        return float((cp_res.data[0] or {}).get("avg_rating") or 0.0) if cp_res.data else 0.0
+    except Exception:
+        return 0.0
+
+
 async def _resolve_role(user_id: str, current_user: dict) -> Optional[str]:
     """Get role from DB first (source of truth), then fall back to auth metadata or current_user.role."""
     try:
-        uid = str(user_id)
-        res = supabase_admin.table("users").select("role").eq("id", uid).limit(1).execute()
-        if res.data and len(res.data) > 0 and res.data[0].get("role"):
-            return res.data[0].get("role")
+        role = await get_user_role(user_id)
+        if role:
+            return role
     except Exception:
         pass
     role = (current_user.get("user_metadata") or {}).get("role")
@@ -56,86 +209,134 @@ async def _resolve_role(user_id: str, current_user: dict) -> Optional[str]:
     return role if role in ("care_recipient", "caregiver") else None
 
 
+async def _compute_stats(user_id: str, role: str, rating: float) -> bytes:
+    """Serialised DashboardStats for a user whose role is known; stored in the stats cache."""
+    role_col, other_role_col, other_role_alias = _get_role_col(role)
+
+    # Bookings, video calls and chat sessions are independent: one round-trip of wall time
+    (upcoming, active, completed, earnings), pending_calls, active_chats = await asyncio.gather(
+        _booking_stats(role, role_col, user_id, datetime.now(timezone.utc)),
+        _count_or_zero(supabase_admin.table("video_call_requests")
+                       .select("id", count="exact", head=True).eq(role_col, user_id).eq("status", "pending")),
+        _count_or_zero(supabase_admin.table("chat_sessions")
+                       .select("id", count="exact", head=True).eq(role_col, user_id).eq("is_enabled", True)),
+    )
+
+    stats = DashboardStats(
+        upcoming_bookings=upcoming, active_bookings=active,
+        completed_bookings=completed, pending_video_calls=pending_calls,
+        active_chat_sessions=active_chats, total_earnings=earnings,
+        avg_rating=rating if role == "caregiver" else 0.0
+    )
+    body = stats.model_dump_json().encode()
+    set_cached_stats(user_id, body)
+    return body
+
+
+async def _fetch_upcoming(role: str, user_id: str, limit: int) -> list:
+    """Bookings in the next 7 days that still need action, soonest first."""
+    now = datetime.now(timezone.utc)
+    next_week = now + timedelta(days=7)
+    role_col, other_role_col, other_role_alias = _get_role_col(role)
+
+    res = await asyncio.to_thread(
+        supabase_admin.table("bookings")
+        .select(f"{_BOOKING_COLUMNS}, {other_role_alias}:{other_role_col}({_USER_SUMMARY_COLUMNS})")
+        .eq(role_col, user_id)
+        .gte("scheduled_date", now.isoformat())
+        .lte("scheduled_date", next_week.isoformat())
+        .in_("status", sorted(_UPCOMING_LIST_STATUSES))
+        .order("scheduled_date", desc=False).limit(limit).execute
+    )
+    data = res.data or []
+    _normalize_embed(data, other_role_alias)
+    return data
+
+
 @router.get("/stats", response_model=DashboardStats)
-async def get_dashboard_stats(current_user: dict = Depends(get_current_user)):
-    """Get dashboard statistics for current user — Supabase client only."""
+async def get_dashboard_stats(request: Request, current_user: dict = Depends(get_current_user)):
+    """Get dashboard statistics for current user (dashboard_counters plus a live upcoming count)."""
     try:
         user_id = str(current_user.get("id") or "")
         if not user_id:
             return DashboardStats(upcoming_bookings=0, active_bookings=0,
                                   completed_bookings=0, pending_video_calls=0,
                                   active_chat_sessions=0)
-        role = await _resolve_role(user_id, current_user)
+        cached = get_cached_stats(user_id)
+        if cached is not None:
+            return _conditional_json(request, cached, _SUMMARY_CACHE_CONTROL)
+
+        # The rating lookup only matters for caregivers, but it is keyed by user_id alone,
+        # so it runs speculatively alongside the role lookup and is dropped for recipients.
+        role, rating = await asyncio.gather(
+            _resolve_role(user_id, current_user), _caregiver_rating(user_id)
+        )
 
         if not role:
             return DashboardStats(upcoming_bookings=0, active_bookings=0,
                                   completed_bookings=0, pending_video_calls=0,
                                   active_chat_sessions=0)
 
-        role_col, other_role_col, other_role_alias = _get_role_col(role)
-
-        # 1. Bookings stats
-        b_res = supabase_admin.table("bookings") \
-            .select("status, scheduled_date, amount, payment_status") \
-            .eq(role_col, user_id).execute()
-        b_data = b_res.data or []
-
-        now = datetime.now(timezone.utc)
-        upcoming = sum(
-            1 for b in b_data
-            if b.get("status") in ["requested", "pending", "accepted"]
-            and (b.get("scheduled_date") is None or (
-                datetime.fromisoformat(b["scheduled_date"].replace("Z", "+00:00")) > now
-            ))
-        )
-        active = sum(1 for b in b_data if b.get("status") == "in_progress")
-        completed = sum(1 for b in b_data if b.get("status") == "completed")
-        earnings = sum(
-            float(b.get("amount") or 0) for b in b_data
-            if b.get("payment_status") in ["captured", "completed"]
-        )
-
-        # 2. Video calls
-        try:
-            v_res = supabase_admin.table("video_call_requests") \
-                .select("id", count="exact").eq(role_col, user_id).eq("status", "pending").execute()
-            pending_calls = v_res.count or 0
-        except Exception:
-            pending_calls = 0
-
-        # 3. Chat sessions
-        try:
-            c_res = supabase_admin.table("chat_sessions") \
-                .select("id", count="exact").eq(role_col, user_id).eq("is_enabled", True).execute()
-            active_chats = c_res.count or 0
-        except Exception:
-            active_chats = 0
-
-        # 4. Rating (caregivers only)
-        rating = 0.0
-        if role == "caregiver":
-            try:
-                cp_res = supabase_admin.table("caregiver_profile") \
-                    .select("avg_rating").eq("user_id", user_id).execute()
-                rating = float((cp_res.data[0] or {}).get("avg_rating") or 0.0) if cp_res.data else 0.0
-            except Exception:
-                rating = 0.0
-
-        return DashboardStats(
-            upcoming_bookings=upcoming, active_bookings=active,
-            completed_bookings=completed, pending_video_calls=pending_calls,
-            active_chat_sessions=active_chats, total_earnings=earnings, avg_rating=rating
-        )
+        return _conditional_json(request, await _compute_stats(user_id, role, rating), _SUMMARY_CACHE_CONTROL)
 
     except Exception as e:
-        sys.stderr.write(f"[DASHBOARD] stats error: {e}\n"); sys.stderr.flush()
+        logger.warning("stats error: %s", e)
         return DashboardStats(upcoming_bookings=0, active_bookings=0,
                               completed_bookings=0, pending_video_calls=0,
                               active_chat_sessions=0)
 
 
-@router.get("/bookings", response_model=List[dict])
+@router.get("/bootstrap", response_model=None, responses=_documented_as(DashboardBootstrap))
+async def get_dashboard_bootstrap(
+    request: Request,
+    limit: int = Query(10, ge=1, le=50),
+    current_user: dict = Depends(get_current_user)
+):
+    """Stats and upcoming bookings in one call, for the dashboard's first render.
+
+    Same data as /stats plus /upcoming, with one role lookup and both fetched concurrently.
+    The upcoming rows are passed through unvalidated, as in /upcoming.
+    """
+    empty = DashboardBootstrap(
+        stats=DashboardStats(upcoming_bookings=0, active_bookings=0,
+                             completed_bookings=0, pending_video_calls=0,
+                             active_chat_sessions=0),
+        upcoming=[]
+    )
+    try:
+        user_id = str(current_user.get("id") or "")
+        if not user_id:
+            return empty
+        cached = get_cached_stats(user_id)
+        if cached is None:
+            role, rating = await asyncio.gather(
+                _resolve_role(user_id, current_user), _caregiver_rating(user_id)
+            )
+        else:
+            role, rating = await _resolve_role(user_id, current_user), 0.0
+        if not role:
+            return empty
+
+        if cached is None:
+            stats_body, upcoming = await asyncio.gather(
+                _compute_stats(user_id, role, rating), _fetch_upcoming(role, user_id, limit)
+            )
+        else:
+            stats_body, upcoming = cached, await _fetch_upcoming(role, user_id, limit)
+
+        # Splice the already-serialised parts instead of re-encoding the stats
+        upcoming_body = _dump_rows(upcoming)
+        body = b'{"stats":' + stats_body + b',"upcoming":' + upcoming_body + b"}"
+        return _conditional_json(request, body)
+
+    except Exception as e:
+        logger.warning("bootstrap error: %s", e)
+        return empty
+
+
+@router.get("/bookings", response_model=None, responses=_documented_as(List[DashboardBooking]))
 async def get_dashboard_bookings(
+    request: Request,
     status_filter: Optional[str] = Query(None, alias="status"),
     is_recurring: Optional[bool] = Query(None),
     upcoming_only: Optional[bool] = Query(False),
@@ -143,72 +344,55 @@ async def get_dashboard_bookings(
     offset: int = Query(0, ge=0),
     current_user: dict = Depends(get_current_user)
 ):
-    """Get bookings for dashboard — Supabase client only."""
+    """Get bookings for dashboard from dashboard_bookings_v. Rows are passed through unvalidated."""
     try:
         user_id = str(current_user.get("id") or "")
         if not user_id:
             return []
         role = await _resolve_role(user_id, current_user)
         if not role:
-            sys.stderr.write(f"[DASHBOARD] bookings: no role resolved for user_id={user_id[:8]}...\n")
-            sys.stderr.flush()
+            logger.warning("bookings: no role resolved for user_id=%s...", user_id[:8])
             return []
 
         role_col, other_role_col, other_role_alias = _get_role_col(role)
 
-        query = supabase_admin.table("bookings") \
-            .select(f"*, {other_role_alias}:{other_role_col}(*), "
-                    f"video_call_request:video_call_request_id(*), "
-                    f"chat_session:chat_session_id(*)") \
-            .eq(role_col, user_id)
+        statuses = _normalize_booking_status_filter(status_filter.split(",")) if status_filter else []
 
-        if status_filter:
-            statuses = _normalize_booking_status_filter(status_filter.split(","))
-            if statuses:
-                query = query.in_("status", statuses)
+        # Pre-joined view (20260305_dashboard_bookings_view.sql): the counterparty, call and
+        # chat arrive as JSON columns, so PostgREST resolves no embeds here. The participant
+        # filter goes through booking_participants' (user_id, booking_id) key for either role.
+        query = supabase_admin.table("dashboard_bookings_v") \
+            .select(f"{_BOOKING_COLUMNS}, {other_role_alias}, video_call_request, chat_session") \
+            .eq("participant_id", user_id).eq("participant_role", role)
+        if statuses:
+            query = query.in_("status", statuses)
         if is_recurring is not None:
             query = query.eq("is_recurring", is_recurring)
-
-        # When upcoming_only: fetch more rows then filter in Python, because PostgREST or_()
-        # with ISO timestamps (colons) can be unreliable; we want scheduled_date >= now OR null.
         if upcoming_only:
-            now_utc = datetime.now(timezone.utc)
-            # Fetch enough to allow filtering (status already limits the set)
-            res = query.order("scheduled_date", desc=False).range(offset, offset + limit * 3 - 1).execute()
-            raw = res.data or []
-            filtered = []
-            for b in raw:
-                sd = b.get("scheduled_date")
-                if sd is None:
-                    filtered.append(b)
-                else:
-                    try:
-                        dt = datetime.fromisoformat(sd.replace("Z", "+00:00"))
-                        if dt >= now_utc:
-                            filtered.append(b)
-                    except (TypeError, ValueError):
-                        filtered.append(b)
-            # Sort: dated first (asc), then nulls; then apply limit
-            filtered.sort(key=lambda x: (x.get("scheduled_date") is None, x.get("scheduled_date") or ""))
-            out = filtered[:limit]
-            _normalize_embed(out, other_role_alias)
-            return out
-        res = query.order("scheduled_date", desc=False).range(offset, offset + limit - 1).execute()
-        data = res.data or []
-        _normalize_embed(data, other_role_alias)
-        return data
+            # scheduled_date is NOT NULL, so "upcoming" is a plain range filter on the indexed column
+            query = query.gte("scheduled_date", datetime.now(timezone.utc).isoformat())
+        res = await asyncio.to_thread(
+            query.order("scheduled_date", desc=False).range(offset, offset + limit - 1).execute
+        )
+        raw = res.data or []
+
+        logger.debug("bookings user=%s role=%s count=%d", user_id[:8], role, len(raw))
+        _normalize_embed(raw, other_role_alias)
+        body = _dump_rows(raw)
+        return _conditional_json(request, body)
 
     except Exception as e:
-        sys.stderr.write(f"[DASHBOARD] bookings error: {e}\n"); sys.stderr.flush()
+        logger.warning("bookings error: %s", e)
         return []
 
 
-@router.get("/upcoming", response_model=List[dict])
+@router.get("/upcoming", response_model=None, responses=_documented_as(List[DashboardBooking]))
 async def get_upcoming_bookings(
+    request: Request,
     limit: int = Query(10, ge=1, le=50),
     current_user: dict = Depends(get_current_user)
 ):
-    """Get upcoming bookings (next 7 days)."""
+    """Get upcoming bookings (next 7 days). Rows are passed through unvalidated."""
     try:
         user_id = str(current_user.get("id") or "")
         if not user_id:
@@ -217,28 +401,28 @@ async def get_upcoming_bookings(
         if not role:
             return []
 
-        now = datetime.now(timezone.utc)
-        next_week = now + timedelta(days=7)
-        role_col, other_role_col, other_role_alias = _get_role_col(role)
-
-        res = supabase_admin.table("bookings") \
-            .select(f"*, {other_role_alias}:{other_role_col}(*)") \
-            .eq(role_col, user_id) \
-            .gte("scheduled_date", now.isoformat()) \
-            .lte("scheduled_date", next_week.isoformat()) \
-            .in_("status", ["requested", "accepted", "in_progress"]) \
-            .order("scheduled_date", desc=False).limit(limit).execute()
-
-        return res.data or []
+        data = await _fetch_upcoming(role, user_id, limit)
+        body = _dump_rows(data)
+        return _conditional_json(request, body, _SUMMARY_CACHE_CONTROL)
 
     except Exception as e:
-        sys.stderr.write(f"[DASHBOARD] upcoming error: {e}\n"); sys.stderr.flush()
+        logger.warning("upcoming error: %s", e)
         return []
 
 
-@router.get("/recurring", response_model=List[dict])
-async def get_recurring_bookings(current_user: dict = Depends(get_current_user)):
-    """Get all recurring bookings — Supabase client only."""
+@router.get("/recurring", response_model=None, responses=_documented_as(List[DashboardBooking]))
+async def get_recurring_bookings(
+    request: Request,
+    limit: int = Query(50, ge=1, le=200),
+    after: Optional[datetime] = Query(None, description="Keyset cursor: scheduled_date of the last row of the previous page"),
+    after_id: Optional[UUID] = Query(None, description="Keyset cursor: id of the last row of the previous page"),
+    current_user: dict = Depends(get_current_user)
+):
+    """Get recurring bookings, one keyset page at a time. Rows are passed through unvalidated.
+
+    The cursor is (scheduled_date, id) of the previous page's last row, so bookings sharing
+    a slot are not skipped at a page boundary. `after` alone keeps the older date-only cursor.
+    """
     try:
         user_id = str(current_user.get("id") or "")
         if not user_id:
@@ -249,26 +433,38 @@ async def get_recurring_bookings(current_user: dict = Depends(get_current_user))
 
         role_col, other_role_col, other_role_alias = _get_role_col(role)
 
-        res = supabase_admin.table("bookings") \
-            .select(f"*, {other_role_alias}:{other_role_col}(*)") \
-            .eq(role_col, user_id).eq("is_recurring", True) \
-            .order("scheduled_date", desc=False).limit(500).execute()
-
-        return res.data or []
+        query = supabase_admin.table("bookings") \
+            .select(f"{_BOOKING_COLUMNS}, {other_role_alias}:{other_role_col}({_USER_SUMMARY_COLUMNS})") \
+            .eq(role_col, user_id).eq("is_recurring", True)
+        if after is not None and after_id is not None:
+            ts = after.isoformat()
+            query = query.or_(f'scheduled_date.gt."{ts}",and(scheduled_date.eq."{ts}",id.gt.{after_id})')
+        elif after is not None:
+            query = query.gt("scheduled_date", after.isoformat())
+
+        # Served by idx_bookings_recurring_{caregiver,care_recipient} (partial, is_recurring)
+        res = await asyncio.to_thread(
+            query.order("scheduled_date", desc=False).order("id", desc=False).limit(limit).execute
+        )
+        data = res.data or []
+        _normalize_embed(data, other_role_alias)
+        body = _dump_rows(data)
+        return _conditional_json(request, body)
 
     except Exception as e:
-        sys.stderr.write(f"[DASHBOARD] recurring error: {e}\n"); sys.stderr.flush()
+        logger.warning("recurring error: %s", e)
         return []
 
 
-@router.get("/video-calls", response_model=List[dict])
+@router.get("/video-calls", response_model=None, responses=_documented_as(List[DashboardVideoCall]))
 async def get_dashboard_video_calls(
+    request: Request,
     status_filter: Optional[str] = Query(None, alias="status"),
     limit: int = Query(50, ge=1, le=100),
     offset: int = Query(0, ge=0),
     current_user: dict = Depends(get_current_user)
 ):
-    """Get video call requests for dashboard — Supabase client only."""
+    """Get video call requests for dashboard. Rows are passed through unvalidated."""
     try:
         user_id = str(current_user.get("id") or "")
         if not user_id:
@@ -280,17 +476,20 @@ async def get_dashboard_video_calls(
         role_col, other_role_col, other_role_alias = _get_role_col(role)
 
         query = supabase_admin.table("video_call_requests") \
-            .select(f"*, {other_role_alias}:{other_role_col}(*)") \
+            .select(f"{_VIDEO_CALL_COLUMNS}, {other_role_alias}:{other_role_col}({_USER_SUMMARY_COLUMNS})") \
             .eq(role_col, user_id)
 
         if status_filter:
             query = query.eq("status", status_filter)
 
-        res = query.order("scheduled_time", desc=False).range(offset, offset + limit - 1).execute()
+        res = await asyncio.to_thread(
+            query.order("scheduled_time", desc=False).range(offset, offset + limit - 1).execute
+        )
         data = res.data or []
         _normalize_embed(data, other_role_alias)
-        return data
+        body = _dump_rows(data)
+        return _conditional_json(request, body)
 
     except Exception as e:
-        sys.stderr.write(f"[DASHBOARD] video-calls error: {e}\n"); sys.stderr.flush()
+        logger.warning("video-calls error: %s", e)
         return []
@@ -10,11 +10,12 @@ from typing import Optional, Dict, Any, List
 from pydantic import BaseModel
 from app.dependencies import get_current_user
 from app.database import supabase_admin
-from app.services.notifications import notify_emergency_alert, notify_emergency_acknowledged
-import sys
+from app.services.notifications import notify_emergency_alert_bulk, notify_emergency_acknowledged
+import logging
 import uuid
 
 router = APIRouter()
+logger = logging.getLogger(__name__)
 
 # Request body for trigger
 class TriggerBody(BaseModel):
@@ -50,8 +51,7 @@ async def trigger_emergency(
     location = (body.location if body else None) or {}
 
     if not _ensure_emergencies_table():
-        sys.stderr.write(f"[EMERGENCY] trigger by {user_id} — emergencies table not found, returning stub\n")
-        sys.stderr.flush()
+        logger.warning("trigger by %s — emergencies table not found, returning stub", user_id)
         return {
             "status": "success",
             "emergency_id": "stub-" + str(uuid.uuid4())[:8],
@@ -88,19 +88,23 @@ async def trigger_emergency(
         caregivers_notified = 0
         caregiver_ids = []
         # Notify caregivers from active bookings for this care recipient
-        # Statuses: requested, pending (legacy), accepted, confirmed, in_progress
+        # (requested, accepted, confirmed, in_progress), de-duplicated in Postgres
         try:
-            bookings = supabase_admin.table("bookings") \
-                .select("caregiver_id") \
-                .eq("care_recipient_id", str(user_id)) \
-                .in_("status", ["requested", "pending", "accepted", "confirmed", "in_progress"]) \
-                .execute()
-            caregiver_ids = list({str(b["caregiver_id"]) for b in (bookings.data or []) if b.get("caregiver_id")})
-            sys.stderr.write(f"[EMERGENCY] Found {len(caregiver_ids)} caregiver(s) from bookings for user {user_id}\n")
-            sys.stderr.flush()
+            try:
+                rpc = supabase_admin.rpc("distinct_caregivers_for_recipient", {"rid": str(user_id)}).execute()
+                caregiver_ids = [str(r["caregiver_id"]) for r in (rpc.data or [])]
+            except Exception as rpc_err:
+                # Function not deployed yet: same query, de-duplicated here
+                logger.warning("distinct_caregivers_for_recipient unavailable (%s), querying bookings", rpc_err)
+                bookings = supabase_admin.table("bookings") \
+                    .select("caregiver_id") \
+                    .eq("care_recipient_id", str(user_id)) \
+                    .in_("status", ["requested", "accepted", "confirmed", "in_progress"]) \
+                    .execute()
+                caregiver_ids = list({str(b["caregiver_id"]) for b in (bookings.data or []) if b.get("caregiver_id")})
+            logger.debug("Found %s caregiver(s) from bookings for user %s", len(caregiver_ids), user_id)
         except Exception as e:
-            sys.stderr.write(f"[EMERGENCY] fetch caregivers failed: {e}\n")
-            sys.stderr.flush()
+            logger.warning("fetch caregivers failed: %s", e)
 
         # Fallback: if no caregivers from bookings, notify first few caregivers so alert is never silent
         if not caregiver_ids:
@@ -112,24 +116,19 @@ async def trigger_emergency(
                     .limit(20) \
                     .execute()
                 caregiver_ids = list({str(r["id"]) for r in (fallback.data or []) if r.get("id")})
-                sys.stderr.write(f"[EMERGENCY] No bookings; notifying {len(caregiver_ids)} caregiver(s) as fallback\n")
-                sys.stderr.flush()
+                logger.warning("No bookings; notifying %s caregiver(s) as fallback", len(caregiver_ids))
             except Exception as e2:
-                sys.stderr.write(f"[EMERGENCY] fallback caregiver fetch failed: {e2}\n")
-                sys.stderr.flush()
+                logger.warning("fallback caregiver fetch failed: %s", e2)
 
-        for cid in caregiver_ids:
-            try:
-                await notify_emergency_alert(
-                    caregiver_id=str(cid),
-                    care_recipient_name=care_recipient_name,
-                    emergency_id=emergency_id,
-                    location=location
-                )
-                caregivers_notified += 1
-            except Exception as nerr:
-                sys.stderr.write(f"[EMERGENCY] notify caregiver {cid} failed: {nerr}\n")
-                sys.stderr.flush()
+        try:
+            caregivers_notified = await notify_emergency_alert_bulk(
+                caregiver_ids=caregiver_ids,
+                care_recipient_name=care_recipient_name,
+                emergency_id=emergency_id,
+                location=location
+            )
+        except Exception as nerr:
+            logger.warning("notify %s caregiver(s) failed: %s", len(caregiver_ids), nerr)
 
         return {
             "status": "success",
@@ -138,8 +137,7 @@ async def trigger_emergency(
             "caregivers_notified": caregivers_notified
         }
     except Exception as e:
-        sys.stderr.write(f"[EMERGENCY] trigger error: {e}\n")
-        sys.stderr.flush()
+        logger.warning("trigger error: %s", e)
         return {
             "status": "error",
             "emergency_id": None,
@@ -186,8 +184,7 @@ async def acknowledge_emergency(
             pass
         return {"status": "success", "message": "Emergency acknowledged."}
     except Exception as e:
-        sys.stderr.write(f"[EMERGENCY] acknowledge error: {e}\n")
-        sys.stderr.flush()
+        logger.warning("acknowledge error: %s", e)
         return {"status": "error", "message": "Could not acknowledge emergency."}
 
 
@@ -210,8 +207,7 @@ async def resolve_emergency(
             .execute()
         return {"status": "success", "message": "Emergency resolved."}
     except Exception as e:
-        sys.stderr.write(f"[EMERGENCY] resolve error: {e}\n")
-        sys.stderr.flush()
+        logger.warning("resolve error: %s", e)
         return {"status": "error", "message": "Could not resolve emergency."}
 
 
@@ -272,8 +268,7 @@ async def get_emergency_status(
             "location": row.get("location")
         }
     except Exception as e:
-        sys.stderr.write(f"[EMERGENCY] status error: {e}\n")
-        sys.stderr.flush()
+        logger.warning("status error: %s", e)
         return {
             "id": emergency_id,
             "status": "unknown",
@@ -1,14 +1,12 @@
 from fastapi import APIRouter, HTTPException, Depends
 from pydantic import BaseModel
-from google.oauth2 import id_token
-from google.auth.transport import requests as google_requests
 import os
 from typing import Optional
-from datetime import datetime, timedelta, timezone
-from jose import jwt
+from datetime import datetime, timezone
 
 from ..database import supabase, supabase_admin
 from ..config import settings
+from ..services.tokens import issue_custom_tokens
 
 router = APIRouter()
 
@@ -19,6 +17,19 @@ GOOGLE_CLIENT_IDS = [
     getattr(settings, "GOOGLE_ANDROID_CLIENT_ID", None) or os.getenv("GOOGLE_ANDROID_CLIENT_ID", ""),
 ]
 
+# google-auth is imported on the first sign-in, not at app start; the transport Request is reused
+_google_request = None
+
+
+def _verify_google_id_token(token: str, client_id: str) -> dict:
+    global _google_request
+    from google.oauth2 import id_token
+    if _google_request is None:
+        from google.auth.transport import requests as google_requests
+        _google_request = google_requests.Request()
+    return id_token.verify_oauth2_token(token, _google_request, client_id)
+
+
 class GoogleAuthRequest(BaseModel):
     id_token: str
     role: str  # "care_recipient" or "caregiver"
@@ -52,11 +63,7 @@ async def google_auth(payload: GoogleAuthRequest):
         last_error = None
         for client_id in valid_client_ids:
             try:
-                idinfo = id_token.verify_oauth2_token(
-                    payload.id_token,
-                    google_requests.Request(),
-                    client_id
-                )
+                idinfo = _verify_google_id_token(payload.id_token, client_id)
                 break
             except ValueError as e:
                 last_error = e
@@ -144,30 +151,8 @@ async def google_auth(payload: GoogleAuthRequest):
                     }
                     supabase.table("caregiver_profile").insert(caregiver_data).execute()
             
-            # Generate JWT access token
-            access_token_expires = timedelta(days=7)
-            access_token = jwt.encode(
-                {
-                    "sub": user_id,
-                    "email": email,
-                    "exp": datetime.now(timezone.utc) + access_token_expires,
-                },
-                settings.SECRET_KEY,
-                algorithm="HS256",
-            )
-            
-            # Generate refresh token (longer expiry)
-            refresh_token_expires = timedelta(days=30)
-            refresh_token = jwt.encode(
-                {
-                    "sub": user_id,
-                    "email": email,
-                    "exp": datetime.now(timezone.utc) + refresh_token_expires,
-                    "type": "refresh",
-                },
-                settings.SECRET_KEY,
-                algorithm="HS256",
-            )
+            # Generate JWT access + refresh tokens
+            access_token, refresh_token = issue_custom_tokens(user_id, email)
             
             # Get user data
             # Get user data - use limit(1) instead of single() to avoid errors
@@ -3,6 +3,7 @@ from datetime import datetime, timezone
 from app.schemas import LocationUpdate, LocationResponse
 from app.database import supabase
 from app.dependencies import get_current_user
+from app.cache.profile_cache import invalidate_user_profile
 
 router = APIRouter()
 
@@ -25,6 +26,7 @@ async def update_location(
         response = supabase.table("users").update({
             "current_location": location_dict
         }).eq("id", current_user["id"]).execute()
+        invalidate_user_profile(current_user["id"])
         
         if not response.data:
             raise HTTPException(
@@ -2,14 +2,14 @@
 Razorpay Payment Integration Router
 Handles payment order creation, verification, and webhook processing
 """
-from fastapi import APIRouter, HTTPException, status, Depends, Header
+from fastapi import APIRouter, HTTPException, status, Depends, Header, Request
 from datetime import datetime, timezone
 from typing import Optional, Dict, Any
 from pydantic import BaseModel, Field
-import razorpay
 import hmac
 import hashlib
 import json
+import logging
 
 from app.database import supabase_admin
 from app.dependencies import get_current_user, verify_care_recipient
@@ -27,8 +27,25 @@ from app.error_handler import (
     ConflictError,
 )
 from app.routers.bookings import validate_booking_transition
+from app.cache.stats_cache import invalidate_dashboard_stats
 
-router = APIRouter()
+access_logger = logging.getLogger("assistlink.access")
+
+
+async def _log_payment_request(request: Request) -> None:
+    """Extra access-log line for payment calls; a router dependency, so other routes never pay for it."""
+    auth_header = request.headers.get("authorization")  # Starlette headers are case-insensitive
+    access_logger.info(
+        "[%s] PAYMENT REQUEST %s %s auth=%s",
+        getattr(request.state, "request_id", "-"), request.method, request.url,
+        "Present" if auth_header else "Missing",
+    )
+
+
+# Diagnostic only: in production the dependency isn't attached at all
+_PAYMENT_DEBUG = settings.ENVIRONMENT != "production"
+
+router = APIRouter(dependencies=[Depends(_log_payment_request)] if _PAYMENT_DEBUG else [])
 
 # Initialize Razorpay client
 _razorpay_client = None
@@ -47,6 +64,8 @@ def get_razorpay_client():
         if settings.RAZORPAY_KEY_ID and settings.RAZORPAY_KEY_SECRET:
             try:
                 sys.stderr.write(f"[DEBUG] Attempting to create Razorpay client...\n")
+                # Imported here so the SDK stays off cold start until the first payment call
+                import razorpay
                 _razorpay_client = razorpay.Client(auth=(settings.RAZORPAY_KEY_ID, settings.RAZORPAY_KEY_SECRET))
                 sys.stderr.write("[INFO] Razorpay client initialized successfully\n")
             except Exception as e:
@@ -205,6 +224,7 @@ async def create_payment_order(
                 raise DatabaseError("Failed to update booking")
             
             updated_booking = update_response.data[0]
+            invalidate_dashboard_stats(booking.get("care_recipient_id"), booking.get("caregiver_id"))
             
             # Enable chat session
             chat_session_id = None
@@ -235,6 +255,8 @@ async def create_payment_order(
                 supabase_admin.table("bookings").update({
                     "chat_session_id": chat_session_id
                 }).eq("id", request.booking_id).execute()
+            # The chat session now counts as active for both parties
+            invalidate_dashboard_stats(booking.get("care_recipient_id"), booking.get("caregiver_id"))
             
             # Mark caregiver as unavailable
             try:
@@ -325,6 +347,7 @@ async def create_payment_order(
                     "currency": currency,
                     "payment_status": "pending"
                 }).eq("id", request.booking_id).execute()
+                invalidate_dashboard_stats(booking.get("care_recipient_id"), booking.get("caregiver_id"))
                 
                 return CreatePaymentOrderResponse(
                     order_id=order["id"],
@@ -454,6 +477,7 @@ async def verify_payment(
             raise DatabaseError("Failed to update booking")
         
         updated_booking = booking_update_response.data[0]
+        invalidate_dashboard_stats(booking.get("care_recipient_id"), booking.get("caregiver_id"))
         
         # Initialize chat_session_id variable
         chat_session_id = None
@@ -506,6 +530,8 @@ async def verify_payment(
                 supabase_admin.table("bookings").update({
                     "chat_session_id": chat_session_id
                 }).eq("id", booking["id"]).execute()
+            # The chat session now counts as active for both parties
+            invalidate_dashboard_stats(booking.get("care_recipient_id"), updated_booking.get("caregiver_id"))
             
             # Send notifications
             try:
@@ -602,6 +628,7 @@ async def razorpay_webhook(
                             "payment_completed_at": datetime.now(timezone.utc).isoformat(),
                             "status": "confirmed",
                         }).eq("id", booking["id"]).execute()
+                        invalidate_dashboard_stats(booking.get("care_recipient_id"), booking.get("caregiver_id"))
                         
                         sys.stderr.write(f"[INFO] Booking {booking['id']} updated via webhook\n")
                         sys.stderr.flush()
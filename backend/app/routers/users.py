@@ -3,6 +3,7 @@ from datetime import datetime
 from app.schemas import UserUpdate, UserResponse
 from app.database import supabase, supabase_admin
 from app.dependencies import get_current_user, get_user_id
+from app.cache.profile_cache import invalidate_user_profile
 
 # Bucket for profile photos in Supabase Storage (create in Dashboard and set to public)
 PROFILE_PHOTOS_BUCKET = "profile-photos"
@@ -134,6 +135,7 @@ async def update_profile(
         except Exception as update_error:
             # If RLS blocks the update, try with admin client
             response = supabase_admin.table("users").update(update_data).eq("id", user_id_str).execute()
+        invalidate_user_profile(user_id_str)
         
         if not response.data or len(response.data) == 0:
             raise HTTPException(
@@ -200,6 +202,7 @@ async def upload_profile_photo(
 
         # Update user profile with new photo URL
         supabase_admin.table("users").update({"profile_photo_url": public_url}).eq("id", user_id_str).execute()
+        invalidate_user_profile(user_id_str)
 
         return {"profile_photo_url": public_url}
     except HTTPException:
@@ -1,5 +1,5 @@
-from pydantic import BaseModel, EmailStr, Field, field_validator, model_validator
-from typing import Optional, List, Dict, Any
+from pydantic import BaseModel, ConfigDict, EmailStr, Field, field_validator, model_validator
+from typing import Optional, List, Dict, Any, Literal
 from datetime import datetime
 from uuid import UUID
 from app.validators import (
@@ -99,16 +99,27 @@ class UserUpdate(BaseModel):
     emergency_contact: Optional[Dict[str, Any]] = None
 
 
-class UserResponse(UserBase):
+class UserBaseOut(BaseModel):
+    """UserBase fields without the input validators, for responses built from stored rows."""
+    model_config = ConfigDict(from_attributes=True)
+
+    email: str
+    full_name: str
+    phone: Optional[str] = None
+    date_of_birth: Optional[datetime] = None
+    role: str
+    address: Optional[Dict[str, Any]] = None
+    profile_photo_url: Optional[str] = None
+    emergency_contact: Optional[Dict[str, Any]] = None
+
+
+class UserResponse(UserBaseOut):
     id: UUID
     is_active: bool
     current_location: Optional[Dict[str, Any]] = None
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
-
 
 # Caregiver Profile Schemas
 class CaregiverProfileBase(BaseModel):
@@ -138,6 +149,8 @@ class CaregiverProfileUpdate(CaregiverProfileBase):
 
 
 class CaregiverProfileResponse(CaregiverProfileBase):
+    model_config = ConfigDict(from_attributes=True)
+
     id: UUID
     user_id: UUID
     avg_rating: float
@@ -145,9 +158,6 @@ class CaregiverProfileResponse(CaregiverProfileBase):
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
-
 
 # Video Call Request Schemas
 class VideoCallRequestCreate(BaseModel):
@@ -157,6 +167,8 @@ class VideoCallRequestCreate(BaseModel):
 
 
 class VideoCallRequestResponse(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
     id: UUID
     care_recipient_id: UUID
     caregiver_id: UUID
@@ -169,9 +181,6 @@ class VideoCallRequestResponse(BaseModel):
     completed_at: Optional[datetime] = None
     created_at: datetime
 
-    class Config:
-        from_attributes = True
-
 
 class VideoCallFromChatRequest(BaseModel):
     chat_session_id: UUID
@@ -187,6 +196,8 @@ class VideoCallStatusUpdate(BaseModel):
 
 # Chat Session Schemas
 class ChatSessionResponse(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
     id: UUID
     care_recipient_id: UUID
     caregiver_id: UUID
@@ -197,9 +208,6 @@ class ChatSessionResponse(BaseModel):
     enabled_at: Optional[datetime] = None
     created_at: datetime
 
-    class Config:
-        from_attributes = True
-
 
 class ChatAcceptRequest(BaseModel):
     accept: bool
@@ -249,6 +257,8 @@ class BookingUpdate(BaseModel):
 
 
 class BookingResponse(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
     id: UUID
     care_recipient_id: UUID
     caregiver_id: Optional[UUID] = None
@@ -271,15 +281,14 @@ class BookingResponse(BaseModel):
     completed_at: Optional[datetime] = None
     end_date: Optional[datetime] = None
     created_at: datetime
-    caregiver: Optional[UserBase] = None
-    care_recipient: Optional[UserBase] = None
+    caregiver: Optional[UserBaseOut] = None
+    care_recipient: Optional[UserBaseOut] = None
     updated_at: Optional[datetime] = None
 
-    class Config:
-        from_attributes = True
-
 
 class BookingHistoryResponse(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
     id: UUID
     booking_id: UUID
     previous_status: Optional[str]
@@ -288,9 +297,6 @@ class BookingHistoryResponse(BaseModel):
     reason: Optional[str]
     created_at: datetime
 
-    class Config:
-        from_attributes = True
-
 
 class BookingNoteCreate(BaseModel):
     note: str = Field(..., min_length=1)
@@ -303,6 +309,8 @@ class BookingNoteCreate(BaseModel):
 
 
 class BookingNoteResponse(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
     id: UUID
     booking_id: UUID
     user_id: Optional[UUID]
@@ -310,9 +318,6 @@ class BookingNoteResponse(BaseModel):
     is_private: bool
     created_at: datetime
 
-    class Config:
-        from_attributes = True
-
 
 class BookingStatusUpdate(BaseModel):
     status: str = Field(..., pattern="^(requested|accepted|rejected|confirmed|in_progress|completed|cancelled)$")
@@ -386,6 +391,11 @@ class LocationResponse(BaseModel):
 
 
 # Dashboard Schemas
+# Mirrors the booking_status / payment_status Postgres enums.
+BookingStatus = Literal["draft", "requested", "accepted", "confirmed", "in_progress", "completed", "cancelled"]
+PaymentStatus = Literal["pending", "authorized", "initiated", "processing", "captured", "completed", "refunded", "failed"]
+
+
 class DashboardStats(BaseModel):
     upcoming_bookings: int
     active_bookings: int
@@ -396,6 +406,85 @@ class DashboardStats(BaseModel):
     avg_rating: float = 0.0
 
 
+class DashboardUserSummary(BaseModel):
+    """Counterparty embedded in dashboard listings."""
+    model_config = ConfigDict(from_attributes=True)
+
+    id: UUID
+    full_name: Optional[str] = None
+    phone: Optional[str] = None
+    profile_photo_url: Optional[str] = None
+
+
+class DashboardVideoCallSummary(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: UUID
+    care_recipient_id: Optional[UUID] = None
+    caregiver_id: Optional[UUID] = None
+    scheduled_time: Optional[datetime] = None
+    duration_seconds: Optional[int] = None
+    status: Optional[str] = None
+    care_recipient_accepted: Optional[bool] = None
+    caregiver_accepted: Optional[bool] = None
+    video_call_url: Optional[str] = None
+    completed_at: Optional[datetime] = None
+    created_at: Optional[datetime] = None
+
+
+class DashboardChatSessionSummary(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: UUID
+    is_enabled: Optional[bool] = None
+    care_recipient_accepted: Optional[bool] = None
+    caregiver_accepted: Optional[bool] = None
+    enabled_at: Optional[datetime] = None
+
+
+class DashboardBooking(BaseModel):
+    """Booking row as listed on the dashboard (see dashboard._BOOKING_COLUMNS)."""
+    model_config = ConfigDict(from_attributes=True)
+
+    id: UUID
+    care_recipient_id: Optional[UUID] = None
+    caregiver_id: Optional[UUID] = None
+    video_call_request_id: Optional[UUID] = None
+    chat_session_id: Optional[UUID] = None
+    service_type: Optional[str] = None
+    scheduled_date: Optional[datetime] = None
+    end_date: Optional[datetime] = None
+    duration_hours: Optional[float] = None
+    location: Optional[Dict[str, Any]] = None
+    specific_needs: Optional[str] = None
+    recurring_pattern: Optional[Dict[str, Any]] = None
+    is_recurring: Optional[bool] = None
+    status: BookingStatus
+    urgency_level: Optional[str] = None
+    amount: Optional[float] = None
+    currency: Optional[str] = None
+    payment_status: Optional[PaymentStatus] = None
+    accepted_at: Optional[datetime] = None
+    completed_at: Optional[datetime] = None
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+    caregiver: Optional[DashboardUserSummary] = None
+    care_recipient: Optional[DashboardUserSummary] = None
+    video_call_request: Optional[DashboardVideoCallSummary] = None
+    chat_session: Optional[DashboardChatSessionSummary] = None
+
+
+class DashboardVideoCall(DashboardVideoCallSummary):
+    caregiver: Optional[DashboardUserSummary] = None
+    care_recipient: Optional[DashboardUserSummary] = None
+
+
+class DashboardBootstrap(BaseModel):
+    """GET /api/dashboard/bootstrap: /stats and /upcoming in one response."""
+    stats: DashboardStats
+    upcoming: List[DashboardBooking]
+
+
 # Message Schemas
 class MessageCreate(BaseModel):
     content: str = Field(..., min_length=1)
@@ -409,6 +498,8 @@ class MessageCreate(BaseModel):
 
 
 class MessageResponse(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
     id: UUID
     chat_session_id: UUID
     sender_id: UUID
@@ -419,12 +510,11 @@ class MessageResponse(BaseModel):
     read_at: Optional[datetime] = None
     created_at: datetime
 
-    class Config:
-        from_attributes = True
-
 
 # Notification Schemas
 class NotificationResponse(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
     id: UUID
     user_id: UUID
     type: str
@@ -435,9 +525,6 @@ class NotificationResponse(BaseModel):
     read_at: Optional[datetime] = None
     created_at: datetime
 
-    class Config:
-        from_attributes = True
-
 
 class DeviceTokenCreate(BaseModel):
     device_token: str
@@ -460,6 +547,8 @@ class ReviewCreate(BaseModel):
 
 
 class ReviewResponse(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
     id: UUID
     booking_id: UUID
     rater_id: UUID
@@ -469,6 +558,3 @@ class ReviewResponse(BaseModel):
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
-
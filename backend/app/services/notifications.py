@@ -1,11 +1,113 @@
 """
 Notification service for creating and managing notifications
 """
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
+from pathlib import Path
+from app.cache.notification_dedupe import claim_notification, notification_key, release_notification
+from app.config import settings
 from app.database import supabase_admin
 from datetime import datetime
-import json
+import asyncio
+import logging
+import os
 import httpx
+import orjson
+
+logger = logging.getLogger(__name__)
+
+EXPO_PUSH_URL = "https://exp.host/--/api/v2/push/send"
+_EXPO_HEADERS = {
+    "Accept": "application/json",
+    "Accept-Encoding": "gzip, deflate",
+    "Content-Type": "application/json",
+}
+
+# FCM limit on messages per send_each / send_each_for_multicast call.
+FCM_MAX_BATCH_SIZE = 500
+
+_expo_client: Optional[httpx.AsyncClient] = None
+# Set by init_firebase() at startup: whether FCM is usable, firebase_admin.messaging,
+# and the per-platform configs shared by every native push.
+_fcm_ready: bool = False
+_fcm_messaging = None
+_APNS_DEFAULT = None
+_ANDROID_DEFAULT = None
+_ANDROID_EMERGENCY = None
+# Strong refs to in-flight background pushes so they aren't garbage-collected mid-send.
+_background_tasks: set = set()
+
+
+def _get_expo_client() -> httpx.AsyncClient:
+    """Shared Expo push client: keep-alive + HTTP/2 so concurrent pushes reuse one TLS connection."""
+    global _expo_client
+    if _expo_client is None or _expo_client.is_closed:
+        _expo_client = httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(max_keepalive_connections=100, max_connections=100),
+            timeout=10.0,
+        )
+    return _expo_client
+
+
+async def close_expo_client() -> None:
+    """Close the shared Expo push client (app shutdown)."""
+    global _expo_client
+    if _expo_client is not None:
+        await _expo_client.aclose()
+        _expo_client = None
+
+
+def init_firebase() -> bool:
+    """
+    Initialise the Firebase Admin SDK once and build the push configs that are the same
+    for every message. Called at app startup (send_push_notification never initialises
+    it); returns whether FCM can be used.
+    """
+    global _fcm_ready, _fcm_messaging, _APNS_DEFAULT, _ANDROID_DEFAULT, _ANDROID_EMERGENCY
+    if _fcm_ready:
+        return True
+
+    service_account_path = settings.FCM_SERVICE_ACCOUNT_PATH
+    google_app_creds = os.getenv("GOOGLE_APPLICATION_CREDENTIALS")
+    if not service_account_path and not google_app_creds:
+        logger.warning("FCM not configured: neither FCM_SERVICE_ACCOUNT_PATH nor GOOGLE_APPLICATION_CREDENTIALS set")
+        return False
+
+    try:
+        import firebase_admin
+        from firebase_admin import credentials, messaging
+
+        if not firebase_admin._apps:
+            if service_account_path:
+                if not os.path.isabs(service_account_path):
+                    project_root = Path(__file__).parent.parent.parent
+                    service_account_path = str(project_root / service_account_path)
+
+                if not os.path.exists(service_account_path):
+                    logger.error("FCM service account file not found at %s", service_account_path)
+                    return False
+
+                cred = credentials.Certificate(service_account_path)
+            else:
+                cred = credentials.ApplicationDefault()
+            firebase_admin.initialize_app(cred)
+            logger.info("Firebase Admin SDK initialized (%s)", "service account" if service_account_path else "ADC")
+
+        _APNS_DEFAULT = messaging.APNSConfig(payload=messaging.APNSPayload(aps=messaging.Aps(sound="default", badge=1)))
+        _ANDROID_DEFAULT = messaging.AndroidConfig(
+            priority="high",
+            notification=messaging.AndroidNotification(sound="default", channel_id="default", default_vibrate_timings=True),
+        )
+        _ANDROID_EMERGENCY = messaging.AndroidConfig(
+            priority="high",
+            notification=messaging.AndroidNotification(sound="default", channel_id="emergency", default_vibrate_timings=True),
+        )
+        _fcm_messaging = messaging
+        _fcm_ready = True
+        return True
+    except Exception as e:
+        logger.exception("Firebase init failed: %s", e)
+        return False
 
 
 async def create_notification(
@@ -13,7 +115,8 @@ async def create_notification(
     notification_type: str,
     title: str,
     body: str,
-    data: Optional[Dict[str, Any]] = None
+    data: Optional[Dict[str, Any]] = None,
+    wait_for_push: bool = False
 ) -> Optional[Dict[str, Any]]:
     """
     Create a notification for a user
@@ -24,17 +127,17 @@ async def create_notification(
         title: Notification title
         body: Notification body/message
         data: Additional data (JSONB) - can include IDs, metadata, etc.
+        wait_for_push: Await the push delivery instead of sending it in the background
     
     Returns:
-        Created notification dict or None if failed
+        Created notification dict, or None if failed or an identical notification
+        was already sent to this user within the dedupe window
     """
+    dedupe_key = notification_key(str(user_id), notification_type, title, body, data)
+    if not claim_notification(dedupe_key):
+        logger.debug("duplicate notification dropped (type=%s, user=%s)", notification_type, user_id)
+        return None
     try:
-        import sys
-        print(f"\n🔔 CREATING NOTIFICATION", file=sys.stderr, flush=True)
-        print(f"User ID: {user_id}", file=sys.stderr, flush=True)
-        print(f"Type: {notification_type}", file=sys.stderr, flush=True)
-        print(f"Title: {title}", file=sys.stderr, flush=True)
-        
         notification_dict = {
             "user_id": str(user_id),
             "type": notification_type,
@@ -44,37 +147,98 @@ async def create_notification(
             "data": data or {}
         }
         
-        response = supabase_admin.table("notifications").insert(notification_dict).execute()
+        response = await asyncio.to_thread(supabase_admin.table("notifications").insert(notification_dict).execute)
         
         if response.data and len(response.data) > 0:
             notification = response.data[0]
-            print(f"✅ Notification created in database with ID: {notification.get('id')}", file=sys.stderr, flush=True)
-            print(f"   User ID: {notification.get('user_id')}", file=sys.stderr, flush=True)
-            print(f"   Type: {notification.get('type')}", file=sys.stderr, flush=True)
-            # Trigger push notification (async, don't wait)
-            print(f"📤 Triggering push notification...", file=sys.stderr, flush=True)
-            try:
-                push_result = await send_push_notification(user_id, title, body, data, notification_type=notification_type)
-                if push_result:
-                    print(f"Push notification result: {push_result}", file=sys.stderr, flush=True)
-                else:
-                    print("Push not sent (user has no registered devices or send failed).", file=sys.stderr, flush=True)
-            except Exception as push_error:
-                print(f"⚠️ Push notification failed (but in-app notification created): {push_error}", file=sys.stderr, flush=True)
+            logger.debug("notification %s created (type=%s, user=%s)", notification.get("id"), notification_type, user_id)
+            # Trigger push notification (async, don't wait unless asked to)
+            push = _deliver_push(user_id, title, body, data, notification_type)
+            if wait_for_push:
+                await push
+            else:
+                task = asyncio.create_task(push)
+                _background_tasks.add(task)
+                task.add_done_callback(_background_tasks.discard)
             return notification
         else:
-            print(f"❌ Failed to create notification in database - no data returned", file=sys.stderr, flush=True)
-            print(f"   Response: {response}", file=sys.stderr, flush=True)
+            logger.error("notification insert returned no row (type=%s, user=%s)", notification_type, user_id)
         
+        release_notification(dedupe_key)
         return None
     except Exception as e:
-        import sys
-        import traceback
-        print(f"❌ Error creating notification (type={notification_type}, user_id={user_id}): {e}", file=sys.stderr, flush=True)
-        traceback.print_exc(file=sys.stderr)
+        logger.exception("Error creating notification (type=%s, user=%s): %s", notification_type, user_id, e)
+        release_notification(dedupe_key)
         return None
 
 
+async def create_notifications_bulk(rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Create notifications for several users at once.
+
+    Each row has user_id, type, title, message and optionally data. All rows go in
+    with a single insert; push notifications are then sent concurrently, and a
+    failure for one user does not hold up or cancel the others. Rows identical to
+    one sent within the dedupe window are skipped, as in create_notification.
+
+    Returns:
+        The created notification rows
+    """
+    keyed = []
+    for row in rows:
+        row = {**row, "user_id": str(row["user_id"]), "is_read": False, "data": row.get("data") or {}}
+        key = notification_key(row["user_id"], row["type"], row["title"], row["message"], row["data"])
+        if claim_notification(key):
+            keyed.append((key, row))
+    if not keyed:
+        return []
+
+    try:
+        response = await asyncio.to_thread(
+            supabase_admin.table("notifications").insert([row for _, row in keyed]).execute
+        )
+    except Exception:
+        for key, _ in keyed:
+            release_notification(key)
+        raise
+    created = response.data or []
+
+    results = await asyncio.gather(
+        *(
+            send_push_notification(str(n["user_id"]), n["title"], n["message"], n.get("data"), notification_type=n["type"])
+            for n in created
+        ),
+        return_exceptions=True
+    )
+    for n, result in zip(created, results):
+        if isinstance(result, Exception):
+            logger.warning("push to %s failed (in-app notification created): %s", n["user_id"], result)
+    return created
+
+
+async def _deliver_push(
+    user_id: str,
+    title: str,
+    body: str,
+    data: Optional[Dict[str, Any]],
+    notification_type: str
+) -> None:
+    """Send the push for an in-app notification that is already stored; never raises."""
+    try:
+        push_result = await send_push_notification(user_id, title, body, data, notification_type=notification_type)
+        if not push_result:
+            logger.debug("push not sent to %s (no registered devices or send failed)", user_id)
+    except Exception as push_error:
+        logger.warning("push to %s failed (in-app notification created): %s", user_id, push_error)
+
+
+async def _deactivate_tokens(tokens: List[str]) -> None:
+    """Mark device tokens the push service rejected as no longer registered."""
+    await asyncio.to_thread(
+        supabase_admin.table("user_devices").update({"is_active": False}).in_("device_token", tokens).execute
+    )
+
+
 async def send_push_notification(
     user_id: str,
     title: str,
@@ -96,27 +260,18 @@ async def send_push_notification(
         True if sent successfully to at least one device, False otherwise
     """
     try:
-        import sys
-        
-        import httpx
-        from app.config import settings
-        import os
-        from pathlib import Path
-        
-        print(f"\n=== PUSH NOTIFICATION DEBUG ===", file=sys.stderr, flush=True)
-        print(f"User ID: {user_id}", file=sys.stderr, flush=True)
-        print(f"Title: {title}", file=sys.stderr, flush=True)
-        
         # Get all active device tokens for user
-        print(f"Fetching devices for user_id: {user_id}", file=sys.stderr, flush=True)
-        devices_response = supabase_admin.table("user_devices").select("device_token, platform").eq("user_id", user_id).eq("is_active", True).execute()
+        devices_response = await asyncio.to_thread(
+            supabase_admin.table("user_devices").select("device_token, platform")
+            .eq("user_id", user_id).eq("is_active", True).execute
+        )
         
         if not devices_response.data:
-            print("ℹ️ No devices registered for this user — they need to open the app while logged in (with notification permission) to receive push.", file=sys.stderr, flush=True)
+            # They need to open the app while logged in (with notification permission) to register one
+            logger.debug("no active devices for user %s", user_id)
             return False
 
         devices = devices_response.data
-        print(f"Devices found: {len(devices)}", file=sys.stderr, flush=True)
         
         expo_tokens = []
         native_tokens = []
@@ -133,14 +288,13 @@ async def send_push_notification(
         
         # 1. Handle Expo Push Tokens
         if expo_tokens:
-            print(f"Sending to {len(expo_tokens)} Expo Push Tokens...", file=sys.stderr, flush=True)
             try:
                 is_emergency = notification_type == "emergency"
                 data_payload = data or {}
                 if is_emergency:
                     data_payload = {**data_payload, "notification_type": "emergency"}
                 # Expo requires all data values to be strings
-                data_str = {k: json.dumps(v) if not isinstance(v, str) else v for k, v in data_payload.items()}
+                data_str = {k: v if isinstance(v, str) else orjson.dumps(v, option=orjson.OPT_NON_STR_KEYS).decode() for k, v in data_payload.items()}
                 message = {
                     "to": expo_tokens,
                     "sound": "default",
@@ -152,127 +306,119 @@ async def send_push_notification(
                     "channelId": "emergency" if is_emergency else "default",
                 }
                 
-                async with httpx.AsyncClient() as client:
-                    response = await client.post(
-                        "https://exp.host/--/api/v2/push/send",
-                        json=message,
-                        headers={
-                            "Accept": "application/json",
-                            "Accept-Encoding": "gzip, deflate",
-                            "Content-Type": "application/json",
-                        }
-                    )
+                response = await _get_expo_client().post(
+                    EXPO_PUSH_URL, content=orjson.dumps(message), headers=_EXPO_HEADERS
+                )
+                
+                if response.status_code == 200:
+                    result = response.json()
+                    result_data = result.get('data', [])
+                    logger.debug("Expo accepted %d of %d tokens for %s", len(result_data), len(expo_tokens), user_id)
+                    success = True
                     
-                    if response.status_code == 200:
-                        result = response.json()
-                        result_data = result.get('data', [])
-                        print(f"✅ Expo API Response: {len(result_data)} receipts", file=sys.stderr, flush=True)
-                        success = True
-                        
-                        # Check for errors in individual receipts
-                        for i, receipt in enumerate(result_data):
-                            if receipt.get('status') == 'error':
-                                error_code = receipt.get('details', {}).get('error')
-                                print(f"❌ Error sending to token {expo_tokens[i]}: {error_code}", file=sys.stderr, flush=True)
-                                if error_code == 'DeviceNotRegistered':
-                                    # Deactivate invalid token
-                                    supabase_admin.table("user_devices").update({"is_active": False}).eq("device_token", expo_tokens[i]).execute()
-                    else:
-                        print(f"❌ Expo API Request Failed: {response.status_code} - {response.text}", file=sys.stderr, flush=True)
+                    # Check for errors in individual receipts; invalid tokens are deactivated in one update
+                    bad_tokens = []
+                    for i, receipt in enumerate(result_data):
+                        if receipt.get('status') == 'error':
+                            error_code = receipt.get('details', {}).get('error')
+                            logger.warning("Expo push to %s failed: %s", expo_tokens[i], error_code)
+                            if error_code == 'DeviceNotRegistered':
+                                bad_tokens.append(expo_tokens[i])
+                    if bad_tokens:
+                        await _deactivate_tokens(bad_tokens)
+                else:
+                    logger.error("Expo push request failed: %s - %s", response.status_code, response.text)
             except Exception as e:
-                print(f"❌ Error sending Expo notifications: {e}", file=sys.stderr, flush=True)
+                logger.error("Error sending Expo notifications: %s", e)
 
         # 2. Handle Native Tokens (Firebase Admin SDK)
         if native_tokens:
-            print(f"Process {len(native_tokens)} native tokens (FCM/APNS)...", file=sys.stderr, flush=True)
-            # Check if FCM is configured
-            service_account_path = settings.FCM_SERVICE_ACCOUNT_PATH
-            google_app_creds = os.getenv("GOOGLE_APPLICATION_CREDENTIALS")
-            
-            if not service_account_path and not google_app_creds:
-                 print("⚠️ FCM NOT CONFIGURED: Neither FCM_SERVICE_ACCOUNT_PATH nor GOOGLE_APPLICATION_CREDENTIALS set.", file=sys.stderr, flush=True)
+            # Settled once at startup; don't re-check config or the key file on every push
+            if not _fcm_ready:
+                logger.warning("FCM not initialised; skipping %d native device(s) for %s", len(native_tokens), user_id)
             else:
-                 # Initialize Firebase Admin SDK
-                 try:
-                    import firebase_admin
-                    from firebase_admin import credentials, messaging
-                    
-                    if not firebase_admin._apps:
-                        print(f"🔧 Initializing Firebase Admin SDK...", file=sys.stderr, flush=True)
-                        if service_account_path:
-                             print(f"   Using service account path: {service_account_path}", file=sys.stderr, flush=True)
-                             if not os.path.isabs(service_account_path):
-                                 project_root = Path(__file__).parent.parent.parent
-                                 service_account_path = str(project_root / service_account_path)
-                             
-                             if not os.path.exists(service_account_path):
-                                 print(f"❌ ERROR: Service account file not found at {service_account_path}", file=sys.stderr, flush=True)
-                                 return False
-                                 
-                             cred = credentials.Certificate(service_account_path)
-                             firebase_admin.initialize_app(cred)
-                        elif google_app_creds:
-                            print(f"   Using Application Default Credentials (ADC)", file=sys.stderr, flush=True)
-                            cred = credentials.ApplicationDefault()
-                            firebase_admin.initialize_app(cred)
-                        print("✅ Firebase Admin SDK initialized successfully.", file=sys.stderr, flush=True)
-                    
-                    # Send loop for native tokens
+                messaging = _fcm_messaging
+                try:
                     data_payload = data or {}
                     data_payload["type"] = data.get("type", "general") if data else "general"
                     if notification_type:
                         data_payload["notification_type"] = notification_type
                     is_emergency = notification_type == "emergency"
 
+                    # Everything but the token is the same for every device on a platform
+                    notification = messaging.Notification(title=title, body=body)
+                    data_str = {str(k): str(v) for k, v in data_payload.items()}
+                    android_config = _ANDROID_EMERGENCY if is_emergency else _ANDROID_DEFAULT
+                    webpush_config = messaging.WebpushConfig(
+                        notification=messaging.WebpushNotification(title=title, body=body, icon="/icon-192x192.png")
+                    )
+
+                    messages = []
                     for device in native_tokens:
                         device_token = device["device_token"]
                         platform = device["platform"]
+                        if platform == "ios":
+                            msg = messaging.Message(token=device_token, notification=notification, data=data_str, apns=_APNS_DEFAULT)
+                        elif platform == "android":
+                            msg = messaging.Message(token=device_token, notification=notification, data=data_str, android=android_config)
+                        else: # web
+                            msg = messaging.Message(token=device_token, notification=notification, webpush=webpush_config)
+                        messages.append(msg)
+
+                    # send_each fans a batch out over the SDK's worker pool instead of one
+                    # blocking round trip per device; run it off the event loop.
+                    sent = 0
+                    unregistered = []
+                    for start in range(0, len(messages), FCM_MAX_BATCH_SIZE):
+                        batch = messages[start:start + FCM_MAX_BATCH_SIZE]
                         try:
-                            if platform == "ios":
-                                msg = messaging.Message(
-                                    token=device_token,
-                                    notification=messaging.Notification(title=title, body=body),
-                                    data={str(k): str(v) for k, v in data_payload.items()},
-                                    apns=messaging.APNSConfig(payload=messaging.APNSPayload(aps=messaging.Aps(sound="default", badge=1)))
-                                )
-                            elif platform == "android":
-                                android_notif = messaging.AndroidNotification(
-                                    sound="default",
-                                    channel_id="emergency" if is_emergency else "default",
-                                    default_vibrate_timings=True,
-                                )
-                                msg = messaging.Message(
-                                    token=device_token,
-                                    notification=messaging.Notification(title=title, body=body),
-                                    data={str(k): str(v) for k, v in data_payload.items()},
-                                    android=messaging.AndroidConfig(priority="high", notification=android_notif)
-                                )
-                            else: # web
-                                msg = messaging.Message(
-                                    token=device_token,
-                                    notification=messaging.Notification(title=title, body=body),
-                                    webpush=messaging.WebpushConfig(notification=messaging.WebpushNotification(title=title, body=body, icon="/icon-192x192.png"))
-                                )
-                            response = messaging.send(msg)
-                            print(f"✅ FCM sent to {platform}: {response}", file=sys.stderr, flush=True)
-                            success = True
-                        except messaging.UnregisteredError:
-                             supabase_admin.table("user_devices").update({"is_active": False}).eq("device_token", device_token).execute()
+                            batch_response = await asyncio.to_thread(messaging.send_each, batch)
                         except Exception as e:
-                            print(f"❌ FCM Error: {e}", file=sys.stderr, flush=True)
-                 except Exception as e:
-                    print(f"❌ Firebase Init Error: {e}", file=sys.stderr, flush=True)
+                            logger.error("FCM send_each failed: %s", e)
+                            continue
+                        for msg, resp in zip(batch, batch_response.responses):
+                            if resp.success:
+                                sent += 1
+                            elif isinstance(resp.exception, messaging.UnregisteredError):
+                                unregistered.append(msg.token)
+                            else:
+                                logger.warning("FCM push to %s failed: %s", msg.token, resp.exception)
+                    if sent:
+                        logger.debug("FCM sent to %d of %d native devices for %s", sent, len(messages), user_id)
+                        success = True
+
+                    if unregistered:
+                        await _deactivate_tokens(unregistered)
+                except Exception as e:
+                    logger.error("FCM error: %s", e)
 
         return success
     except Exception as e:
-        print(f"❌ Error in send_push_notification: {e}", file=sys.stderr, flush=True)
-        import traceback
-        traceback.print_exc()
+        logger.exception("Error in send_push_notification: %s", e)
         return False
 
 
 # Helper functions for specific notification types
 
+_VIDEO_CALL_STATUS_TEXT = {
+    "accepted": "accepted",
+    "rejected": "declined",
+    "cancelled": "cancelled",
+    "in_progress": "started",
+    "completed": "ended",
+    "missed": "missed"
+}
+
+_BOOKING_STATUS_MESSAGES = {
+    "accepted": "has accepted your booking",
+    "declined": "has declined your booking",
+    "cancelled": "has cancelled the booking",
+    "confirmed": "booking has been confirmed",
+    "in_progress": "booking has started",
+    "completed": "booking has been completed"
+}
+
+
 async def notify_video_call_request(caregiver_id: str, care_recipient_name: str, video_call_id: str):
     """Notify caregiver about new video call request"""
     return await create_notification(
@@ -318,15 +464,7 @@ async def notify_video_call_accepted(user_id: str, other_party_name: str, video_
 
 async def notify_video_call_status_change(user_id: str, other_party_name: str, video_call_id: str, status: str):
     """Notify user about video call status updates."""
-    status_map = {
-        "accepted": "accepted",
-        "rejected": "declined",
-        "cancelled": "cancelled",
-        "in_progress": "started",
-        "completed": "ended",
-        "missed": "missed"
-    }
-    action_text = status_map.get(status, status)
+    action_text = _VIDEO_CALL_STATUS_TEXT.get(status, status)
     
     return await create_notification(
         user_id=user_id,
@@ -421,8 +559,7 @@ async def update_notifications_booking_status(
                 update_payload["message"] = "This booking has been completed."
             supabase_admin.table("notifications").update(update_payload).eq("id", row["id"]).execute()
     except Exception as e:
-        import sys
-        print(f"[WARN] update_notifications_booking_status failed: {e}", file=sys.stderr, flush=True)
+        logger.warning("update_notifications_booking_status failed: %s", e)
 
 
 async def notify_booking_status_change(
@@ -437,18 +574,10 @@ async def notify_booking_status_change(
     When caregiver rejects a request, status is 'cancelled' but we show 'declined' message.
     Pass is_caregiver_rejection=True in that case.
     """
-    status_messages = {
-        "accepted": "has accepted your booking",
-        "declined": "has declined your booking",
-        "cancelled": "has cancelled the booking",
-        "confirmed": "booking has been confirmed",
-        "in_progress": "booking has started",
-        "completed": "booking has been completed"
-    }
     message = (
-        status_messages["declined"]
+        _BOOKING_STATUS_MESSAGES["declined"]
         if is_caregiver_rejection
-        else status_messages.get(status, f"booking status changed to {status}")
+        else _BOOKING_STATUS_MESSAGES.get(status, f"booking status changed to {status}")
     )
     
     return await create_notification(
@@ -507,30 +636,59 @@ async def notify_booking_reminder(user_id: str, other_party_name: str, booking_i
     )
 
 
-async def notify_emergency_alert(caregiver_id: str, care_recipient_name: str, emergency_id: str, location: dict = None):
-    """Notify caregiver of emergency SOS - HIGH PRIORITY"""
+def _emergency_alert_content(care_recipient_name: str, emergency_id: str, location: dict = None):
+    """(title, body, data) shared by the single and bulk emergency alerts."""
     location_text = ""
     if location:
         lat = location.get("latitude", "")
         lng = location.get("longitude", "")
         if lat and lng:
             location_text = f" at location ({lat}, {lng})"
-    
-    return await create_notification(
-        user_id=caregiver_id,
-        notification_type="emergency",
-        title="🚨 Emergency Alert",
-        body=f"{care_recipient_name} triggered an emergency SOS!{location_text}",
-        data={
+    return (
+        "🚨 Emergency Alert",
+        f"{care_recipient_name} triggered an emergency SOS!{location_text}",
+        {
             "emergency_id": emergency_id,
             "care_recipient_name": care_recipient_name,
             "location": location or {},
             "action": "view_emergency",
             "priority": "high"
-        }
+        },
     )
 
 
+async def notify_emergency_alert(caregiver_id: str, care_recipient_name: str, emergency_id: str, location: dict = None):
+    """Notify caregiver of emergency SOS - HIGH PRIORITY"""
+    title, body, data = _emergency_alert_content(care_recipient_name, emergency_id, location)
+    return await create_notification(
+        user_id=caregiver_id,
+        notification_type="emergency",
+        title=title,
+        body=body,
+        data=data
+    )
+
+
+async def notify_emergency_alert_bulk(
+    caregiver_ids: List[str],
+    care_recipient_name: str,
+    emergency_id: str,
+    location: dict = None
+) -> int:
+    """
+    Notify many caregivers of an emergency SOS at once (see create_notifications_bulk).
+
+    Returns:
+        Number of caregivers an in-app notification was created for
+    """
+    title, body, data = _emergency_alert_content(care_recipient_name, emergency_id, location)
+    rows = [
+        {"user_id": cid, "type": "emergency", "title": title, "message": body, "data": data}
+        for cid in caregiver_ids
+    ]
+    return len(await create_notifications_bulk(rows))
+
+
 async def notify_emergency_acknowledged(care_recipient_id: str, caregiver_name: str, emergency_id: str):
     """Notify care recipient that caregiver acknowledged the emergency"""
     return await create_notification(
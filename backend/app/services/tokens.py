@@ -0,0 +1,59 @@
+"""
+HS256 tokens for custom (Google sign-in) sessions.
+
+Signing is hand-rolled on stdlib hmac with the constant header pre-encoded, since
+every refresh issues an access/refresh pair; verification goes through PyJWT.
+Tokens are standard JWTs, so app.dependencies (python-jose) reads them unchanged.
+"""
+import base64
+import hashlib
+import hmac
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Tuple
+
+import jwt as pyjwt
+import orjson
+
+from app.config import settings
+
+ACCESS_TOKEN_TTL = timedelta(days=7)
+REFRESH_TOKEN_TTL = timedelta(days=30)
+
+InvalidTokenError = pyjwt.InvalidTokenError
+
+_HEADER_B64 = base64.urlsafe_b64encode(b'{"alg":"HS256","typ":"JWT"}').rstrip(b"=")
+
+
+def _b64url(data: bytes) -> bytes:
+    return base64.urlsafe_b64encode(data).rstrip(b"=")
+
+
+def encode_hs256(claims: Dict[str, Any], key: str) -> str:
+    """Sign claims as an HS256 JWT. exp/iat etc. must already be int timestamps."""
+    signing_input = _HEADER_B64 + b"." + _b64url(orjson.dumps(claims))
+    signature = hmac.new(key.encode(), signing_input, hashlib.sha256).digest()
+    return (signing_input + b"." + _b64url(signature)).decode()
+
+
+def issue_custom_tokens(user_id: str, email: str) -> Tuple[str, str]:
+    """(access_token, refresh_token) for a custom session, signed with SECRET_KEY."""
+    now = datetime.now(timezone.utc)
+    access_token = encode_hs256(
+        {"sub": user_id, "email": email, "exp": int((now + ACCESS_TOKEN_TTL).timestamp())},
+        settings.SECRET_KEY,
+    )
+    refresh_token = encode_hs256(
+        {"sub": user_id, "email": email, "exp": int((now + REFRESH_TOKEN_TTL).timestamp()), "type": "refresh"},
+        settings.SECRET_KEY,
+    )
+    return access_token, refresh_token
+
+
+def decode_custom_token(token: str) -> Dict[str, Any]:
+    """Verify signature and exp; raises InvalidTokenError."""
+    return pyjwt.decode(token, settings.SECRET_KEY, algorithms=["HS256"])
+
+
+def unverified_claims(token: str) -> Dict[str, Any]:
+    """Claims without any verification - only for hints that are checked some other way."""
+    return pyjwt.decode(token, options={"verify_signature": False})
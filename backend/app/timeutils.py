@@ -0,0 +1,16 @@
+"""
+Timestamp helpers shared by the routers.
+"""
+from datetime import datetime, timezone
+
+
+def parse_iso_utc(value: str) -> datetime:
+    """Parse an ISO-8601 timestamp as returned by PostgREST into an aware datetime.
+
+    The common "...Z" form is handled by slicing instead of str.replace, and naive
+    values are taken to be UTC. Raises ValueError on malformed input.
+    """
+    if value.endswith("Z"):
+        return datetime.fromisoformat(value[:-1]).replace(tzinfo=timezone.utc)
+    dt = datetime.fromisoformat(value)
+    return dt if dt.tzinfo is not None else dt.replace(tzinfo=timezone.utc)
@@ -3,17 +3,44 @@ Input validation utilities for AssistLink API
 Provides validators for common data types and formats
 """
 import re
+from functools import lru_cache
 from typing import Optional
 from datetime import datetime, date, timezone
 from pydantic import validator
 
 
+# Pure validators (email, phone, currency, role, booking status) are memoised with
+# lru_cache; invalid input still raises every time since exceptions aren't cached.
+# validate_password is deliberately not cached so plaintext passwords aren't retained.
+
 # Regex patterns
 EMAIL_REGEX = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
 PHONE_REGEX = re.compile(r'^\+?[1-9]\d{1,14}$')  # E.164 format
 INDIAN_PHONE_REGEX = re.compile(r'^(\+91|91)?[6-9]\d{9}$')
-
-
+# Both lookaheads scan in C; [^\W\d_] is any Unicode letter, like str.isalpha()
+PASSWORD_LETTER_AND_DIGIT_REGEX = re.compile(r'(?=.*[^\W\d_])(?=.*\d)', re.DOTALL)
+# Allowed values: frozensets for membership; the tuples keep the order used in error messages
+_CURRENCIES = ("INR", "USD", "EUR", "GBP")
+_ROLES = ("care_recipient", "caregiver", "admin")
+_BOOKING_STATUSES = ("pending", "accepted", "rejected", "confirmed", "in_progress", "completed", "cancelled", "missed")
+_VALID_CURRENCIES = frozenset(_CURRENCIES)
+_VALID_ROLES = frozenset(_ROLES)
+_VALID_BOOKING_STATUSES = frozenset(_BOOKING_STATUSES)
+_INVALID_CURRENCY_MESSAGE = f"Invalid currency. Supported currencies: {', '.join(_CURRENCIES)}"
+_INVALID_ROLE_MESSAGE = f"Invalid role. Must be one of: {', '.join(_ROLES)}"
+_INVALID_BOOKING_STATUS_MESSAGE = f"Invalid status. Must be one of: {', '.join(_BOOKING_STATUSES)}"
+
+URL_REGEX = re.compile(
+    r'^https?://'  # http:// or https://
+    r'(?:(?:[A-Z0-9](?:[A-Z0-9-]{0,61}[A-Z0-9])?\.)+[A-Z]{2,6}\.?|'  # domain...
+    r'localhost|'  # localhost...
+    r'\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})'  # ...or ip
+    r'(?::\d+)?'  # optional port
+    r'(?:/?|[/?]\S+)$', re.IGNORECASE
+)
+
+
+@lru_cache(maxsize=4096)
 def validate_email(email: str) -> str:
     """Validate email format"""
     if not email:
@@ -23,15 +50,17 @@ def validate_email(email: str) -> str:
     if not email:
         raise ValueError("Email is required")
 
-    if not EMAIL_REGEX.match(email):
-        raise ValueError("Invalid email format")
-    
+    # Length first so the regex never runs over oversized input
     if len(email) > 255:
         raise ValueError("Email is too long (max 255 characters)")
     
+    if not EMAIL_REGEX.match(email):
+        raise ValueError("Invalid email format")
+    
     return email
 
 
+@lru_cache(maxsize=4096)
 def validate_phone(phone: str, country: str = "IN") -> str:
     """Validate phone number format"""
     if not phone:
@@ -67,10 +96,7 @@ def validate_password(password: str, min_length: int = 8) -> str:
         raise ValueError("Password is too long (max 128 characters)")
     
     # Check for at least one letter and one number
-    has_letter = any(c.isalpha() for c in password)
-    has_number = any(c.isdigit() for c in password)
-    
-    if not (has_letter and has_number):
+    if not PASSWORD_LETTER_AND_DIGIT_REGEX.match(password):
         raise ValueError("Password must contain at least one letter and one number")
     
     return password
@@ -120,14 +146,13 @@ def validate_amount(amount: float, min_amount: float = 0.01, max_amount: float =
     return round(amount, 2)
 
 
+@lru_cache(maxsize=64)
 def validate_currency(currency: str) -> str:
     """Validate currency code"""
-    valid_currencies = ["INR", "USD", "EUR", "GBP"]
-    
     currency = currency.upper().strip()
     
-    if currency not in valid_currencies:
-        raise ValueError(f"Invalid currency. Supported currencies: {', '.join(valid_currencies)}")
+    if currency not in _VALID_CURRENCIES:
+        raise ValueError(_INVALID_CURRENCY_MESSAGE)
     
     return currency
 
@@ -160,24 +185,23 @@ def validate_duration(duration_seconds: int, min_duration: int = 15, max_duratio
     return duration_seconds
 
 
+@lru_cache(maxsize=64)
 def validate_role(role: str) -> str:
     """Validate user role"""
-    valid_roles = ["care_recipient", "caregiver", "admin"]
-    
     role = role.lower().strip()
     
-    if role not in valid_roles:
-        raise ValueError(f"Invalid role. Must be one of: {', '.join(valid_roles)}")
+    if role not in _VALID_ROLES:
+        raise ValueError(_INVALID_ROLE_MESSAGE)
     
     return role
 
 
+@lru_cache(maxsize=64)
 def validate_booking_status(status: str) -> str:
     """Validate booking status (aligned with API/schemas: pending, accepted, rejected, in_progress, completed, cancelled, missed)."""
-    valid_statuses = ["pending", "accepted", "rejected", "confirmed", "in_progress", "completed", "cancelled", "missed"]
     status = status.lower().strip()
-    if status not in valid_statuses:
-        raise ValueError(f"Invalid status. Must be one of: {', '.join(valid_statuses)}")
+    if status not in _VALID_BOOKING_STATUSES:
+        raise ValueError(_INVALID_BOOKING_STATUS_MESSAGE)
     return status
 
 
@@ -191,16 +215,7 @@ def validate_url(url: str, optional: bool = True) -> Optional[str]:
     url = url.strip()
     
     # Basic URL validation
-    url_pattern = re.compile(
-        r'^https?://'  # http:// or https://
-        r'(?:(?:[A-Z0-9](?:[A-Z0-9-]{0,61}[A-Z0-9])?\.)+[A-Z]{2,6}\.?|'  # domain...
-        r'localhost|'  # localhost...
-        r'\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})'  # ...or ip
-        r'(?::\d+)?'  # optional port
-        r'(?:/?|[/?]\S+)$', re.IGNORECASE
-    )
-    
-    if not url_pattern.match(url):
+    if not URL_REGEX.match(url):
         raise ValueError("Invalid URL format")
     
     return url
@@ -231,10 +246,11 @@ def validate_otp(otp: str) -> str:
     
     otp = otp.strip()
     
-    if not otp.isdigit():
-        raise ValueError("OTP must contain only digits")
-    
     if len(otp) != 6:
         raise ValueError("OTP must be exactly 6 digits")
     
+    # One C-level pass; unlike str.isdigit() this also rejects non-ASCII digits
+    if otp.encode().translate(None, b"0123456789"):
+        raise ValueError("OTP must contain only digits")
+    
     return otp
@@ -1,8 +1,5 @@
-from fastapi.testclient import TestClient
+# app.routes is filled in when the routers are included at import; no client or startup needed
 from app.main import app
-import sys
-
-client = TestClient(app)
 
 print("Checking routes...")
 routes = [route.path for route in app.routes]
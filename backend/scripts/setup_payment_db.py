@@ -4,13 +4,14 @@ import os
 # Add parent directory to path to import app modules
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from src.config.db import execute_query
+from psycopg2 import sql
 
-def setup_payment_db():
-    print("Setting up payment and earnings tables...")
-    
-    sql = """
-    -- 1. Create Payments Table
+from src.config.db import get_connection
+
+# Idempotent DDL, one statement per entry, built once at import
+DDL_STATEMENTS = [
+    # 1. Create Payments Table
+    sql.SQL("""
     CREATE TABLE IF NOT EXISTS payments (
         id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
         booking_id UUID REFERENCES bookings(id),
@@ -24,9 +25,9 @@ def setup_payment_db():
         metadata JSONB DEFAULT '{}'::jsonb,
         created_at TIMESTAMPTZ DEFAULT NOW(),
         updated_at TIMESTAMPTZ DEFAULT NOW()
-    );
-
-    -- 2. Create Caregiver Earnings Table
+    )"""),
+    # 2. Create Caregiver Earnings Table
+    sql.SQL("""
     CREATE TABLE IF NOT EXISTS caregiver_earnings (
         id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
         caregiver_id UUID REFERENCES users(id),
@@ -37,16 +38,28 @@ def setup_payment_db():
         status VARCHAR(20) DEFAULT 'detailed', -- detailed (ledger), pending_payout, paid
         payout_id UUID, -- Link to a future payout table if needed
         created_at TIMESTAMPTZ DEFAULT NOW()
-    );
+    )"""),
+    # 3. Indexes for Performance
+    sql.SQL("CREATE INDEX IF NOT EXISTS idx_payments_booking_id ON payments(booking_id)"),
+    sql.SQL("CREATE INDEX IF NOT EXISTS idx_payments_user_id ON payments(user_id)"),
+    sql.SQL("CREATE INDEX IF NOT EXISTS idx_earnings_caregiver_id ON caregiver_earnings(caregiver_id)"),
+]
+# Sent as one composed script so the whole setup is still a single round trip
+DDL_SCRIPT = sql.SQL(";\n").join(DDL_STATEMENTS)
 
-    -- 3. Indexes for Performance
-    CREATE INDEX IF NOT EXISTS idx_payments_booking_id ON payments(booking_id);
-    CREATE INDEX IF NOT EXISTS idx_payments_user_id ON payments(user_id);
-    CREATE INDEX IF NOT EXISTS idx_earnings_caregiver_id ON caregiver_earnings(caregiver_id);
-    """
+def setup_payment_db():
+    print("Setting up payment and earnings tables...")
     
     try:
-        execute_query(sql, fetch=False)
+        # One-shot script: a single direct connection instead of warming up the app pool.
+        # All statements go in one round trip and commit together when the block exits.
+        conn = get_connection()
+        try:
+            with conn:
+                with conn.cursor() as cur:
+                    cur.execute(DDL_SCRIPT)
+        finally:
+            conn.close()
         print("Successfully created payments and caregiver_earnings tables.")
     except Exception as e:
         print(f"Error creating tables: {e}")
@@ -6,11 +6,19 @@ This module provides direct PostgreSQL access (not through Supabase REST API).
 Treat the database as external infrastructure - the app only reads/writes.
 No ORM auto-creation - schema is managed externally via database/schema.sql
 """
+import hashlib
+import logging
 import os
+import re
+import threading
+import time
+import weakref
 import psycopg2
+from contextlib import contextmanager
 from psycopg2 import pool
-from psycopg2.extras import RealDictCursor
-from typing import Optional
+from psycopg2.extras import RealDictCursor, execute_batch
+from typing import Dict, Iterable, Iterator, Optional
+from urllib.parse import quote
 
 # Load environment variables
 try:
@@ -25,21 +33,61 @@ except ImportError:
     # For scripts that run outside the app context
     settings = None
 
+logger = logging.getLogger(__name__)
+
 # Connection pool (single source of truth)
 _connection_pool: Optional[psycopg2.pool.SimpleConnectionPool] = None
 
 
 _pool_error: Optional[str] = None  # Stores init error for deferred reporting
+# Server-side PREPARE only survives on a session-scoped backend; the transaction pooler (6543)
+# hands each transaction to a different backend, so prepared statements are off there.
+_prepare_supported: bool = False
+
+
+# Per-worker ceiling; the transaction pooler multiplexes these onto Supabase's own connection cap
+_DB_MAX_CONN = int(os.getenv("DB_MAX_CONN", "50"))
+# Connections opened up front when the pool is created
+_DB_MIN_CONN = int(os.getenv("DB_MIN_CONN", "2"))
+
+
+def _pooler_dsn_from_password() -> Optional[str]:
+    """
+    Transaction-pooler URI (port 6543, IPv4-reachable) built from SUPABASE_DB_PASSWORD and
+    SUPABASE_DB_REGION when DATABASE_URL isn't set. None if either, or the project URL, is missing.
+    The region is never guessed: a wrong pooler host only fails later with an opaque tenant error.
+    """
+    db_password = os.getenv("SUPABASE_DB_PASSWORD") or (settings.SUPABASE_DB_PASSWORD if settings else None)
+    if not db_password:
+        return None
+    if settings:
+        project_ref = settings.project_ref
+    else:
+        supabase_url = os.getenv("SUPABASE_URL")
+        if not supabase_url:
+            return None
+        project_ref = supabase_url.replace("https://", "").replace("http://", "").split(".")[0]
+    region = (os.getenv("SUPABASE_DB_REGION") or "").strip()
+    if not region:
+        logger.warning("SUPABASE_DB_PASSWORD is set but SUPABASE_DB_REGION is not; not deriving a pooler URI.")
+        return None
+    return (
+        f"postgresql://postgres.{project_ref}:{quote(db_password, safe='')}"
+        f"@aws-0-{region}.pooler.supabase.com:6543/postgres?sslmode=require"
+    )
 
 
-def get_db_pool() -> psycopg2.pool.SimpleConnectionPool:
+def get_db_pool(min_size: Optional[int] = None) -> psycopg2.pool.SimpleConnectionPool:
     """Get or create database connection pool.
 
+    min_size (default DB_MIN_CONN) only applies when this call creates the pool;
+    one-shot scripts can pass min_size=1 to skip opening connections they won't use.
+
     GRACEFUL DEGRADATION: If pool init fails, the error is stored and only raised
     when a query is attempted. This lets the server start in degraded mode so that
     Auth endpoints (Supabase client) remain usable even when direct DB is unavailable.
     """
-    global _connection_pool, _pool_error
+    global _connection_pool, _pool_error, _prepare_supported
 
     if _pool_error is not None:
         raise DatabaseConnectionError(f"Database connection failed: {_pool_error}")
@@ -51,6 +99,8 @@ def get_db_pool() -> psycopg2.pool.SimpleConnectionPool:
             database_url = database_url.strip() or None
 
         try:
+            if not database_url:
+                database_url = _pooler_dsn_from_password()
             if database_url:
                 # Ensure SSL for Supabase pooler (required for port 6543)
                 dsn = database_url.strip()
@@ -58,27 +108,27 @@ def get_db_pool() -> psycopg2.pool.SimpleConnectionPool:
                     dsn = f"{dsn}?sslmode=require"
                 elif "sslmode=" not in dsn and "?" in dsn:
                     dsn = f"{dsn}&sslmode=require"
+                minconn = _DB_MIN_CONN if min_size is None else min_size
                 _connection_pool = psycopg2.pool.ThreadedConnectionPool(
-                    minconn=2, maxconn=10, dsn=dsn, connect_timeout=15
+                    minconn=minconn, maxconn=max(minconn, _DB_MAX_CONN), dsn=dsn, connect_timeout=15
                 )
+                _prepare_supported = ":6543" not in dsn
             else:
                 # Do NOT use direct db.xxx.supabase.co:5432 from cloud (Render) — it often fails with "Network is unreachable".
-                # Require DATABASE_URL set to the Supabase pooler (port 6543) in Render Environment.
+                # Require DATABASE_URL (or SUPABASE_DB_PASSWORD, for the derived pooler URI) in Render Environment.
                 msg = (
                     "DATABASE_URL is not set. On Render, set DATABASE_URL to the Supabase pooler URI "
-                    "(Supabase Dashboard → Settings → Database → Connection string → URI → Session or Transaction, port 6543). "
-                    "Remove SUPABASE_DB_PASSWORD from Render so the app does not try the direct connection."
+                    "(Supabase Dashboard → Settings → Database → Connection string → URI → Session or Transaction, port 6543), "
+                    "or set both SUPABASE_DB_PASSWORD and SUPABASE_DB_REGION (e.g. ap-south-1) to connect through the transaction pooler."
                 )
                 raise DatabaseConnectionError(msg)
         except Exception as e:
-            import sys
             error_details = str(e)
             if "translate host name" in error_details.lower() or "nodename" in error_details.lower():
                 error_details += " (DNS issue — set DATABASE_URL to Session Pooler URL from Supabase Dashboard)"
             _pool_error = f"Failed to initialize database pool: {error_details}"
-            sys.stderr.write(f"[DB] WARNING: {_pool_error}\n")
-            sys.stderr.write("[DB] Server starting in degraded mode — Auth/Supabase-client endpoints still functional.\n")
-            sys.stderr.flush()
+            logger.warning("%s", _pool_error)
+            logger.warning("Server starting in degraded mode — Auth/Supabase-client endpoints still functional.")
             raise DatabaseConnectionError(_pool_error) from e
 
     return _connection_pool
@@ -98,12 +148,133 @@ def return_db_connection(conn):
     pool.putconn(conn)
 
 
+# Connections idle in the pool longer than this get a SELECT 1 before being handed out
+_IDLE_PING_SECONDS = 30
+# conn -> time.monotonic() when it went back to the pool. Weak keys: connections the pool closes
+# on putconn (above minconn) drop out by themselves, and a new connection never reads a stale stamp.
+_returned_at: "weakref.WeakKeyDictionary[psycopg2.extensions.connection, float]" = weakref.WeakKeyDictionary()
+_BROKEN_CONNECTION_ERRORS = (psycopg2.OperationalError, psycopg2.InterfaceError)
+
+
+def _is_alive(conn) -> bool:
+    try:
+        with conn.cursor() as cur:
+            cur.execute("SELECT 1")
+        conn.rollback()
+        return True
+    except _BROKEN_CONNECTION_ERRORS:
+        return False
+
+
+@contextmanager
+def pooled_conn() -> Iterator["psycopg2.extensions.connection"]:
+    """
+    Lease a connection from the pool for the duration of the block.
+
+    Connections that were idle for a while are pinged first and replaced if the server
+    or pooler dropped them. A connection that fails with a connection-level error is
+    closed instead of going back to the pool, so one network blip can't poison later
+    requests; other errors roll back the open transaction and return it normally.
+    """
+    db_pool = get_db_pool()
+    conn = db_pool.getconn()
+    idle_since = _returned_at.pop(conn, None)
+    if conn.closed or (idle_since is not None and time.monotonic() - idle_since > _IDLE_PING_SECONDS and not _is_alive(conn)):
+        _prepared.pop(conn, None)
+        db_pool.putconn(conn, close=True)
+        conn = db_pool.getconn()
+    try:
+        yield conn
+    except _BROKEN_CONNECTION_ERRORS:
+        _prepared.pop(conn, None)
+        db_pool.putconn(conn, close=True)
+        raise
+    except BaseException:
+        if not conn.closed:
+            conn.rollback()
+        else:
+            _prepared.pop(conn, None)
+        db_pool.putconn(conn, close=bool(conn.closed))
+        raise
+    else:
+        _returned_at[conn] = time.monotonic()
+        db_pool.putconn(conn)
+        if conn.closed:
+            # Surplus connection: the pool closed it instead of keeping it idle
+            _returned_at.pop(conn, None)
+
+
+# One pooled connection kept checked out for /health/db probes, so they don't churn the pool
+_health_conn = None
+_health_lock = threading.Lock()
+
+
+def ping_database() -> None:
+    """SELECT 1 on the dedicated health connection; raises DatabaseConnectionError if the DB is unreachable."""
+    global _health_conn
+    with _health_lock:
+        db_pool = get_db_pool()
+        if _health_conn is None or _health_conn.closed:
+            _health_conn = db_pool.getconn()
+        try:
+            with _health_conn.cursor() as cur:
+                cur.execute("SELECT 1")
+            _health_conn.rollback()
+        except _BROKEN_CONNECTION_ERRORS as e:
+            db_pool.putconn(_health_conn, close=True)
+            _health_conn = None
+            raise DatabaseConnectionError(f"Database connection failed: {e}") from e
+
+
 def close_all_connections():
     """Close all connections in the pool (for shutdown)"""
-    global _connection_pool
+    global _connection_pool, _health_conn
+    _health_conn = None
     if _connection_pool:
         _connection_pool.closeall()
         _connection_pool = None
+    _prepared.clear()
+    _returned_at.clear()
+
+
+# Prepared statements, per connection: conn -> {query text: statement name}. Weak keys, because
+# the pool closes surplus connections on putconn without telling us; their entries go with them,
+# and a new connection never inherits statements that were prepared on another one.
+_MAX_PREPARED_PER_CONN = 256
+_prepared: "weakref.WeakKeyDictionary[psycopg2.extensions.connection, Dict[str, str]]" = weakref.WeakKeyDictionary()
+_POSITIONAL_PARAM = re.compile(r"%s")
+
+
+def _prepared_call(conn, cur, query: str, params: Optional[tuple]) -> bool:
+    """
+    Run query as EXECUTE of a statement PREPAREd once per connection, skipping the
+    server-side parse/plan on repeat calls. Only plain %s placeholders are translated;
+    returns False (nothing executed) for queries it can't rewrite safely, so the caller
+    falls back to a normal cur.execute.
+    """
+    if not _prepare_supported or "%%" in query or "%(" in query:
+        return False
+    params = tuple(params or ())
+    statements = _prepared.setdefault(conn, {})
+    name = statements.get(query)
+    if name is None:
+        if len(statements) >= _MAX_PREPARED_PER_CONN:
+            return False
+        placeholders = iter(range(1, len(params) + 1))
+        try:
+            server_query = _POSITIONAL_PARAM.sub(lambda _: f"${next(placeholders)}", query)
+        except StopIteration:
+            return False
+        if next(placeholders, None) is not None:
+            return False
+        name = "stmt_" + hashlib.md5(query.encode()).hexdigest()[:16]
+        cur.execute(f"PREPARE {name} AS {server_query}")
+        statements[query] = name
+    if params:
+        cur.execute(f"EXECUTE {name} ({', '.join(['%s'] * len(params))})", params)
+    else:
+        cur.execute(f"EXECUTE {name}")
+    return True
 
 
 # Direct connection (for scripts/testing)
@@ -118,13 +289,14 @@ def get_connection():
         return psycopg2.connect(database_url)
     
     # Construct connection from components
-    supabase_url = os.getenv("SUPABASE_URL") or (settings.SUPABASE_URL if settings else None)
-    if not supabase_url:
-        raise ValueError("SUPABASE_URL environment variable is required")
-    
-    project_ref = supabase_url.replace("https://", "").replace("http://", "").split(".")[0]
-    
-    db_host = f"db.{project_ref}.supabase.co"
+    if settings:
+        db_host = settings.db_host
+    else:
+        supabase_url = os.getenv("SUPABASE_URL")
+        if not supabase_url:
+            raise ValueError("SUPABASE_URL environment variable is required")
+        project_ref = supabase_url.replace("https://", "").replace("http://", "").split(".")[0]
+        db_host = f"db.{project_ref}.supabase.co"
     db_password = os.getenv("SUPABASE_DB_PASSWORD")
     
     if not db_password:
@@ -147,64 +319,66 @@ class DatabaseConnectionError(Exception):
     pass
 
 # Convenience function for executing queries with connection handling
-def execute_query(query: str, params: Optional[tuple] = None, fetch: bool = True):
+def execute_query(query: str, params: Optional[tuple] = None, fetch: bool = True, prepare: bool = False):
     """
     Execute a query and return results.
     Uses connection pool for production use.
     Updated to be resilient to DNS/Connection issues.
+    Pass prepare=True for hot, fixed-text queries to reuse a server-side prepared statement.
     """
-    return execute_resilient_query(query, params, fetch)
+    return execute_resilient_query(query, params, fetch, prepare)
 
-def execute_resilient_query(query: str, params: Optional[tuple] = None, fetch: bool = True):
+def execute_many(query: str, params_seq: Iterable[tuple], page_size: int = 100) -> None:
+    """
+    Run one statement for many parameter tuples on a single pooled connection and commit once.
+    execute_batch sends page_size statements per round trip instead of one per row,
+    so use this for row-by-row inserts/updates rather than calling execute_query in a loop.
+    """
+    try:
+        with pooled_conn() as conn:
+            with conn.cursor() as cur:
+                execute_batch(cur, query, params_seq, page_size=page_size)
+            conn.commit()
+    except _BROKEN_CONNECTION_ERRORS as e:
+        raise DatabaseConnectionError(f"Database connection failed: {e}") from e
+
+def execute_resilient_query(query: str, params: Optional[tuple] = None, fetch: bool = True, prepare: bool = False):
     """
     Execute a query with resilience:
     1. Try direct PostgreSQL connection (fastest)
     2. If DNS/Connection fails, raise DatabaseConnectionError to allow fallback
     """
-    import time
-    import sys
-    
     start_time = time.time()
-    conn = None
     try:
-        conn = get_db_connection()
-        with conn.cursor(cursor_factory=RealDictCursor) as cur:
-            cur.execute(query, params)
-            if fetch:
-                result = cur.fetchall()
-            else:
-                conn.commit()
-                result = cur.rowcount
+        with pooled_conn() as conn:
+            # Writes only return rowcount, so skip building a dict per row
+            with conn.cursor(cursor_factory=RealDictCursor if fetch else None) as cur:
+                if not (prepare and _prepared_call(conn, cur, query, params)):
+                    cur.execute(query, params)
+                if fetch:
+                    result = cur.fetchall()
+                else:
+                    conn.commit()
+                    result = cur.rowcount
+                
+                elapsed = time.time() - start_time
+                if elapsed > 0.1:
+                    logger.warning("Slow query (%.3fs): %s...", elapsed, query[:100])
+                
+                return result
             
-            elapsed = time.time() - start_time
-            if elapsed > 0.1:
-                sys.stderr.write(f"[DB] Slow query ({elapsed:.3f}s): {query[:100]}...\n")
-                sys.stderr.flush()
-            
-            return result
-            
-    except (psycopg2.OperationalError, psycopg2.InterfaceError) as e:
+    except _BROKEN_CONNECTION_ERRORS as e:
         error_msg = str(e)
-        sys.stderr.write(f"[DB] [CONNECTION ERROR] Direct SQL failed: {error_msg}\n")
+        logger.error("Direct SQL failed: %s", error_msg)
         
         # Determine if it's likely a network/DNS issue
         is_dns_issue = "translate host name" in error_msg.lower() or "nodename" in error_msg.lower()
         if is_dns_issue:
-            sys.stderr.write("[DB] [TIP] Your network might be IPv4-only while Supabase Direct SQL is IPv6-only.\n")
-            sys.stderr.write("[DB] [TIP] Attempting HTTPS fallback via Supabase Client...\n")
-        
-        sys.stderr.flush()
+            logger.warning("Your network might be IPv4-only while Supabase Direct SQL is IPv6-only.")
+            logger.warning("Attempting HTTPS fallback via Supabase Client...")
         
         # Raise specific error to allow caller to fallback
         raise DatabaseConnectionError(
             f"Database connection failed: {error_msg}. "
             "Consider using the Supabase Transaction Pooler (port 6543) if on an IPv4-only network."
         ) from e
-            
-    except Exception as e:
-        if conn:
-            conn.rollback()
-        raise e
-    finally:
-        if conn:
-            return_db_connection(conn)
@@ -9,31 +9,43 @@ if not BASE_URL:
     print("ERROR: Set API_BASE_URL (or BACKEND_URL) to your backend URL. Do not use localhost for multi-device testing.")
     sys.exit(1)
 
-async def test_endpoint(name: str, method: str, path: str, json: dict = None, headers: dict = None):
-    print(f"Testing {name} ({method} {path})...", end=" ", flush=True)
-    async with httpx.AsyncClient() as client:
-        try:
-            if method == "GET":
-                response = await client.get(f"{BASE_URL}{path}", headers=headers)
-            elif method == "POST":
-                response = await client.post(f"{BASE_URL}{path}", json=json, headers=headers)
-            
-            if response.status_code < 400:
-                print(f"✅ SUCCESS ({response.status_code})")
-                return response.json()
-            else:
-                print(f"❌ FAILED ({response.status_code})")
-                print(f"   Response: {response.text}")
-                return None
-        except Exception as e:
-            print(f"❌ ERROR: {str(e)}")
+async def test_endpoint(client: httpx.AsyncClient, name: str, method: str, path: str, json: dict = None, headers: dict = None):
+    # One print per probe, after it finishes, so concurrent probes don't interleave their output
+    label = f"Testing {name} ({method} {path})..."
+    try:
+        if method == "GET":
+            response = await client.get(path, headers=headers)
+        elif method == "POST":
+            response = await client.post(path, json=json, headers=headers)
+        
+        if response.status_code < 400:
+            print(f"{label} ✅ SUCCESS ({response.status_code})")
+            return response.json()
+        else:
+            print(f"{label} ❌ FAILED ({response.status_code})")
+            print(f"   Response: {response.text}")
             return None
+    except Exception as e:
+        print(f"{label} ❌ ERROR: {str(e)}")
+        return None
 
 async def run_verification():
     print("=== AssistLink API Stability Verification ===\n")
-    
+
+    # One keep-alive client for every probe: a single TCP+TLS handshake for the whole run,
+    # with HTTP/2 multiplexing the concurrent probes over it
+    async with httpx.AsyncClient(
+        base_url=BASE_URL,
+        http2=True,
+        timeout=httpx.Timeout(2.0, connect=1.0),
+        limits=httpx.Limits(max_connections=20, max_keepalive_connections=20),
+    ) as client:
+        await _run_probes(client)
+
+
+async def _run_probes(client: httpx.AsyncClient):
     # 1. Health Check
-    health = await test_endpoint("Health Check", "GET", "/health")
+    health = await test_endpoint(client, "Health Check", "GET", "/health")
     if not health:
         print("\nCRITICAL: Backend is not running or unreachable.")
         print("Please start the backend with: uvicorn app.main:app --reload")
@@ -41,9 +53,15 @@ async def run_verification():
 
     # 2. Test Login Error (Standardized)
     # This should return a standardized error response
+    # Everything after the health gate is independent; add further probes to this gather
     print("\nVerifying Standardized Error Responses...")
-    login_error = await test_endpoint("Invalid Login", "POST", "/api/auth/login", 
-                                     json={"email": "invalid@test.com", "password": "wrong"})
+    login_error, db_health = await asyncio.gather(
+        test_endpoint(client, "Invalid Login", "POST", "/api/auth/login",
+                      json={"email": "invalid@test.com", "password": "wrong"}),
+        test_endpoint(client, "Database Health", "GET", "/health/db"),
+    )
+    if db_health and db_health.get("status") != "ok":
+        print(f"⚠️  Direct DB unavailable: {db_health.get('detail')}")
     if login_error and "error" in login_error:
         print("✅ Received standardized error payload")
         print(f"   Code: {login_error['error'].get('code')}")
@@ -0,0 +1,13 @@
+-- Partial indexes for GET /api/dashboard/recurring (keyset pagination on (scheduled_date, id)).
+-- One per role column, so both caregivers and care recipients get an index-ordered scan;
+-- id breaks ties between bookings in the same slot. Dropped first so an earlier
+-- (role_col, scheduled_date) version is replaced.
+DROP INDEX IF EXISTS idx_bookings_recurring_caregiver;
+CREATE INDEX idx_bookings_recurring_caregiver
+  ON bookings(caregiver_id, scheduled_date, id)
+  WHERE is_recurring = true;
+
+DROP INDEX IF EXISTS idx_bookings_recurring_care_recipient;
+CREATE INDEX idx_bookings_recurring_care_recipient
+  ON bookings(care_recipient_id, scheduled_date, id)
+  WHERE is_recurring = true;
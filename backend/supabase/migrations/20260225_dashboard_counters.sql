@@ -0,0 +1,87 @@
+-- Per-user booking counters for GET /api/dashboard/stats.
+-- Maintained by a trigger on bookings so the read path is a single PK lookup instead of
+-- fetching and aggregating every booking row. "upcoming" is not stored here: it depends
+-- on the current time, so the API still counts it with an indexed query.
+CREATE TABLE IF NOT EXISTS dashboard_counters (
+  user_id UUID PRIMARY KEY REFERENCES users(id) ON DELETE CASCADE,
+  active INTEGER NOT NULL DEFAULT 0,
+  completed INTEGER NOT NULL DEFAULT 0,
+  earnings NUMERIC(12, 2) NOT NULL DEFAULT 0,
+  updated_at TIMESTAMPTZ DEFAULT NOW()
+);
+
+-- Add (sign = 1) or remove (sign = -1) one booking row's contribution for one participant.
+CREATE OR REPLACE FUNCTION apply_dashboard_counter_delta(
+  p_user_id UUID,
+  p_status TEXT,
+  p_payment_status TEXT,
+  p_amount NUMERIC,
+  p_sign INTEGER
+)
+RETURNS VOID AS $$
+BEGIN
+  IF p_user_id IS NULL THEN
+    RETURN;
+  END IF;
+
+  INSERT INTO dashboard_counters AS dc (user_id, active, completed, earnings, updated_at)
+  VALUES (
+    p_user_id,
+    p_sign * (p_status = 'in_progress')::integer,
+    p_sign * (p_status = 'completed')::integer,
+    p_sign * CASE WHEN p_payment_status IN ('captured', 'completed') THEN COALESCE(p_amount, 0) ELSE 0 END,
+    NOW()
+  )
+  ON CONFLICT (user_id) DO UPDATE SET
+    active = dc.active + EXCLUDED.active,
+    completed = dc.completed + EXCLUDED.completed,
+    earnings = dc.earnings + EXCLUDED.earnings,
+    updated_at = NOW();
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER;
+
+CREATE OR REPLACE FUNCTION update_dashboard_counters()
+RETURNS TRIGGER AS $$
+BEGIN
+  IF TG_OP IN ('UPDATE', 'DELETE') THEN
+    PERFORM apply_dashboard_counter_delta(OLD.caregiver_id, OLD.status::text, OLD.payment_status::text, OLD.amount, -1);
+    PERFORM apply_dashboard_counter_delta(OLD.care_recipient_id, OLD.status::text, OLD.payment_status::text, OLD.amount, -1);
+  END IF;
+  IF TG_OP IN ('INSERT', 'UPDATE') THEN
+    PERFORM apply_dashboard_counter_delta(NEW.caregiver_id, NEW.status::text, NEW.payment_status::text, NEW.amount, 1);
+    PERFORM apply_dashboard_counter_delta(NEW.care_recipient_id, NEW.status::text, NEW.payment_status::text, NEW.amount, 1);
+  END IF;
+  RETURN COALESCE(NEW, OLD);
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER;
+
+DROP TRIGGER IF EXISTS trg_update_dashboard_counters ON bookings;
+CREATE TRIGGER trg_update_dashboard_counters
+  AFTER INSERT OR DELETE OR UPDATE OF status, payment_status, amount, caregiver_id, care_recipient_id ON bookings
+  FOR EACH ROW
+  EXECUTE FUNCTION update_dashboard_counters();
+
+-- One-time backfill from existing bookings (both participants of each booking).
+INSERT INTO dashboard_counters (user_id, active, completed, earnings, updated_at)
+SELECT
+  p.user_id,
+  COUNT(*) FILTER (WHERE p.status = 'in_progress'),
+  COUNT(*) FILTER (WHERE p.status = 'completed'),
+  COALESCE(SUM(p.amount) FILTER (WHERE p.payment_status IN ('captured', 'completed')), 0),
+  NOW()
+FROM (
+  SELECT caregiver_id AS user_id, status::text AS status, payment_status::text AS payment_status, amount
+  FROM bookings WHERE caregiver_id IS NOT NULL
+  UNION ALL
+  SELECT care_recipient_id, status::text, payment_status::text, amount
+  FROM bookings WHERE care_recipient_id IS NOT NULL
+) p
+GROUP BY p.user_id
+ON CONFLICT (user_id) DO UPDATE SET
+  active = EXCLUDED.active,
+  completed = EXCLUDED.completed,
+  earnings = EXCLUDED.earnings,
+  updated_at = NOW();
+
+-- Server-side reads only (service role bypasses RLS).
+ALTER TABLE dashboard_counters ENABLE ROW LEVEL SECURITY;
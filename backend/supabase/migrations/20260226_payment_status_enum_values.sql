@@ -0,0 +1,13 @@
+-- Extend the payment_status enum with the values bookings.payment_status already uses
+-- (see database/migrations/fix_payment_status_captured.sql). Kept separate from the
+-- column conversion in 20260227_bookings_payment_status_enum.sql: new enum values
+-- cannot be used in the transaction that adds them.
+DO $$ BEGIN
+    CREATE TYPE payment_status AS ENUM ('pending', 'authorized', 'captured', 'refunded', 'failed');
+EXCEPTION
+    WHEN duplicate_object THEN null;
+END $$;
+
+ALTER TYPE payment_status ADD VALUE IF NOT EXISTS 'initiated';
+ALTER TYPE payment_status ADD VALUE IF NOT EXISTS 'processing';
+ALTER TYPE payment_status ADD VALUE IF NOT EXISTS 'completed';
@@ -0,0 +1,17 @@
+-- Store bookings.payment_status as the payment_status enum (4 bytes, integer compares)
+-- instead of TEXT + CHECK. bookings.status is already the booking_status enum
+-- (20260216_complete_booking_system.sql). No-op if the column is already the enum.
+DO $$
+BEGIN
+  IF EXISTS (
+    SELECT 1 FROM information_schema.columns
+    WHERE table_name = 'bookings' AND column_name = 'payment_status' AND data_type = 'text'
+  ) THEN
+    ALTER TABLE bookings DROP CONSTRAINT IF EXISTS bookings_payment_status_check;
+    ALTER TABLE bookings DROP CONSTRAINT IF EXISTS bookings_payment_status_check1;
+    ALTER TABLE bookings ALTER COLUMN payment_status DROP DEFAULT;
+    ALTER TABLE bookings
+      ALTER COLUMN payment_status TYPE payment_status USING payment_status::payment_status,
+      ALTER COLUMN payment_status SET DEFAULT 'pending'::payment_status;
+  END IF;
+END $$;
@@ -0,0 +1,52 @@
+-- booking_participants: one row per (user, booking) regardless of role, so dashboard
+-- listings filter through a single (user_id, booking_id) index instead of branching
+-- between caregiver_id and care_recipient_id. Kept in sync by a trigger on bookings.
+CREATE TABLE IF NOT EXISTS booking_participants (
+  booking_id UUID NOT NULL REFERENCES bookings(id) ON DELETE CASCADE,
+  user_id UUID NOT NULL REFERENCES users(id) ON DELETE CASCADE,
+  role TEXT NOT NULL CHECK (role IN ('care_recipient', 'caregiver')),
+  PRIMARY KEY (user_id, booking_id)
+);
+
+CREATE INDEX IF NOT EXISTS idx_booking_participants_booking ON booking_participants(booking_id);
+
+CREATE OR REPLACE FUNCTION sync_booking_participants()
+RETURNS TRIGGER AS $$
+BEGIN
+  IF TG_OP = 'UPDATE' THEN
+    IF NEW.caregiver_id IS NOT DISTINCT FROM OLD.caregiver_id
+       AND NEW.care_recipient_id IS NOT DISTINCT FROM OLD.care_recipient_id THEN
+      RETURN NEW;
+    END IF;
+    DELETE FROM booking_participants WHERE booking_id = NEW.id;
+  END IF;
+
+  INSERT INTO booking_participants (booking_id, user_id, role)
+  VALUES (NEW.id, NEW.care_recipient_id, 'care_recipient')
+  ON CONFLICT DO NOTHING;
+
+  IF NEW.caregiver_id IS NOT NULL THEN
+    INSERT INTO booking_participants (booking_id, user_id, role)
+    VALUES (NEW.id, NEW.caregiver_id, 'caregiver')
+    ON CONFLICT DO NOTHING;
+  END IF;
+
+  RETURN NEW;
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER;
+
+DROP TRIGGER IF EXISTS trg_sync_booking_participants ON bookings;
+CREATE TRIGGER trg_sync_booking_participants
+  AFTER INSERT OR UPDATE OF caregiver_id, care_recipient_id ON bookings
+  FOR EACH ROW
+  EXECUTE FUNCTION sync_booking_participants();
+
+-- Backfill
+INSERT INTO booking_participants (booking_id, user_id, role)
+SELECT id, care_recipient_id, 'care_recipient' FROM bookings WHERE care_recipient_id IS NOT NULL
+UNION ALL
+SELECT id, caregiver_id, 'caregiver' FROM bookings WHERE caregiver_id IS NOT NULL
+ON CONFLICT DO NOTHING;
+
+-- Server-side reads only (service role bypasses RLS).
+ALTER TABLE booking_participants ENABLE ROW LEVEL SECURITY;
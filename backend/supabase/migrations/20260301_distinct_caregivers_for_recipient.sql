@@ -0,0 +1,20 @@
+-- Caregivers to alert when a care recipient triggers an emergency (POST /api/emergency/trigger).
+-- DISTINCT runs in Postgres so each caregiver id crosses the wire once, however many
+-- active bookings the recipient has with them.
+CREATE OR REPLACE FUNCTION distinct_caregivers_for_recipient(rid UUID)
+RETURNS TABLE (caregiver_id UUID)
+LANGUAGE sql
+STABLE
+AS $$
+  SELECT DISTINCT b.caregiver_id
+  FROM bookings b
+  WHERE b.care_recipient_id = rid
+    AND b.caregiver_id IS NOT NULL
+    AND b.status IN ('requested', 'accepted', 'confirmed', 'in_progress');
+$$;
+
+COMMENT ON FUNCTION distinct_caregivers_for_recipient IS 'Unique caregiver ids with an active booking for care recipient rid.';
+
+-- Server-side only: the API calls this with the service role.
+REVOKE EXECUTE ON FUNCTION distinct_caregivers_for_recipient(UUID) FROM PUBLIC, anon, authenticated;
+GRANT EXECUTE ON FUNCTION distinct_caregivers_for_recipient(UUID) TO service_role;
@@ -0,0 +1,9 @@
+-- Composite indexes matching the dashboard's booking filters:
+--   <role column> = user AND status IN (...) AND scheduled_date > now()
+-- (upcoming count in GET /api/dashboard/stats, upcoming_only on /bookings, /upcoming).
+-- One per role column; the leading column also serves plain per-user lookups.
+CREATE INDEX IF NOT EXISTS idx_bookings_recipient_status_date
+  ON bookings(care_recipient_id, status, scheduled_date);
+
+CREATE INDEX IF NOT EXISTS idx_bookings_caregiver_status_date
+  ON bookings(caregiver_id, status, scheduled_date);
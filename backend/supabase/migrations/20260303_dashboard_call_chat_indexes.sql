@@ -0,0 +1,21 @@
+-- Composite indexes for the dashboard's video call and chat session filters.
+-- The bookings side is covered by 20260302_bookings_dashboard_indexes.sql and the
+-- recurring partial indexes in 20260225_bookings_recurring_index.sql.
+-- Plain CREATE INDEX (not CONCURRENTLY) because migrations run inside a transaction.
+
+-- /stats pending count (user, status = 'pending') and GET /video-calls
+-- (user, optional status, ORDER BY scheduled_time).
+CREATE INDEX IF NOT EXISTS idx_video_calls_recipient_status_time
+  ON video_call_requests(care_recipient_id, status, scheduled_time);
+
+CREATE INDEX IF NOT EXISTS idx_video_calls_caregiver_status_time
+  ON video_call_requests(caregiver_id, status, scheduled_time);
+
+-- /stats active chat count (user, is_enabled = true).
+CREATE INDEX IF NOT EXISTS idx_chat_sessions_recipient_enabled
+  ON chat_sessions(care_recipient_id)
+  WHERE is_enabled = true;
+
+CREATE INDEX IF NOT EXISTS idx_chat_sessions_caregiver_enabled
+  ON chat_sessions(caregiver_id)
+  WHERE is_enabled = true;
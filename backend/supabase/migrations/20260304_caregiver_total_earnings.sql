@@ -0,0 +1,23 @@
+-- Caregiver earnings as one server-side SUM, used by GET /api/dashboard/stats when the
+-- caregiver has no dashboard_counters row yet. Paid = payment_status captured/completed,
+-- the same rule the dashboard_counters trigger applies. A paid booking without an amount
+-- is valued at duration_hours * fallback_rate (0 by default, matching the counters).
+CREATE OR REPLACE FUNCTION caregiver_total_earnings(cg_id UUID, fallback_rate NUMERIC DEFAULT 0)
+RETURNS NUMERIC
+LANGUAGE sql
+STABLE
+AS $$
+  SELECT COALESCE(SUM(COALESCE(b.amount, b.duration_hours * fallback_rate)), 0)
+  FROM bookings b
+  WHERE b.caregiver_id = cg_id
+    AND b.payment_status IN ('captured', 'completed');
+$$;
+
+COMMENT ON FUNCTION caregiver_total_earnings IS 'Sum of paid booking amounts for caregiver cg_id.';
+
+-- Index-only scan for the SUM above.
+CREATE INDEX IF NOT EXISTS idx_bookings_caregiver_payment_status
+  ON bookings(caregiver_id, payment_status) INCLUDE (amount, duration_hours);
+
+REVOKE EXECUTE ON FUNCTION caregiver_total_earnings(UUID, NUMERIC) FROM PUBLIC, anon, authenticated;
+GRANT EXECUTE ON FUNCTION caregiver_total_earnings(UUID, NUMERIC) TO service_role;
@@ -0,0 +1,57 @@
+-- Pre-joined booking rows for GET /api/dashboard/bookings.
+-- Each row carries the dashboard's booking columns plus the counterparty summaries and
+-- the linked call / chat session as small JSON objects, so the API reads one relation
+-- instead of having PostgREST resolve four embeds per request. A plain view (not
+-- materialized) so listings are never stale.
+-- One row per (participant, booking), driven by booking_participants (20260228): the API
+-- filters on participant_id / participant_role, so both roles use the same
+-- (user_id, booking_id) primary key; status and scheduled_date filters push down as usual.
+CREATE OR REPLACE VIEW dashboard_bookings_v
+WITH (security_invoker = true) AS
+SELECT
+  b.id,
+  b.care_recipient_id,
+  b.caregiver_id,
+  b.video_call_request_id,
+  b.chat_session_id,
+  b.service_type,
+  b.scheduled_date,
+  b.end_date,
+  b.duration_hours,
+  b.location,
+  b.specific_needs,
+  b.recurring_pattern,
+  b.is_recurring,
+  b.status,
+  b.urgency_level,
+  b.amount,
+  b.currency,
+  b.payment_status,
+  b.accepted_at,
+  b.completed_at,
+  b.created_at,
+  b.updated_at,
+  CASE WHEN cg.id IS NULL THEN NULL ELSE json_build_object(
+    'id', cg.id, 'full_name', cg.full_name, 'phone', cg.phone, 'profile_photo_url', cg.profile_photo_url
+  ) END AS caregiver,
+  CASE WHEN cr.id IS NULL THEN NULL ELSE json_build_object(
+    'id', cr.id, 'full_name', cr.full_name, 'phone', cr.phone, 'profile_photo_url', cr.profile_photo_url
+  ) END AS care_recipient,
+  CASE WHEN vc.id IS NULL THEN NULL ELSE json_build_object(
+    'id', vc.id, 'status', vc.status, 'scheduled_time', vc.scheduled_time, 'duration_seconds', vc.duration_seconds
+  ) END AS video_call_request,
+  CASE WHEN cs.id IS NULL THEN NULL ELSE json_build_object(
+    'id', cs.id, 'is_enabled', cs.is_enabled
+  ) END AS chat_session,
+  bp.user_id AS participant_id,
+  bp.role AS participant_role
+FROM booking_participants bp
+JOIN bookings b ON b.id = bp.booking_id
+LEFT JOIN users cg ON cg.id = b.caregiver_id
+LEFT JOIN users cr ON cr.id = b.care_recipient_id
+LEFT JOIN video_call_requests vc ON vc.id = b.video_call_request_id
+LEFT JOIN chat_sessions cs ON cs.id = b.chat_session_id;
+
+-- Server-side reads only: the view exposes both parties' names and phone numbers.
+REVOKE ALL ON dashboard_bookings_v FROM anon, authenticated;
+GRANT SELECT ON dashboard_bookings_v TO service_role;
@@ -1,5 +1,7 @@
 import os
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import uuid
 import time
 import sys
@@ -17,6 +19,12 @@ FULL_NAME = f"Test User {timestamp}"
 import random
 PHONE = f"9{random.randint(100000000, 999999999)}"
 
+# Keep-alive session: all requests reuse one pooled connection to the backend;
+# connection failures are retried briefly (requests that reached the server are not)
+session = requests.Session()
+session.mount("http://", HTTPAdapter(max_retries=Retry(total=2, backoff_factor=0.1)))
+session.mount("https://", HTTPAdapter(max_retries=Retry(total=2, backoff_factor=0.1)))
+
 def log(message, type="INFO"):
     print(f"[{type}] {message}")
 
@@ -45,7 +53,7 @@ def run_integration_tests():
         "role": "care_recipient"
     }
     try:
-        res = requests.post(f"{BASE_URL}/api/auth/register", json=reg_payload)
+        res = session.post(f"{BASE_URL}/api/auth/register", json=reg_payload)
         if not check_response(res, 201, "Registration"):
             if res.status_code == 400 and "already registered" in res.text:
                  log("User already exists, proceeding to login...", "WARN")
@@ -62,7 +70,7 @@ def run_integration_tests():
         "password": PASSWORD
     }
     try:
-        res = requests.post(f"{BASE_URL}/api/auth/login", json=login_payload)
+        res = session.post(f"{BASE_URL}/api/auth/login", json=login_payload)
         if not check_response(res, 200, "Login"):
             sys.exit(1)
         
@@ -83,7 +91,7 @@ def run_integration_tests():
     log(f"3. Testing Protected Endpoint (Get Profile)...", "TEST")
     headers = {"Authorization": f"Bearer {access_token}"}
     try:
-        res = requests.get(f"{BASE_URL}/api/users/profile", headers=headers)
+        res = session.get(f"{BASE_URL}/api/users/profile", headers=headers)
         if not check_response(res, 200, "Get Profile"):
             sys.exit(1)
         
@@ -100,7 +108,7 @@ def run_integration_tests():
     log(f"4. Testing Token Refresh...", "TEST")
     refresh_payload = {"refresh_token": refresh_token}
     try:
-        res = requests.post(f"{BASE_URL}/api/auth/refresh", json=refresh_payload)
+        res = session.post(f"{BASE_URL}/api/auth/refresh", json=refresh_payload)
         # Note: Depending on implementation, refresh might return just access_token or both
         if not check_response(res, 200, "Token Refresh"):
              sys.exit(1)
@@ -116,7 +124,7 @@ def run_integration_tests():
         # Verify new token works
         log("Verifying new access token...", "TEST")
         new_headers = {"Authorization": f"Bearer {new_access_token}"}
-        res = requests.get(f"{BASE_URL}/api/users/profile", headers=new_headers)
+        res = session.get(f"{BASE_URL}/api/users/profile", headers=new_headers)
         check_response(res, 200, "Get Profile with New Token")
 
     except Exception as e:
@@ -31,6 +31,21 @@ def generate_test_token(user_id, email):
     )
     return access_token
 
+def find_auth_user_id(email):
+    """Look up an Auth user by email via GoTrue's admin filter, instead of paging through list_users()."""
+    key = settings.SUPABASE_SERVICE_ROLE_KEY
+    res = requests.get(
+        f"{settings.SUPABASE_URL.rstrip('/')}/auth/v1/admin/users",
+        params={"filter": email},
+        headers={"apikey": key, "Authorization": f"Bearer {key}"},
+        timeout=10,
+    )
+    res.raise_for_status()
+    for user in res.json().get("users", []):
+        if user.get("email") == email:
+            return user["id"]
+    return None
+
 def get_or_create_test_user(role, name):
     email = f"test_{role}_bypass@example.com"
     password = "password123"
@@ -38,17 +53,18 @@ def get_or_create_test_user(role, name):
     
     user_id = None
     
-    # 1. Check if user exists in Auth
+    # 1. Check if user exists (users.email is UNIQUE, so this is one indexed lookup)
     try:
-        # List users (inefficient but works for test)
-        users = supabase_admin.auth.admin.list_users()
-        for user in users:
-            if user.email == email:
-                user_id = user.id
-                print(f"[INFO] User already exists in Auth: {user_id}")
-                break
+        existing = supabase_admin.table("users").select("id").eq("email", email).limit(1).execute()
+        if existing.data:
+            user_id = existing.data[0]["id"]
+        else:
+            # Auth user may exist without a profile row yet
+            user_id = find_auth_user_id(email)
+        if user_id:
+            print(f"[INFO] User already exists: {user_id}")
     except Exception as e:
-        print(f"[ERROR] Failed to list users: {e}")
+        print(f"[ERROR] Failed to look up user: {e}")
 
     # 2. Create if not exists
     if not user_id:
@@ -65,41 +81,24 @@ def get_or_create_test_user(role, name):
             print(f"[ERROR] Failed to create user in Auth: {e}")
             return None, None
 
-    # 3. Ensure profile exists in 'users' table
+    # 3. Ensure profile rows exist: INSERT ... ON CONFLICT DO NOTHING, one round trip per table
     try:
-        # Check profile
-        profile = supabase_admin.table("users").select("id").eq("id", user_id).execute()
-        if not profile.data:
-            print(f"[INFO] Creating profile for {user_id}")
-            supabase_admin.table("users").insert({
-                "id": user_id,
-                "email": email,
-                "full_name": name,
-                "role": role,
-                "created_at": datetime.now(timezone.utc).isoformat()
-            }).execute()
-            
-            # If caregiver, create caregiver profile
-            if role == "caregiver":
-                # Check caregiver profile
-                cp = supabase_admin.table("caregiver_profile").select("id").eq("user_id", user_id).execute()
-                if not cp.data:
-                    supabase_admin.table("caregiver_profile").insert({
-                        "user_id": user_id,
-                        "availability_status": "available",
-                        "created_at": datetime.now(timezone.utc).isoformat()
-                    }).execute()
-        else:
-            print(f"[INFO] Profile already exists for {user_id}")
-            # Ensure caregiver profile exists if role is caregiver
-            if role == "caregiver":
-                cp = supabase_admin.table("caregiver_profile").select("id").eq("user_id", user_id).execute()
-                if not cp.data:
-                    supabase_admin.table("caregiver_profile").insert({
-                        "user_id": user_id,
-                        "availability_status": "available",
-                        "created_at": datetime.now(timezone.utc).isoformat()
-                    }).execute()
+        now = datetime.now(timezone.utc).isoformat()
+        supabase_admin.table("users").upsert({
+            "id": user_id,
+            "email": email,
+            "full_name": name,
+            "role": role,
+            "created_at": now
+        }, on_conflict="id", ignore_duplicates=True).execute()
+
+        # If caregiver, ensure caregiver profile (caregiver_profile.user_id is UNIQUE)
+        if role == "caregiver":
+            supabase_admin.table("caregiver_profile").upsert({
+                "user_id": user_id,
+                "availability_status": "available",
+                "created_at": now
+            }, on_conflict="user_id", ignore_duplicates=True).execute()
 
     except Exception as e:
         print(f"[ERROR] Failed to ensure profile: {e}")
@@ -4,9 +4,10 @@ Test script for password change endpoint
 Usage: API_BASE_URL=http://<LAN_IP>:8000 ./test_password_change.py <email> <current_password> <new_password>
 """
 
+import asyncio
 import os
 import sys
-import requests
+import httpx
 import json
 
 BASE_URL = (os.getenv("API_BASE_URL") or os.getenv("BACKEND_URL") or "").rstrip("/")
@@ -14,71 +15,83 @@ if not BASE_URL:
     print("ERROR: Set API_BASE_URL (or BACKEND_URL) to your backend URL (e.g. http://192.168.1.5:8000). Do not use localhost for multi-device testing.")
     sys.exit(1)
 
-def run_password_change_test(email, current_password, new_password):
-    # First, login to get a token
-    print(f"1. Logging in as {email}...")
-    login_response = requests.post(
-        f"{BASE_URL}/api/auth/login",
-        json={"email": email, "password": current_password}
-    )
-    
-    if login_response.status_code != 200:
-        print(f"❌ Login failed: {login_response.status_code}")
-        print(login_response.text)
-        return False
-    
-    login_data = login_response.json()
-    token = login_data.get("access_token")
-    print(f"✅ Login successful, got token")
-    
-    # Now try to change password
-    print(f"\n2. Attempting to change password...")
-    change_response = requests.post(
-        f"{BASE_URL}/api/auth/change-password",
-        headers={"Authorization": f"Bearer {token}"},
-        json={
-            "current_password": current_password,
-            "new_password": new_password
-        }
-    )
-    
-    print(f"Status Code: {change_response.status_code}")
-    print(f"Response: {json.dumps(change_response.json(), indent=2)}")
-    
-    if change_response.status_code == 200:
-        print(f"\n✅ Password changed successfully!")
+async def run_password_change_test(email, current_password, new_password):
+    # One keep-alive client for every call; connection failures are retried briefly
+    # (requests that reached the server are not)
+    async with httpx.AsyncClient(base_url=BASE_URL, timeout=10, transport=httpx.AsyncHTTPTransport(retries=2)) as client:
+        # First, login to get a token
+        print(f"1. Logging in as {email}...")
+        login_response = await client.post(
+            "/api/auth/login",
+            json={"email": email, "password": current_password}
+        )
         
-        # Try logging in with new password
-        print(f"\n3. Testing login with new password...")
-        test_login = requests.post(
-            f"{BASE_URL}/api/auth/login",
-            json={"email": email, "password": new_password}
+        if login_response.status_code != 200:
+            print(f"❌ Login failed: {login_response.status_code}")
+            print(login_response.text)
+            return False
+        
+        login_data = login_response.json()
+        token = login_data.get("access_token")
+        print(f"✅ Login successful, got token")
+        
+        # Now try to change password
+        print(f"\n2. Attempting to change password...")
+        change_response = await client.post(
+            "/api/auth/change-password",
+            headers={"Authorization": f"Bearer {token}"},
+            json={
+                "current_password": current_password,
+                "new_password": new_password
+            }
         )
         
-        if test_login.status_code == 200:
-            print(f"✅ Login with new password successful!")
+        print(f"Status Code: {change_response.status_code}")
+        print(f"Response: {json.dumps(change_response.json(), indent=2)}")
+        
+        if change_response.status_code == 200:
+            print(f"\n✅ Password changed successfully!")
             
-            # Change it back
-            print(f"\n4. Changing password back to original...")
-            token2 = test_login.json().get("access_token")
-            revert_response = requests.post(
-                f"{BASE_URL}/api/auth/change-password",
-                headers={"Authorization": f"Bearer {token2}"},
-                json={
-                    "current_password": new_password,
-                    "new_password": current_password
-                }
+            # Try logging in with new password
+            print(f"\n3. Testing login with new password...")
+            test_login = await client.post(
+                "/api/auth/login",
+                json={"email": email, "password": new_password}
             )
-            if revert_response.status_code == 200:
-                print(f"✅ Password reverted successfully!")
+            
+            if test_login.status_code == 200:
+                print(f"✅ Login with new password successful!")
+                
+                # Change it back; checking the new session against /me doesn't depend on the
+                # revert, so both go out together
+                print(f"\n4. Changing password back to original (and checking the new session)...")
+                token2 = test_login.json().get("access_token")
+                auth_headers = {"Authorization": f"Bearer {token2}"}
+                revert_response, me_response = await asyncio.gather(
+                    client.post(
+                        "/api/auth/change-password",
+                        headers=auth_headers,
+                        json={
+                            "current_password": new_password,
+                            "new_password": current_password
+                        }
+                    ),
+                    client.get("/api/auth/me", headers=auth_headers),
+                )
+                if me_response.status_code == 200:
+                    print(f"✅ New session token accepted by /api/auth/me")
+                else:
+                    print(f"⚠️  /api/auth/me rejected the new token: {me_response.status_code}")
+                if revert_response.status_code == 200:
+                    print(f"✅ Password reverted successfully!")
+                else:
+                    print(f"⚠️  Failed to revert password: {revert_response.text}")
             else:
-                print(f"⚠️  Failed to revert password: {revert_response.text}")
+                print(f"❌ Login with new password failed: {test_login.text}")
         else:
-            print(f"❌ Login with new password failed: {test_login.text}")
-    else:
-        print(f"\n❌ Password change failed!")
-    
-    return change_response.status_code == 200
+            print(f"\n❌ Password change failed!")
+        
+        return change_response.status_code == 200
 
 if __name__ == "__main__":
     if len(sys.argv) != 4:
@@ -90,5 +103,5 @@ if __name__ == "__main__":
     current_password = sys.argv[2]
     new_password = sys.argv[3]
     
-    success = run_password_change_test(email, current_password, new_password)
+    success = asyncio.run(run_password_change_test(email, current_password, new_password))
     sys.exit(0 if success else 1)
@@ -0,0 +1,12 @@
+"""
+Unit test setup: placeholder config so `app.config` (imported by app and src modules)
+builds Settings without a .env or real Supabase project. Real values in the
+environment win; nothing here talks to Supabase.
+"""
+import os
+
+os.environ.setdefault("SUPABASE_URL", "https://example.supabase.co")
+os.environ.setdefault("SUPABASE_ANON_KEY", "test-anon-key")
+os.environ.setdefault("SUPABASE_SERVICE_ROLE_KEY", "test-service-role-key")
+# test_tokens signs with this; set here so it doesn't depend on a SECRET_KEY in backend/.env
+os.environ.setdefault("SECRET_KEY", "test-secret-key-0123456789abcdef")
@@ -0,0 +1,52 @@
+"""
+Unit tests: per-connection prepared statements (src/config/db.py).
+Purpose: A statement is PREPAREd once per connection, and a connection the pool replaced never inherits another one's statements.
+Run: pytest backend/tests/unit/test_db_prepared.py -v
+"""
+import gc
+
+import pytest
+
+from src.config import db
+
+
+class _Cursor:
+    def __init__(self):
+        self.sql = []
+
+    def execute(self, query, params=None):
+        self.sql.append(query)
+
+
+class _Conn:
+    """Stand-in for a psycopg2 connection (weak-referenceable, compared by identity)."""
+
+
+@pytest.fixture(autouse=True)
+def prepare_enabled(monkeypatch):
+    monkeypatch.setattr(db, "_prepare_supported", True)
+    yield
+    db._prepared.clear()
+
+
+class TestPreparedCall:
+    def test_prepares_once_per_connection(self):
+        conn, cur = _Conn(), _Cursor()
+        assert db._prepared_call(conn, cur, "SELECT * FROM users WHERE id = %s", ("u1",))
+        assert db._prepared_call(conn, cur, "SELECT * FROM users WHERE id = %s", ("u2",))
+        assert [q.split()[0] for q in cur.sql] == ["PREPARE", "EXECUTE", "EXECUTE"]
+
+    def test_dropped_connection_forgets_statements(self):
+        conn = _Conn()
+        db._prepared_call(conn, _Cursor(), "SELECT 1", None)
+        del conn
+        gc.collect()
+        assert len(db._prepared) == 0
+        cur = _Cursor()
+        db._prepared_call(_Conn(), cur, "SELECT 1", None)
+        assert cur.sql[0].startswith("PREPARE")
+
+    def test_named_params_fall_back(self):
+        cur = _Cursor()
+        assert not db._prepared_call(_Conn(), cur, "SELECT %(id)s", {"id": 1})
+        assert cur.sql == []
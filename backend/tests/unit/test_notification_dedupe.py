@@ -0,0 +1,27 @@
+"""
+Unit tests: notification dedupe gate (app/cache/notification_dedupe.py).
+Purpose: A repeated event must not notify twice, but a failed insert must not block its retry.
+Run: pytest backend/tests/unit/test_notification_dedupe.py -v
+"""
+from app.cache.notification_dedupe import claim_notification, notification_key, release_notification
+
+
+class TestNotificationDedupe:
+    def test_key_ignores_data_order(self):
+        a = notification_key("u1", "booking", "T", "B", {"booking_id": "b1", "status": "accepted"})
+        b = notification_key("u1", "booking", "T", "B", {"status": "accepted", "booking_id": "b1"})
+        assert a == b
+
+    def test_key_differs_per_user(self):
+        assert notification_key("u1", "booking", "T", "B", None) != notification_key("u2", "booking", "T", "B", None)
+
+    def test_second_claim_rejected(self):
+        key = notification_key("u-dup", "booking", "T", "B", {"booking_id": "b2"})
+        assert claim_notification(key) is True
+        assert claim_notification(key) is False
+
+    def test_release_allows_retry(self):
+        key = notification_key("u-retry", "booking", "T", "B", {"booking_id": "b3"})
+        assert claim_notification(key) is True
+        release_notification(key)
+        assert claim_notification(key) is True
@@ -0,0 +1,25 @@
+"""
+Unit tests: ISO timestamp parsing (app/timeutils.py).
+Purpose: Booking overlap checks compare these values; they must always be tz-aware.
+Run: pytest backend/tests/unit/test_timeutils.py -v
+"""
+import pytest
+from datetime import datetime, timedelta, timezone
+from app.timeutils import parse_iso_utc
+
+
+class TestParseIsoUtc:
+    def test_z_suffix(self):
+        assert parse_iso_utc("2026-03-01T10:30:00Z") == datetime(2026, 3, 1, 10, 30, tzinfo=timezone.utc)
+
+    def test_offset_kept(self):
+        dt = parse_iso_utc("2026-03-01T10:30:00.5+05:30")
+        assert dt.utcoffset() == timedelta(hours=5, minutes=30)
+        assert dt.microsecond == 500000
+
+    def test_naive_is_utc(self):
+        assert parse_iso_utc("2026-03-01T10:30:00").tzinfo == timezone.utc
+
+    def test_invalid_raises(self):
+        with pytest.raises(ValueError):
+            parse_iso_utc("not a date")
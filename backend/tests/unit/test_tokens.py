@@ -0,0 +1,40 @@
+"""
+Unit tests: custom session tokens (app/services/tokens.py).
+Purpose: Hand-signed HS256 tokens must verify under both PyJWT and python-jose (used by dependencies.py).
+Run: pytest backend/tests/unit/test_tokens.py -v
+"""
+import pytest
+from jose import jwt as jose_jwt
+
+from app.config import settings
+from app.services.tokens import (
+    InvalidTokenError,
+    decode_custom_token,
+    encode_hs256,
+    issue_custom_tokens,
+    unverified_claims,
+)
+
+
+class TestCustomTokens:
+    def test_pair_round_trips(self):
+        access, refresh = issue_custom_tokens("u1", "a@b.c")
+        assert decode_custom_token(access)["sub"] == "u1"
+        payload = decode_custom_token(refresh)
+        assert payload["type"] == "refresh"
+        assert payload["exp"] > decode_custom_token(access)["exp"]
+
+    def test_jose_accepts_tokens(self):
+        access, _ = issue_custom_tokens("u1", "a@b.c")
+        assert jose_jwt.decode(access, settings.SECRET_KEY, algorithms=["HS256"])["email"] == "a@b.c"
+
+    def test_wrong_key_rejected(self):
+        token = encode_hs256({"sub": "u1", "exp": 4_102_444_800}, "other-secret")
+        with pytest.raises(InvalidTokenError):
+            decode_custom_token(token)
+        assert unverified_claims(token)["sub"] == "u1"
+
+    def test_expired_rejected(self):
+        token = encode_hs256({"sub": "u1", "exp": 1}, settings.SECRET_KEY)
+        with pytest.raises(InvalidTokenError):
+            decode_custom_token(token)
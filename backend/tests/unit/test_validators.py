@@ -186,3 +186,7 @@ class TestValidateOtp:
     def test_wrong_length_raises(self):
         with pytest.raises(ValueError, match="exactly 6"):
             validate_otp("12345")
+
+    def test_non_ascii_digits_raise(self):
+        with pytest.raises(ValueError, match="only digits"):
+            validate_otp("12345\u0663")